@@ -1,11 +1,11 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
 from App.scroll import scroll_to_top
 from Utility.Functions.choices import get_successors
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.gui_utility import (
     make_title_frame,
     make_back_button,
@@ -44,7 +44,7 @@ def decay_calc_advanced(root, category, mode, common_el, element, isotope,
 
     # Gets units and dates selector from user prefs
     db_path = get_user_data_path("Settings/Decay/Calculator")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         amount_type = prefs.get("amount_type", "Activity (Bq)")
         amount_unit = prefs.get("amount_unit", "Bq")
         time_unit = prefs.get("time_unit", "s")
@@ -72,7 +72,7 @@ def decay_calc_advanced(root, category, mode, common_el, element, isotope,
     def on_use_dates():
         nonlocal dates
         dates = var_dates.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["dates"] = dates
         if dates:
             time_unit_dropdown.config(state='disabled')
@@ -99,7 +99,7 @@ def decay_calc_advanced(root, category, mode, common_el, element, isotope,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["time_unit"] = selection
 
     # Stores time unit and sets default
@@ -125,19 +125,19 @@ def decay_calc_advanced(root, category, mode, common_el, element, isotope,
         event.widget.selection_clear()
         selection = event.widget.get()
 
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             og_amount_type = shelve_prefs.get("amount_type", "Activity (Bq)")
 
         # Adjusts unit choices
         unit_choices = amount_choices[selection]
         if og_amount_type != selection:
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["amount_unit"] = default_choices[selection]
                 amount_unit_dropdown.set(default_choices[selection])
                 amount_unit_dropdown.config(values=unit_choices,
                                             width=get_width(unit_choices))
 
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["amount_type"] = selection
         root.focus()
 
@@ -161,7 +161,7 @@ def decay_calc_advanced(root, category, mode, common_el, element, isotope,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["amount_unit"] = selection
 
     # Possible amount unit choices
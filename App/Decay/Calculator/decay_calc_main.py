@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import platform
 import tkinter as tk
 from tkinter import ttk
@@ -8,6 +7,7 @@ from App.style import SectionFrame
 from App.scroll import scroll_to_top
 from Utility.Functions.time import get_time
 from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.logic_utility import get_item, valid_saved
 from Core.Decay.Calculator.nuclide_calc import handle_calculation
 from Utility.Functions.choices import get_choices, get_isotopes, get_nuclide_vars
@@ -46,7 +46,7 @@ def decay_calc_main(root, category="Common Elements", mode="Activities",
 
     # Gets units and dates selector from user prefs
     db_path = get_user_data_path("Settings/Decay/Calculator")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         amount_unit = prefs.get("amount_unit", "Bq")
         time_unit = prefs.get("time_unit", "s")
         dates = prefs.get("dates", False)
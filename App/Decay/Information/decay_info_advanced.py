@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import platform
 import tkinter as tk
 from tkinter import ttk
@@ -11,6 +10,7 @@ from Utility.Functions.logic_utility import get_interactions
 from Core.Decay.Information.nuclide_info import half_life_units
 from App.Decay.Information.decay_info_export import decay_info_export
 from Utility.Functions.files import get_user_data_path, resource_path, open_file
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.gui_utility import (
     make_title_frame,
     make_back_button,
@@ -73,7 +73,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
     # Gets half-life unit, energy unit, radiation types, column, order, filter type,
     # filter direction, and filter percentage from user prefs
     db_path = get_user_data_path("Settings/Decay/Information")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         half_life_unit = prefs.get("hl_unit", "s")
         energy_unit = prefs.get("energy_unit", "MeV")
         selected_rad_types = prefs.get("rad_types", [rad_type for rad_type in rad_types
@@ -114,7 +114,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
         # Logic for when a radiation type is selected
         def on_select():
             root.focus()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["rad_types"] = set(get_interactions(rad_types, rad_type_vars))
 
         # List of radiation types
@@ -203,7 +203,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
             root.focus()
             var_column.set("Radiation Type")
             var_order.set("Ascending")
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["column"] = "Radiation Type"
                 shelve_prefs["order"] = "Ascending"
 
@@ -230,7 +230,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
         def select_column(event):
             root.focus()
             event.widget.selection_clear()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["column"] = var_column.get()
 
         # Creates dropdown menu for columns
@@ -255,7 +255,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
         def select_order(event):
             root.focus()
             event.widget.selection_clear()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["order"] = var_order.get()
 
         # Creates dropdown menu for orders
@@ -278,7 +278,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
         def select_filter_type(event):
             root.focus()
             event.widget.selection_clear()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["filter_type"] = var_filter.get()
 
         # Frame for filter type selection
@@ -300,7 +300,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
         def select_filter_direction(event):
             root.focus()
             event.widget.selection_clear()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["filter_dir"] = var_filter_dir.get()
 
         # Frame for filter direction selection
@@ -335,7 +335,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
 
         # Logic to save filter percentage
         def on_change(*_):
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs["filter_percentage"] = var_filter_percentage.get()
         var_filter_percentage.trace_add("write", on_change)
 
@@ -391,7 +391,7 @@ def decay_info_advanced(root, category, mode, common_el, element, isotope):
             event.widget.selection_clear()
             root.focus()
             selection = event.widget.get()
-            with shelve.open(db_path) as shelve_prefs:
+            with open_prefs(db_path) as shelve_prefs:
                 shelve_prefs[shelf_name] = selection
 
         # Stores unit and sets default
@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
@@ -9,6 +8,7 @@ from Utility.Functions.choices import get_choices
 from App.Deposition.Alphas.alphas_export import alphas_export
 from Utility.Functions.logic_utility import get_unit, get_interactions
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Core.Deposition.Alphas.alphas_calculations import (
     sp_e_numerator,
     sp_l_numerator,
@@ -55,7 +55,7 @@ def alphas_advanced(root, category, mode, interactions, common_el,
 
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Deposition/Alphas")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         sp_e_num = prefs.get("sp_e_num", "MeV")
         sp_l_num = prefs.get("sp_l_num", "cm\u00B2")
         d_num = prefs.get("d_num", "g")
@@ -236,7 +236,7 @@ def alphas_advanced(root, category, mode, interactions, common_el,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Stopping Power":
                 shelve_prefs["sp_e_num"] = selection
             elif mode == "Density":
@@ -247,7 +247,7 @@ def alphas_advanced(root, category, mode, interactions, common_el,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Stopping Power":
                 shelve_prefs["sp_l_num"] = selection
             elif mode == "Density":
@@ -258,7 +258,7 @@ def alphas_advanced(root, category, mode, interactions, common_el,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Stopping Power":
                 shelve_prefs["sp_den"] = selection
             elif mode == "Density":
@@ -411,7 +411,7 @@ def to_custom_menu(root, category, mode, interactions, common_el, common_mat,
 
     # Gets density units from user prefs
     db_path = get_user_data_path("Settings/Deposition/Alphas")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         d_num = prefs.get("d_num", "g")
         d_den = prefs.get("d_den", "cm\u00B3")
 
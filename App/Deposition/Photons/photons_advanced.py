@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
@@ -9,6 +8,7 @@ from Utility.Functions.choices import get_choices
 from Utility.Functions.logic_utility import get_unit
 from App.Deposition.Photons.photons_export import photons_export
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Core.Deposition.Photons.photons_calculations import mea_numerator, mea_denominator
 from Utility.Functions.math_utility import (
     energy_units,
@@ -51,7 +51,7 @@ def photons_advanced(root, category, mode, common_el, common_mat, element,
 
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Deposition/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         mea_num = prefs.get("mac_num", "cm\u00B2")
         d_num = prefs.get("d_num", "g")
         mea_den = prefs.get("mac_den", "g")
@@ -156,7 +156,7 @@ def photons_advanced(root, category, mode, common_el, common_mat, element,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Energy-Absorption":
                 shelve_prefs["mea_num"] = selection
             else:
@@ -167,7 +167,7 @@ def photons_advanced(root, category, mode, common_el, common_mat, element,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Energy-Absorption":
                 shelve_prefs["mea_den"] = selection
             else:
@@ -302,7 +302,7 @@ def to_custom_menu(root, category, mode, common_el, common_mat, element,
 
     # Gets density units from user prefs
     db_path = get_user_data_path("Settings/Deposition/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         d_num = prefs.get("d_num", "g")
         d_den = prefs.get("d_den", "cm\u00B3")
 
@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import platform
 import tkinter as tk
 from tkinter import ttk
@@ -8,6 +7,7 @@ from App.style import SectionFrame
 from App.scroll import scroll_to_top
 from Utility.Functions.choices import get_choices
 from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.logic_utility import get_item, valid_saved
 from Core.Deposition.Photons.photons_calculations import handle_calculation
 from Utility.Functions.gui_utility import (
@@ -49,7 +49,7 @@ def photons_main(root, category="Common Elements",
 
     # Gets energy unit from user prefs
     db_path = get_user_data_path("Settings/Deposition/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         energy_unit = prefs.get("energy_unit", "MeV")
 
     # Makes title frame
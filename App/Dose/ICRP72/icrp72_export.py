@@ -0,0 +1,83 @@
+##### IMPORTS #####
+from tkinter import ttk
+from App.style import SectionFrame
+from App.scroll import scroll_to_top
+from Core.Dose.ICRP72.icrp72_data import export_data
+from Utility.Functions.gui_utility import (
+    make_title_frame,
+    make_back_button, make_export_button
+)
+
+# For global access to nodes on ICRP72 export screen
+export_list = []
+
+#####################################################################################
+# MENU SECTION
+#####################################################################################
+
+"""
+This function sets up the ICRP72 export screen.
+The following sections and widgets are created:
+   Module Title (ICRP72 Coefficients)
+   Export Options section
+   Back button
+This function contains all of the logic involving these widgets'
+behaviors.
+The sections and widgets are stored in export_list so they can be
+accessed later by clear_export.
+"""
+def icrp72_export(root, category, mode, coefficient, common_el, element, isotope):
+    global export_list
+
+    # Makes title frame
+    title_frame = make_title_frame(root, "ICRP72 Coefficients", "Dose/ICRP72")
+
+    # Frame for options
+    options_frame = SectionFrame(root, title="Export Options")
+    options_frame.pack()
+    inner_options_frame = options_frame.get_inner_frame()
+
+    # Creates Export button
+    make_export_button(inner_options_frame, lambda: export_data(root, mode, isotope, error_label), pady=(20,5))
+
+    # Creates error label for bad input
+    error_label = ttk.Label(inner_options_frame, text="", style="Error.TLabel")
+    error_label.pack(pady=(5,10))
+
+    # Creates Back button to return to ICRP72 advanced screen
+    back_button = make_back_button(root, lambda: advanced_back(root, category, mode, coefficient,
+                                                               common_el, element, isotope))
+
+    # Stores nodes into global list
+    export_list = [title_frame,
+                   options_frame, back_button]
+
+#####################################################################################
+# NAVIGATION SECTION
+#####################################################################################
+
+"""
+This function clears the ICRP72 export screen
+in preparation for opening a different screen.
+"""
+def clear_export():
+    global export_list
+
+    # Clears ICRP72 export screen
+    for node in export_list:
+        node.destroy()
+    export_list.clear()
+
+"""
+This function transitions from the ICRP72 export screen
+to the ICRP72 advanced screen by first clearing the
+ICRP72 export screen and then creating the
+ICRP72 advanced screen.
+It is called when the Back button is hit.
+"""
+def advanced_back(root, category, mode, coefficient, common_el, element, isotope):
+    from App.Dose.ICRP72.icrp72_advanced import icrp72_advanced
+
+    clear_export()
+    icrp72_advanced(root, category, mode, coefficient, common_el, element, isotope)
+    scroll_to_top()
\ No newline at end of file
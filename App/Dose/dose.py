@@ -2,6 +2,7 @@
 from tkinter import ttk
 from App.scroll import scroll_to_top
 from App.Dose.ICRP68.icrp68_main import icrp68_main
+from App.Dose.ICRP72.icrp72_main import icrp72_main
 from Utility.Functions.gui_utility import get_width, make_title_frame
 
 # For global access to nodes on dose screen
@@ -26,6 +27,13 @@ def dose_menu(root):
     icrp68_button.config(width=get_width(["ICRP68"]))
     icrp68_button.pack(pady=5)
 
+    # Creates ICRP72 button
+    icrp72_button = ttk.Button(root, text="ICRP72",
+                               command=lambda: to_icrp72(root),
+                               style="Maize.TButton", padding=(0,0))
+    icrp72_button.config(width=get_width(["ICRP72"]))
+    icrp72_button.pack(pady=5)
+
     # Creates Exit button to return to home screen
     exit_button = ttk.Button(root, text="Exit", style="Maize.TButton",
                              padding=(0, 0),
@@ -35,7 +43,7 @@ def dose_menu(root):
 
     # Stores nodes into global list
     dose_list = [title, icrp68_button,
-                 exit_button]
+                 icrp72_button, exit_button]
 
 #####################################################################################
 # NAVIGATION SECTION
@@ -76,4 +84,17 @@ def to_icrp68(root):
     root.focus()
     clear_dose()
     icrp68_main(root)
+    scroll_to_top()
+
+"""
+This function transitions from the dose screen
+to the ICRP72 main screen by first
+clearing the dose screen and then creating the
+ICRP72 main screen.
+It is called when the ICRP72 button is hit.
+"""
+def to_icrp72(root):
+    root.focus()
+    clear_dose()
+    icrp72_main(root)
     scroll_to_top()
\ No newline at end of file
@@ -1,10 +1,10 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
 from App.scroll import scroll_to_top
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.math_utility import atomic_mass_numerator, atomic_mass_denominator
 from Utility.Functions.gui_utility import (
     make_spacer,
@@ -41,7 +41,7 @@ def elements_advanced(root, category, common_el, element):
 
     # Gets atomic mass units from user prefs
     db_path = get_user_data_path("Settings/General/Elements")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         am_num = prefs.get("am_num", "g")
         am_den = prefs.get("am_den", "mol")
 
@@ -72,7 +72,7 @@ def elements_advanced(root, category, common_el, element):
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["am_num"] = selection
 
     # Logic for when a denominator is selected
@@ -80,7 +80,7 @@ def elements_advanced(root, category, common_el, element):
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             shelve_prefs["am_den"] = selection
 
     # Stores numerator and sets default
@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
@@ -9,6 +8,7 @@ from Utility.Functions.choices import get_choices
 from Utility.Functions.logic_utility import get_unit
 from App.Shielding.Alphas.alphas_export import alphas_export
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Core.Shielding.Alphas.alphas_calculations import csda_numerator, csda_denominator
 from Utility.Functions.math_utility import (
     energy_units,
@@ -50,7 +50,7 @@ def alphas_advanced(root, category, mode, common_el, common_mat, element,
 
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Shielding/Alphas")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         csda_num = prefs.get("csda_num", "g")
         d_num = prefs.get("d_num", "g")
         csda_den = prefs.get("csda_den", "cm\u00B2")
@@ -155,7 +155,7 @@ def alphas_advanced(root, category, mode, common_el, common_mat, element,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "CSDA Range":
                 shelve_prefs["csda_num"] = selection
             elif mode == "Density":
@@ -166,7 +166,7 @@ def alphas_advanced(root, category, mode, common_el, common_mat, element,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "CSDA Range":
                 shelve_prefs["csda_den"] = selection
             elif mode == "Density":
@@ -301,7 +301,7 @@ def to_custom_menu(root, category, mode, common_el, common_mat, element,
 
     # Gets density units from user prefs
     db_path = get_user_data_path("Settings/Shielding/Alphas")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         d_num = prefs.get("d_num", "g")
         d_den = prefs.get("d_den", "cm\u00B3")
 
@@ -1,5 +1,4 @@
 ##### IMPORTS #####
-import shelve
 import tkinter as tk
 from tkinter import ttk
 from App.style import SectionFrame
@@ -9,6 +8,7 @@ from Utility.Functions.choices import get_choices
 from App.Shielding.Photons.photons_export import photons_export
 from Utility.Functions.logic_utility import get_unit, get_interactions
 from Utility.Functions.files import resource_path, open_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Core.Shielding.Photons.photons_calculations import (
     mac_numerator, mac_denominator,
     lac_numerator, lac_denominator
@@ -55,7 +55,7 @@ def photons_advanced(root, category, mode, interactions, common_el, common_mat,
 
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Shielding/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         mac_num = prefs.get("mac_num", "cm\u00B2")
         d_num = prefs.get("d_num", "g")
         lac_num = prefs.get("lac_num", "1")
@@ -273,7 +273,7 @@ def photons_advanced(root, category, mode, interactions, common_el, common_mat,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Attenuation Coefficient":
                 shelve_prefs["mac_num"] = selection
             elif mode == "Density":
@@ -286,7 +286,7 @@ def photons_advanced(root, category, mode, interactions, common_el, common_mat,
         event.widget.selection_clear()
         root.focus()
         selection = event.widget.get()
-        with shelve.open(db_path) as shelve_prefs:
+        with open_prefs(db_path) as shelve_prefs:
             if mode == "Mass Attenuation Coefficient":
                 shelve_prefs["mac_den"] = selection
             elif mode == "Density":
@@ -428,7 +428,7 @@ def to_custom_menu(root, category, mode, interactions, common_el, common_mat,
 
     # Gets density units from user prefs
     db_path = get_user_data_path("Settings/Shielding/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         d_num = prefs.get("d_num", "g")
         d_den = prefs.get("d_den", "cm\u00B3")
 
@@ -96,8 +96,8 @@ def photons_export(root, category, mode, interactions, common_el, common_mat,
         nonlocal var_save
         event.widget.selection_clear()
         root.focus()
-        if event.widget.get() == "Data":
-            # Forces user to save file if export type is Data
+        if event.widget.get() in ["Data", "Matrix"]:
+            # Forces user to save file if export type is Data or Matrix
             var_save.set(1)
             save.config(state="disabled")
         else:
@@ -108,7 +108,7 @@ def photons_export(root, category, mode, interactions, common_el, common_mat,
     var_export.set("Plot")
 
     # Creates dropdown menu for export type
-    _ = make_export_dropdown(export_type_frame, var_export, on_select_export)
+    _ = make_export_dropdown(export_type_frame, var_export, on_select_export, matrix=True)
 
     # Creates Export button
     make_export_button(inner_options_frame, lambda: export_data(root, get_item(category, common_el, common_mat,
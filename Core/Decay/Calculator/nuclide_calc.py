@@ -1,12 +1,12 @@
 ##### IMPORTS #####
-import math
-import shelve
 import tkinter as tk
 import radioactivedecay as rd
 import matplotlib.pyplot as plt
 from Utility.Functions.choices import get_chosen_nuclides
 from Utility.Functions.files import save_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.gui_utility import edit_result, no_selection
+from Utility.Functions.nuclide_store import get_nuclide
 
 #####################################################################################
 # CALCULATIONS SECTION
@@ -26,7 +26,7 @@ def handle_calculation(root, mode, isotope, initial_amount, time,
 
     # Gets dates selector from user prefs
     db_path = get_user_data_path("Settings/Decay/Calculator")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         dates = prefs.get("dates", False)
 
     # Error-check for invalid time inputs
@@ -53,7 +53,7 @@ given a particular isotope, initial amount, and time.
 def nuclide_activities(isotope, initial_amount, time, result_box, nuclide_vars):
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Decay/Calculator")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         amount_type = prefs.get("amount_type", "Activity (Bq)")
         amount_unit = prefs.get("amount_unit", "Bq")
         time_unit = prefs.get("time_unit", "s")
@@ -100,7 +100,7 @@ given a particular isotope, initial amount, and time.
 def nuclide_plot(isotope, initial_amount, time, result_box, nuclide_vars, save):
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Decay/Calculator")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         amount_unit = prefs.get("amount_unit", "Bq")
         time_unit = prefs.get("time_unit", "s")
         dates = prefs.get("dates", False)
@@ -180,7 +180,7 @@ def is_error(isotope, time, initial_amount, result_box):
         return True
 
     # Error check for stable isotope
-    if math.isinf(rd.Nuclide(isotope).half_life()):
+    if get_nuclide(isotope)["stable"]:
         result_box.insert(tk.END, "Isotope " + isotope + " is stable.")
         result_box.config(state="disabled", height=1)
         return True
@@ -0,0 +1,184 @@
+##### IMPORTS #####
+import math
+import numpy as np
+from Utility.Functions.time import date_error, days_elapsed, format_error
+from Utility.Functions.chain_store import get_chain, decay_numbers, amount_per_atom, unit_type
+
+#####################################################################################
+# REGISTER SECTION
+#####################################################################################
+
+# A source register lists sealed sources with their nuclide and their
+# activity on a calibration date (YYYY-MM-DD). Every source is decayed to
+# every reference date. The sources are grouped by nuclide so that each
+# decay chain is only factored once (see chain_store), and all the sources
+# and dates of a nuclide are decayed at once.
+
+# Columns of the source register (unit is optional and defaults to Bq)
+register_columns = ["source", "nuclide", "date", "activity", "unit"]
+
+# Columns of the results
+result_columns = ["source", "nuclide", "date", "activity", "unit", "reference_date",
+                  "decayed_activity", "total_activity", "output_unit", "error"]
+
+# Seconds per day
+seconds_per_day = 86400
+
+### ERROR MESSAGES ###
+unknown_nuclide = "Error: Unknown nuclide."
+non_number_activity = "Error: Non-number activity input."
+negative_activity = "Error: Activity cannot be negative."
+unknown_unit = "Error: Unknown activity unit."
+stable_nuclide = "Error: Nuclide is stable."
+before_calibration = "Error: Reference date is before the calibration date."
+
+"""
+This function decays every source of a register to every reference date.
+The activities of the results are in output_unit, or in the unit of each
+source if no output unit is provided. The decayed activity is that of the
+source's nuclide, and the total activity adds the progeny that grew in
+since the calibration date.
+It returns a generator of the rows of results, which are produced one
+nuclide at a time, with one row per source and reference date. Sources
+that cannot be decayed have an error on every row.
+A ValueError is raised if a reference date or the output unit is invalid.
+This is done before any row is produced, so that nothing is written
+for an invalid register.
+"""
+def decay_register(sources, reference_dates, output_unit=None):
+    # Error-check for invalid reference dates and output unit
+    for date in reference_dates:
+        error = read_date(date)
+        if error:
+            raise ValueError(error[:-1] + " (" + date + ").")
+    if output_unit and unit_type(output_unit) != "Activity":
+        raise ValueError(unknown_unit[:-1] + " (" + output_unit + ").")
+
+    return decay_groups(sources, reference_dates, output_unit)
+
+"""
+This function yields the rows of results of decay_register, one
+nuclide at a time.
+"""
+def decay_groups(sources, reference_dates, output_unit):
+    for nuclide, group in group_register(sources).items():
+        yield from decay_group(nuclide, group, reference_dates, output_unit)
+
+"""
+This function groups the sources of a register by nuclide, keeping the
+order of the register within each nuclide. The keys and values of each
+source are stripped, and the keys are lowercased.
+"""
+def group_register(sources):
+    groups = {}
+    for source in sources:
+        source = {key.strip().lower() : str(value).strip() for key, value in source.items()
+                  if key is not None and value is not None}
+        groups.setdefault(source.get("nuclide", ""), []).append(source)
+    return groups
+
+"""
+This function decays the sources of a single nuclide to every
+reference date (see decay_register).
+"""
+def decay_group(nuclide, group, reference_dates, output_unit):
+    rows = [[{column : source.get(column, "") for column in result_columns}
+             for _ in reference_dates] for source in group]
+    for source_rows in rows:
+        for row, date in zip(source_rows, reference_dates):
+            row["reference_date"] = date
+
+    # Error-check for an unknown nuclide
+    try:
+        chain = get_chain(nuclide)
+    except ValueError:
+        chain = None
+
+    # Error-checks every source and finds its initial number of atoms
+    valid = []
+    initial_numbers = []
+    for source, source_rows in zip(group, rows):
+        error, initial_number = read_source(chain, source)
+        for row in source_rows:
+            row["error"] = error
+        if not error:
+            valid.append(source_rows)
+            initial_numbers.append(initial_number)
+
+    if valid:
+        days = days_elapsed([source_rows[0]["date"] for source_rows in valid], reference_dates)
+
+        # Decays every source to every date at once
+        numbers = decay_numbers(nuclide, 1.0, np.maximum(days, 0).ravel() * seconds_per_day)
+        numbers = numbers.reshape(len(chain["nuclides"]), *days.shape) \
+            * np.array(initial_numbers)[None, :, None]
+
+        for i, source_rows in enumerate(valid):
+            unit = output_unit or source_rows[0]["unit"] or "Bq"
+            activities = numbers[:, i, :] * amount_per_atom(chain, unit)[:, None]
+            for j, row in enumerate(source_rows):
+                # Error-check for a reference date before the calibration date
+                if days[i, j] < 0:
+                    row["error"] = before_calibration
+                    continue
+                row["decayed_activity"] = repr(float(activities[0, j]))
+                row["total_activity"] = repr(float(np.sum(activities[:, j])))
+                row["output_unit"] = unit
+
+    for source_rows in rows:
+        yield from source_rows
+
+"""
+This function error-checks a source of a register.
+The function handles the following errors:
+   Unknown nuclide
+   Invalid calibration date
+   Non-number or non-finite activity input
+   Negative activity input
+   Unknown activity unit
+   Stable nuclide
+The error message ("" if there is no error) is returned along with
+the initial number of atoms of the source's nuclide.
+"""
+def read_source(chain, source):
+    if chain is None:
+        return unknown_nuclide, None
+
+    error = read_date(source.get("date", ""))
+    if error:
+        return error, None
+
+    try:
+        activity = float(source.get("activity", ""))
+    except ValueError:
+        return non_number_activity, None
+    if not math.isfinite(activity):
+        return non_number_activity, None
+    if activity < 0:
+        return negative_activity, None
+
+    unit = source.get("unit") or "Bq"
+    if unit_type(unit) != "Activity":
+        return unknown_unit, None
+
+    activity_per_atom = amount_per_atom(chain, unit)[0]
+    if activity_per_atom == 0:
+        return stable_nuclide, None
+    return "", activity / activity_per_atom
+
+"""
+This function error-checks a date in the YYYY-MM-DD format
+(see date_error). The error message is returned, or "" if the
+date is valid.
+"""
+def read_date(date):
+    error = date_error(date)
+    if error:
+        return error
+
+    # Dates that the calendar does not have (e.g., 1900-02-29)
+    try:
+        np.datetime64(date, 'D')
+    except ValueError:
+        return format_error
+    return ""
\ No newline at end of file
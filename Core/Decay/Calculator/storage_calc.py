@@ -0,0 +1,239 @@
+##### IMPORTS #####
+import math
+import numpy as np
+from Utility.Functions.chain_store import get_chain, amount_per_atom, unit_type
+from Core.Decay.Calculator.register_calc import read_source, read_date, unknown_unit
+
+#####################################################################################
+# STORAGE SECTION
+#####################################################################################
+
+# Waste held for decay in storage is released once its activity falls below a
+# release threshold. A container holds a mix of nuclides, each with its activity
+# on a date (YYYY-MM-DD), given as one row per nuclide. The total activity of a
+# container, progeny included, is a sum of exponentials with the decay constants
+# of the members of its chains (see chain_store):
+#    A(t) = sum over k of w_k exp(-decay constant_k * t)
+# The weights of every container are found once, and the release times of all
+# the containers are then found at once by bisection on these sums.
+
+# Columns of the containers (unit is optional and defaults to Bq)
+container_columns = ["container", "nuclide", "date", "activity", "unit"]
+
+# Columns of the results
+release_columns = ["container", "date", "total_activity", "threshold", "unit",
+                   "release_date", "storage_days", "error"]
+
+# Seconds per day
+seconds_per_day = 86400
+
+# Days per year
+days_per_year = 365.25
+
+# Time grid used to bracket the release times (points per decade of days)
+grid_start = 1e-2
+grid_density = 32
+
+# Relative tolerance of the release times (days)
+tolerance = 1e-9
+
+### ERROR MESSAGES ###
+not_released = "Error: Activity does not fall below the threshold within the storage limit."
+
+"""
+This function finds the earliest date at which every container falls
+below the release threshold (in unit), and stays below it, taking
+the ingrowth of progeny into account. Containers are not released if
+their activity is still above the threshold after max_years.
+It returns the rows of results, one per container, in the order of
+the containers. The date of a container is the latest date of its
+nuclides, and its total activity is the activity on that date.
+Containers with an invalid nuclide row have that row's error.
+A ValueError is raised if the threshold, its unit, or the storage limit
+is invalid, before any row is produced.
+"""
+def release_containers(containers, threshold, unit="Bq", max_years=1000):
+    # Error-check for an invalid threshold, unit, and storage limit
+    value = threshold
+    try:
+        threshold = float(threshold)
+    except (TypeError, ValueError):
+        threshold = math.nan
+    if not math.isfinite(threshold):
+        raise ValueError("Error: Non-number threshold input (" + str(value) + ").")
+    if threshold <= 0:
+        raise ValueError("Error: Threshold must be greater than 0.")
+    if unit_type(unit) != "Activity":
+        raise ValueError(unknown_unit[:-1] + " (" + unit + ").")
+    value = max_years
+    try:
+        max_years = float(max_years)
+    except (TypeError, ValueError):
+        max_years = math.nan
+    if not math.isfinite(max_years):
+        raise ValueError("Error: Non-number storage limit input (" + str(value) + ").")
+    if max_years <= 0:
+        raise ValueError("Error: Storage limit must be greater than 0.")
+
+    groups = group_containers(containers)
+    rows = []
+    for container, nuclides in groups.items():
+        row = {column : "" for column in release_columns}
+        row["container"] = container
+        row["threshold"] = repr(threshold)
+        row["unit"] = unit
+        rows.append(row)
+
+    weights, decay_constants, dates, errors = container_weights(groups, unit)
+    valid = np.flatnonzero([not error for error in errors])
+
+    days = release_times(weights[valid], decay_constants, threshold,
+                         max_years * days_per_year)
+    activities = np.sum(weights[valid], axis=1)
+
+    for i, row in enumerate(rows):
+        row["date"] = dates[i]
+        row["error"] = errors[i]
+    for i, storage_days, activity in zip(valid, days, activities):
+        row = rows[i]
+        row["total_activity"] = repr(float(activity))
+        if np.isnan(storage_days):
+            row["error"] = not_released
+            continue
+        release_date = np.datetime64(dates[i], 'D') + np.timedelta64(int(storage_days), 'D')
+        row["release_date"] = str(release_date)
+        row["storage_days"] = str(int(storage_days))
+
+    return rows
+
+"""
+This function groups the nuclide rows of the containers by container,
+keeping the order in which the containers first appear. The keys and
+values of each row are stripped, and the keys are lowercased.
+"""
+def group_containers(containers):
+    groups = {}
+    for row in containers:
+        row = {key.strip().lower() : str(value).strip() for key, value in row.items()
+               if key is not None and value is not None}
+        groups.setdefault(row.get("container", ""), []).append(row)
+    return groups
+
+"""
+This function finds the weights of the sum of exponentials giving the
+total activity (in unit) of every container, starting from the date of
+the container. The weights are returned as a 2-D array with one row per
+container and one column per decay constant (1/day), along with the
+decay constants, the date of each container, and the error of each
+container ("" if there is no error).
+Nuclides measured before the date of their container are decayed to it.
+The rows of every container are error-checked first, and the weights of
+all the rows of a nuclide are then found at once.
+"""
+def container_weights(groups, unit):
+    dates = []
+    errors = []
+    nuclide_rows = {}
+
+    for i, nuclides in enumerate(groups.values()):
+        # Error-checks the dates of the container
+        error = ""
+        for row in nuclides:
+            error = read_date(row.get("date", ""))
+            if error:
+                break
+        date = nuclides[0].get("date", "") if error else max(row["date"] for row in nuclides)
+
+        # Error-checks every nuclide of the container
+        entries = []
+        for row in nuclides:
+            if error:
+                break
+            try:
+                chain = get_chain(row.get("nuclide", ""))
+            except ValueError:
+                chain = None
+            error, initial_number = read_source(chain, row)
+            delay = (np.datetime64(date, 'D') - np.datetime64(row["date"], 'D')).astype(float)
+            entries.append((row.get("nuclide", ""), (i, initial_number, delay)))
+
+        if not error:
+            for nuclide, entry in entries:
+                nuclide_rows.setdefault(nuclide, []).append(entry)
+        dates.append(date)
+        errors.append(error)
+
+    # Columns of the members of every chain, shared across containers
+    columns = {}
+    decay_constants = []
+    for nuclide in nuclide_rows:
+        for member, decay_constant in zip(get_chain(nuclide)["nuclides"],
+                                          get_chain(nuclide)["decay_constants"]):
+            if member not in columns:
+                columns[member] = len(columns)
+                decay_constants.append(decay_constant * seconds_per_day)
+
+    weights = np.zeros((len(groups), len(columns)))
+    for nuclide, entries in nuclide_rows.items():
+        chain = get_chain(nuclide)
+        containers, initial_numbers, delays = (np.array(values) for values in zip(*entries))
+        members = np.array([columns[member] for member in chain["nuclides"]])
+
+        # Weight of each exponential, decayed to the date of the container
+        mode_weights = amount_per_atom(chain, unit) @ chain["matrix"] * chain["coefficients"]
+        values = mode_weights[None, :] * initial_numbers[:, None] \
+            * np.exp(-np.multiply.outer(delays * seconds_per_day, chain["decay_constants"]))
+        np.add.at(weights, (containers[:, None], members[None, :]), values)
+
+    return weights, np.array(decay_constants), dates, errors
+
+"""
+This function finds the total activity of every container at the
+times (days) of each row of times, from the weights of its exponentials.
+"""
+def activity_sums(weights, decay_constants, times):
+    return np.einsum("ik,ikt->it", weights,
+                     np.exp(-decay_constants[None, :, None] * times[:, None, :]))
+
+"""
+This function finds the number of whole days after which the total
+activity of every container stays at or below the threshold.
+The times are first bracketed on a logarithmic grid of days up to the
+horizon, between the last time above the threshold and the next one.
+The brackets of all the containers are then narrowed at once by
+bisection. NaN is returned for containers still above the threshold
+at the horizon.
+"""
+def release_times(weights, decay_constants, threshold, horizon):
+    count = len(weights)
+    decades = max(np.log10(horizon / grid_start), 1)
+    grid = np.concatenate([[0.0], np.geomspace(grid_start, horizon,
+                                               int(np.ceil(decades * grid_density)) + 1)])
+    above = weights @ np.exp(-np.multiply.outer(decay_constants, grid)) > threshold
+
+    # Last grid time above the threshold (-1 if never above)
+    last = len(grid) - 1 - np.argmax(above[:, ::-1], axis=1)
+    last[~np.any(above, axis=1)] = -1
+    released = last < len(grid) - 1
+
+    low = np.where(last >= 0, grid[np.maximum(last, 0)], 0.0)
+    high = np.where(last >= 0, grid[np.minimum(last + 1, len(grid) - 1)], 0.0)
+
+    # Narrows every bracket at once
+    bracketed = np.flatnonzero(released & (last >= 0))
+    while bracketed.size:
+        middle = (low[bracketed] + high[bracketed]) / 2
+        is_above = activity_sums(weights[bracketed], decay_constants,
+                                 middle[:, None])[:, 0] > threshold
+        low[bracketed] = np.where(is_above, middle, low[bracketed])
+        high[bracketed] = np.where(is_above, high[bracketed], middle)
+        bracketed = bracketed[high[bracketed] - low[bracketed]
+                              > tolerance * np.maximum(high[bracketed], 1)]
+
+    # Rounds up to whole days, checking the day itself
+    days = np.ceil(high - tolerance * np.maximum(high, 1))
+    days = np.maximum(days, 0)
+    is_above = activity_sums(weights, decay_constants, days[:, None])[:, 0] > threshold
+    days = days + is_above
+
+    return np.where(released, days, np.nan) if count else np.empty(0)
\ No newline at end of file
@@ -1,10 +1,11 @@
 ##### IMPORTS #####
-import json
-import shelve
+import numpy as np
 import pandas as pd
 from Utility.Functions.gui_utility import edit_result
 from Utility.Functions.math_utility import energy_units
-from Utility.Functions.files import get_user_data_path, resource_path
+from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.decay_store import get_radiation_lines, radiation_types
 
 #####################################################################################
 # DATAFRAME SECTION
@@ -12,8 +13,8 @@ from Utility.Functions.files import get_user_data_path, resource_path
 
 """
 This function sets up a dataframe with columns for radiation type,
-yield, and energy. The dataframe is populated from the corresponding
-energies .json file.
+yield, and energy. The dataframe is populated from the isotope's radiation lines in the
+radiation database.
 The function handles the following error:
    No data for isotope
 If this error is encountered, None is returned. Otherwise, the populated
@@ -31,7 +32,7 @@ def create_energies_dataframe(element, isotope, error_label, box = False):
     # Gets radiation types, column, order, filter type, filter direction,
     # filter percentage, and energy unit from user prefs
     db_path = get_user_data_path("Settings/Decay/Information")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         rad_types = prefs.get("rad_types", [rad_type for rad_type in neutron_irrelevant_types])
         sort_column = prefs.get("column", "Radiation Type")
         sort_order = prefs.get("order", "Ascending")
@@ -49,31 +50,27 @@ def create_energies_dataframe(element, isotope, error_label, box = False):
     energy_col = "Energy (" + energy_unit + ")"
     cols = [type_col, yield_col, energy_col]
 
-    df = pd.DataFrame(columns=cols)
-
     # Energy unit divisor
     divisor = energy_units[energy_unit]
 
-    db_path = resource_path('Data/Radioactive Decay/Energies/'+element+'.json')
-    with open(db_path, 'r') as file:
-        # Retrieves data
-        data = json.load(file).get(isotope, -1)
-
-        # Error-check for missing data
-        if data == -1:
-            if box:
-                edit_result("No data for "+isotope+".", error_label)
-            else:
-                error_label.config(style="Error.TLabel", text="No data for "+isotope+".")
-            return None
-
-        # Populates dataframe and converts energy to desired energy unit
-        for index, rad in enumerate(data["radiations"]):
-            energy = rad["energy_MeV"] / divisor
-            if rad["type"] in rad_types:
-                df.loc[index] = {type_col : rad["type"],
-                                 yield_col : rad["yield"],
-                                 energy_col : energy}
+    # Retrieves data
+    lines = get_radiation_lines(element, isotope)
+
+    # Error-check for missing data
+    if lines is None:
+        if box:
+            edit_result("No data for "+isotope+".", error_label)
+        else:
+            error_label.config(style="Error.TLabel", text="No data for "+isotope+".")
+        return None
+
+    # Populates dataframe and converts energy to desired energy unit
+    types = np.array(radiation_types)[lines["type"]]
+    selected = np.flatnonzero(np.isin(types, list(rad_types)))
+    df = pd.DataFrame({type_col : types[selected],
+                       yield_col : lines["yield"][selected],
+                       energy_col : lines["energy"][selected] / divisor},
+                      index=selected, columns=cols)
 
     # Filter by Yield or by Energy * Yield
     if filter_type == "Yield":
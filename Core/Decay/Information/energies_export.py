@@ -1,9 +1,8 @@
 ##### IMPORTS #####
-import math
-import shelve
-import radioactivedecay as rd
 from Utility.Functions.gui_utility import no_selection
 from Utility.Functions.files import save_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.nuclide_store import get_nuclide
 from Core.Decay.Information.energies_dataframe import create_energies_dataframe
 
 #####################################################################################
@@ -37,7 +36,7 @@ def export_data(root, element, isotope, error_label):
 
     # Gets radiation types and filter percentage from user prefs
     db_path = get_user_data_path("Settings/Decay/Information")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         rad_types = prefs.get("rad_types", [rad_type for rad_type in neutron_irrelevant_types])
         filter_percentage = prefs.get("filter_percentage", "100")
 
@@ -47,7 +46,7 @@ def export_data(root, element, isotope, error_label):
         return
 
     # Error-check for isotope is stable
-    if math.isinf(rd.Nuclide(isotope).half_life('s')):
+    if get_nuclide(isotope)["stable"]:
         error_label.config(style="Error.TLabel", text="Error: "+isotope+" is stable.")
         return
 
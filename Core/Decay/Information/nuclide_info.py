@@ -1,7 +1,5 @@
 ##### IMPORTS #####
 import io
-import math
-import shelve
 import pandas as pd
 import tkinter as tk
 from PIL import Image
@@ -9,7 +7,10 @@ from collections import deque
 import radioactivedecay as rd
 import matplotlib.pyplot as plt
 from Utility.Functions.files import save_file, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.gui_utility import edit_result, window, no_selection
+from Utility.Functions.chain_store import get_decay_graph
+from Utility.Functions.nuclide_store import get_nuclide
 from Core.Decay.Information.energies_dataframe import create_energies_dataframe
 
 #####################################################################################
@@ -70,6 +71,8 @@ def nuclide_decay_scheme(isotope, result_box, save):
 """
 This function details the decay scheme of a given
 particular isotope in tabular format.
+The chain is walked on the decay graph (see chain_store).
+Spontaneous fission (SF) has no progeny of its own.
 """
 def nuclide_decay_scheme_tabular(isotope, result_box):
     # Sets up columns for dataframe
@@ -86,14 +89,17 @@ def nuclide_decay_scheme_tabular(isotope, result_box):
     # Sets up dataframe
     df = pd.DataFrame(columns=cols)
 
+    # Decay graph of every nuclide
+    graph = get_decay_graph()
+
     # Recurses on children until reaching stable isotopes
     while q:
         x = q.popleft()
-        nuc = rd.Nuclide(x)
+        node = graph[x]
 
-        progeny = nuc.progeny()
-        branching_fractions = nuc.branching_fractions()
-        decay_modes = nuc.decay_modes()
+        progeny = node["progeny"]
+        branching_fractions = node["fractions"]
+        decay_modes = node["modes"]
 
         for num, child in enumerate(progeny):
             parent = x if num == 0 else ""
@@ -103,7 +109,7 @@ def nuclide_decay_scheme_tabular(isotope, result_box):
                              "Decay Modes": decay_modes[num]
                              }
             index += 1
-            if not child in s:
+            if not child in s and child in graph:
                 q.append(child)
                 s.add(child)
         if len(progeny) == 0:
@@ -123,7 +129,7 @@ given a particular isotope.
 def nuclide_half_life(isotope, result_box):
     # Gets half-life unit from user prefs
     db_path = get_user_data_path("Settings/Decay/Information")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         unit = prefs.get("hl_unit", "s")
 
     nuc = rd.Nuclide(isotope)
@@ -154,13 +160,13 @@ def nuclide_energies(isotope, result_box):
 
     # Gets radiation types, filter percentage, and energy unit from user prefs
     db_path = get_user_data_path("Settings/Decay/Information")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         rad_types = prefs.get("rad_types", [rad_type for rad_type in neutron_irrelevant_types])
         filter_percentage = prefs.get("filter_percentage", "100")
         energy_unit = prefs.get("energy_unit", "MeV")
 
     # Error-check for isotope is stable
-    if math.isinf(rd.Nuclide(isotope).half_life('s')):
+    if get_nuclide(isotope)["stable"]:
         edit_result("Error: "+isotope+" is stable.", result_box)
         return
 
@@ -1,11 +1,14 @@
 ##### IMPORTS #####
-import shelve
+import numpy as np
 from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.files import get_user_data_path
-from Utility.Functions.gui_utility import edit_result, non_number, no_selection
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.result_utility import (
+    Results, edit_result, error_codes, error_messages, non_number, no_selection, result_unit
+)
 from Utility.Functions.math_utility import (
     density_numerator, density_denominator,
-    find_data, find_density, errors, energy_units
+    find_data_sum, find_data_array, find_density, energy_units
 )
 
 #####################################################################################
@@ -19,6 +22,12 @@ sp_l_numerator = {"mm\u00B2" : 10 ** 2, "cm\u00B2" : 1,
                   "m\u00B2" : 0.01 ** 2}
 sp_denominator = {"mg" : 1000, "g" : 1, "kg" : 0.001}
 
+# Calculation modes, in the order of the unit choices
+mode_choices = ["Mass Stopping Power",
+                "Radiation Yield",
+                "Density Effect Delta",
+                "Density"]
+
 #####################################################################################
 # CALCULATIONS SECTION
 #####################################################################################
@@ -30,38 +39,16 @@ The function handles the following errors:
    Non-number energy input
 If neither error is applicable, the energy input
 is converted to MeV to match the raw data.
-Then, the function decides what calculation to perform
-based on the selected calculation mode.
-Finally, if the calculation did not cause an error,
-the result is converted to the desired units, and then
-displayed in the result label.
+Then, the result is found in the units from the user prefs
+and displayed in the result label, along with the
+linear stopping power for the Mass Stopping Power mode.
 """
 def handle_calculation(root, category, mode, interactions, item,
                        energy_str, result_box, range_result):
     root.focus()
 
     # Gets units from user prefs
-    db_path = get_user_data_path("Settings/Deposition/Electrons")
-    with shelve.open(db_path) as prefs:
-        sp_e_num = prefs.get("sp_e_num", "MeV")
-        sp_l_num = prefs.get("sp_l_num", "cm\u00B2")
-        d_num = prefs.get("d_num", "g")
-        sp_den = prefs.get("sp_den", "g")
-        d_den = prefs.get("d_den", "cm\u00B3")
-        energy_unit = prefs.get("energy_unit", "MeV")
-
-    # Gets applicable units
-    num_e_units = [sp_e_num, "", "", d_num]
-    num_l_units = [sp_l_num, "", "", d_num]
-    den_units = [sp_den, "", "", d_den]
-    mode_choices = ["Mass Stopping Power",
-                    "Radiation Yield",
-                    "Density Effect Delta",
-                    "Density"]
-    num_e = get_unit(num_e_units, mode_choices, mode)
-    num_l = get_unit(num_l_units, mode_choices, mode)
-    num = num_e + " * " + num_l if mode == "Mass Stopping Power" else num_e
-    den = get_unit(den_units, mode_choices, mode)
+    num, den, energy_unit = get_units(mode)
 
     # Error-check for no selected item
     if item == "":
@@ -81,37 +68,77 @@ def handle_calculation(root, category, mode, interactions, item,
 
     # Converts energy_target to MeV to comply with the raw data
     energy_target *= energy_units[energy_unit]
-    result = 0
+    results = find_results(category, mode, interactions, item, [energy_target], num, den)
+
+    # Displays result label
+    if results.valid()[0]:
+        if results.secondary is not None:
+            edit_result(f"{results.secondary[0]:.4g} {results.secondary_units}", range_result)
+        edit_result(f"{results.values[0]:.4g}", result_box, num=num, den=den)
+    else:
+        edit_result(error_messages[results.errors[0]], result_box)
+
+"""
+This function gets the numerator and denominator units of
+a calculation mode, along with the energy unit, from user prefs.
+The numerator of the Mass Stopping Power mode combines an
+energy unit and an area unit (e.g., "MeV * cm\u00B2").
+"""
+def get_units(mode):
+    db_path = get_user_data_path("Settings/Deposition/Electrons")
+    with open_prefs(db_path) as prefs:
+        sp_e_num = prefs.get("sp_e_num", "MeV")
+        sp_l_num = prefs.get("sp_l_num", "cm\u00B2")
+        d_num = prefs.get("d_num", "g")
+        sp_den = prefs.get("sp_den", "g")
+        d_den = prefs.get("d_den", "cm\u00B3")
+        energy_unit = prefs.get("energy_unit", "MeV")
+
+    # Gets applicable units
+    num_e_units = [sp_e_num, "", "", d_num]
+    num_l_units = [sp_l_num, "", "", d_num]
+    den_units = [sp_den, "", "", d_den]
+    num_e = get_unit(num_e_units, mode_choices, mode)
+    num_l = get_unit(num_l_units, mode_choices, mode)
+    num = num_e + " * " + num_l if mode == "Mass Stopping Power" else num_e
+    den = get_unit(den_units, mode_choices, mode)
+    return num, den, energy_unit
+
+"""
+This function finds the results of a calculation for an item at
+every energy in energy_targets (MeV), in the provided units.
+If multiple interactions are selected, the stopping power
+components of the interactions are summed.
+For the Mass Stopping Power mode, the stopping powers are also
+multiplied by the density of the item to get linear stopping powers,
+which are the secondary results.
+The results are returned along with the error of each energy
+(see Results).
+"""
+def find_results(category, mode, interactions, item, energy_targets, num, den):
+    targets = np.asarray(energy_targets, dtype=float)
 
     if mode == "Mass Stopping Power":
-        for interaction in interactions:
-            datum = find_data(category, interaction, item, energy_target, "Electrons")
-            if datum in errors:
-                result = datum
-                break
-            result += datum
-        result2 = find_density(category, item)
+        values, low, high = find_data_sum(category, interactions, item, targets, "Electrons")
+        values2 = find_density(category, item)
     elif mode == "Density":
-        result = find_density(category, item)
-        result2 = 0
+        values = np.full(targets.shape, find_density(category, item))
+        low = high = np.zeros(targets.shape, dtype=bool)
     else:
-        result = find_data(category, mode, item, energy_target, "Electrons")
-        result2 = 0
+        values, low, high = find_data_array(category, mode, item, targets, "Electrons")
 
-    # Displays result label
-    if not result in errors:
-        # Converts result to desired units
-        if mode == "Mass Stopping Power":
-            result *= sp_e_numerator[num_e]
-            result *= sp_l_numerator[num_l]
-            result /= sp_denominator[den]
-            result2 *= density_numerator[den]
-            lin_den = num_l.split("\u00B2", 1)[0]
-            result2 /= density_denominator[lin_den + "\u00B3"]
-            edit_result(f"{(result*result2):.4g} {num_e}/{lin_den}", range_result)
-        elif mode == "Density":
-            result *= density_numerator[num]
-            result /= density_denominator[den]
-        edit_result(f"{result:.4g}", result_box, num=num, den=den)
-    else:
-        edit_result(result, result_box)
\ No newline at end of file
+    # Converts results to desired units
+    if mode == "Mass Stopping Power":
+        num_e, num_l = num.split(" * ")
+        values *= sp_e_numerator[num_e]
+        values *= sp_l_numerator[num_l]
+        values /= sp_denominator[den]
+        values2 *= density_numerator[den]
+        lin_den = num_l.split("\u00B2", 1)[0]
+        values2 /= density_denominator[lin_den + "\u00B3"]
+        return Results(values, error_codes(low, high), result_unit(num, den),
+                       values*values2, num_e + "/" + lin_den)
+    elif mode == "Density":
+        values *= density_numerator[num]
+        values /= density_denominator[den]
+    return Results(values, error_codes(low, high), result_unit(num, den))
\ No newline at end of file
@@ -1,11 +1,14 @@
 ##### IMPORTS #####
-import shelve
+import numpy as np
 from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.files import get_user_data_path
-from Utility.Functions.gui_utility import edit_result, non_number, no_selection
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.result_utility import (
+    Results, edit_result, error_codes, error_messages, non_number, no_selection, result_unit
+)
 from Utility.Functions.math_utility import (
     density_numerator, density_denominator,
-    find_data, find_density, errors, energy_units
+    find_data_array, find_density, energy_units
 )
 
 #####################################################################################
@@ -17,6 +20,10 @@ mea_numerator = {"mm\u00B2" : 10 ** 2, "cm\u00B2" : 1,
                  "m\u00B2" : 0.01 ** 2}
 mea_denominator = {"mg" : 1000, "g" : 1, "kg" : 0.001}
 
+# Calculation modes, in the order of the unit choices
+mode_choices = ["Mass Energy-Absorption",
+                "Density"]
+
 #####################################################################################
 # CALCULATIONS SECTION
 #####################################################################################
@@ -28,31 +35,14 @@ The function handles the following errors:
    Non-number energy input
 If neither error is applicable, the energy input
 is converted to MeV to match the raw data.
-Then, the function decides what calculation to perform
-based on the selected calculation mode.
-Finally, if the calculation did not cause an error,
-the result is converted to the desired units, and then
-displayed in the result label.
+Then, the result is found in the units from the user prefs
+and displayed in the result label.
 """
 def handle_calculation(root, category, mode, item, energy_str, result_box):
     root.focus()
 
     # Gets units from user prefs
-    db_path = get_user_data_path("Settings/Deposition/Photons")
-    with shelve.open(db_path) as prefs:
-        mea_num = prefs.get("mea_num", "cm\u00B2")
-        d_num = prefs.get("d_num", "g")
-        mea_den = prefs.get("mea_den", "g")
-        d_den = prefs.get("d_den", "cm\u00B3")
-        energy_unit = prefs.get("energy_unit", "MeV")
-
-    # Gets applicable units
-    num_units = [mea_num, d_num]
-    den_units = [mea_den, d_den]
-    mode_choices = ["Mass Energy-Absorption",
-                    "Density"]
-    num = get_unit(num_units, mode_choices, mode)
-    den = get_unit(den_units, mode_choices, mode)
+    num, den, energy_unit = get_units(mode)
 
     # Error-check for no selected item
     if item == "":
@@ -72,21 +62,54 @@ def handle_calculation(root, category, mode, item, energy_str, result_box):
 
     # Converts energy_target to MeV to comply with the raw data
     energy_target *= energy_units[energy_unit]
+    results = find_results(category, mode, item, [energy_target], num, den)
+
+    # Displays result label
+    if results.valid()[0]:
+        edit_result(f"{results.values[0]:.4g}", result_box, num=num, den=den)
+    else:
+        edit_result(error_messages[results.errors[0]], result_box)
+
+"""
+This function gets the numerator and denominator units of
+a calculation mode, along with the energy unit, from user prefs.
+"""
+def get_units(mode):
+    db_path = get_user_data_path("Settings/Deposition/Photons")
+    with open_prefs(db_path) as prefs:
+        mea_num = prefs.get("mea_num", "cm\u00B2")
+        d_num = prefs.get("d_num", "g")
+        mea_den = prefs.get("mea_den", "g")
+        d_den = prefs.get("d_den", "cm\u00B3")
+        energy_unit = prefs.get("energy_unit", "MeV")
+
+    # Gets applicable units
+    num_units = [mea_num, d_num]
+    den_units = [mea_den, d_den]
+    num = get_unit(num_units, mode_choices, mode)
+    den = get_unit(den_units, mode_choices, mode)
+    return num, den, energy_unit
+
+"""
+This function finds the results of a calculation for an item at
+every energy in energy_targets (MeV), in the provided units.
+The results are returned along with the error of each energy
+(see Results).
+"""
+def find_results(category, mode, item, energy_targets, num, den):
+    targets = np.asarray(energy_targets, dtype=float)
 
     if mode == "Density":
-        result = find_density(category, item)
+        values = np.full(targets.shape, find_density(category, item))
+        low = high = np.zeros(targets.shape, dtype=bool)
     else:
-        result = find_data(category, mode, item, energy_target, "Photons")
+        values, low, high = find_data_array(category, mode, item, targets, "Photons")
 
-    # Displays result label
-    if not result in errors:
-        # Converts result to desired units
-        if mode == "Density":
-            result *= density_numerator[num]
-            result /= density_denominator[den]
-        else:
-            result *= mea_numerator[num]
-            result /= mea_denominator[den]
-        edit_result(f"{result:.4g}", result_box, num=num, den=den)
+    # Converts results to desired units
+    if mode == "Density":
+        values *= density_numerator[num]
+        values /= density_denominator[den]
     else:
-        edit_result(result, result_box)
\ No newline at end of file
+        values *= mea_numerator[num]
+        values /= mea_denominator[den]
+    return Results(values, error_codes(low, high), result_unit(num, den))
\ No newline at end of file
@@ -2,15 +2,16 @@
 import io
 import csv
 import math
-import shelve
 import pandas as pd
 import matplotlib.pyplot as plt
 from Utility.Functions.plot import configure_plot
 from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.gui_utility import no_selection
-from Utility.Functions.math_utility import find_data, energy_units
+from Utility.Functions.math_utility import find_data_array, energy_units
 from Utility.Functions.choices import element_choices, material_choices
 from Utility.Functions.files import save_file, resource_path, get_user_data_path
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.coefficient_store import get_table, get_energies
 from Core.Deposition.Photons.photons_calculations import mea_numerator, mea_denominator
 
 #####################################################################################
@@ -39,7 +40,7 @@ def export_data(root, item, category, mode, choice, save, error_label):
 
     # Gets units from user prefs
     db_path = get_user_data_path("Settings/Deposition/Photons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         mea_num = prefs.get("mea_num", "cm\u00B2")
         d_num = prefs.get("d_num", "g")
         mea_den = prefs.get("mea_den", "g")
@@ -69,9 +70,8 @@ def export_data(root, item, category, mode, choice, save, error_label):
 
     df = pd.DataFrame(columns=cols)
     if category in element_choices:
-        # Load the CSV file
-        db_path = resource_path('Data/NIST Coefficients/Photons/Elements/' + item + '.csv')
-        df2 = pd.read_csv(db_path)
+        # Load the coefficient table
+        df2 = pd.DataFrame(get_table(item, "Photons"))
 
         df[energy_col] = df2["Photon Energy"]
         df[mode_col] = df2[mode]
@@ -86,7 +86,7 @@ def export_data(root, item, category, mode, choice, save, error_label):
             make_df_for_material(file, df, item, category, mode)
     else:
         db_path = get_user_data_path('Custom Materials/_' + item)
-        with shelve.open(db_path) as db:
+        with open_prefs(db_path) as db:
             stored_data = db[item]
             stored_data = stored_data.replace('\\n', '\n')
 
@@ -122,9 +122,9 @@ exporting data for a material. First, we retrieve
 the energy values for the dataframe by taking the values
 from the raw data of the first element and then removing
 any values that are out of range for any of the remaining
-elements. Then, for each energy value, we get the corresponding
-calculation mode value by calling the find_data function
-with the mode.
+elements. Then, we get the corresponding calculation mode
+values for all energy values at once by calling the
+find_data_array function with the mode.
 """
 def make_df_for_material(file_like, df, material, category, mode):
     # Reads in file
@@ -133,39 +133,16 @@ def make_df_for_material(file_like, df, material, category, mode):
     # Create the dataframe
     vals = []
     for row in reader:
-        db_path = resource_path('Data/NIST Coefficients/Photons/Elements/' + row['Element'] + '.csv')
+        # Gets energy values to use as dots
+        new_vals = get_energies(row['Element'], "Photons", mode).tolist()
         if len(vals) == 0:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                # Gets energy values to use as dots
-                row2: dict[str, str]
-                for row2 in reader2:
-                    try:
-                        _ = float(row2[mode])
-                        vals.append(float(row2["Photon Energy"]))
-                    except ValueError:
-                        pass
+            vals = new_vals
         else:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                new_vals = []
-                # Gets energy values to use as dots
-                for row2 in reader2:
-                    try:
-                        _ = float(row2[mode])
-                        new_vals.append(float(row2["Photon Energy"]))
-                    except ValueError:
-                        pass
-                max_val = max(new_vals)
-                min_val = min(new_vals)
-                vals = [val for val in vals if min_val <= val <= max_val]
-
-    # Finds the data for mode at each energy value and adds to dataframe
-    for index, val in enumerate(vals):
-        x = find_data(category, mode, material, val, "Photons")
-        row = [val, x]
-        df.loc[index] = row
\ No newline at end of file
+            max_val = max(new_vals)
+            min_val = min(new_vals)
+            vals = [val for val in vals if min_val <= val <= max_val]
+
+    # Finds the data for mode at all energy values and adds to dataframe
+    values, _, _ = find_data_array(category, mode, material, vals, "Photons")
+    df[df.columns[0]] = vals
+    df[df.columns[1]] = values
\ No newline at end of file
@@ -1,8 +1,8 @@
 ##### IMPORTS #####
-import csv
 from tkinter import END
-from Utility.Functions.files import resource_path
+from Utility.Functions.icrp_store import get_icrp_column
 from Utility.Functions.gui_utility import edit_result, no_selection
+from Utility.Functions.compiled_data import icrp_label_columns
 
 #####################################################################################
 # CALCULATIONS SECTION
@@ -28,27 +28,16 @@ def handle_calculation(root, mode, coefficient, isotope, result_box):
         edit_result(no_selection, result_box)
         return
 
-    results = []
-
-    # Finds coefficient
-    db_path = resource_path('Data/ICRP Coefficients/ICRP68/' + mode + '.csv')
-    with open(db_path, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            if row["Nuclide"] == isotope:
-                for key, val in row.items():
-                    if key == coefficient:
-                        results.append(val)
-
-    # Converts to float
-    if coefficient != "Half Life" and coefficient != "f1":
-        results = [float(result) for result in results]
-    elif results and coefficient == "Half Life":
-        results = [results[0]]
+    # Finds coefficient for every variant of the nuclide
+    results = get_icrp_column("ICRP68", mode, isotope, coefficient)
+    if results is None:
+        results = []
+    elif coefficient == "Half Life":
+        results = results[:1]
 
     # Fills result box
-    if results:
-        if coefficient == "Half Life" or coefficient == "f1":
+    if len(results) > 0:
+        if coefficient in icrp_label_columns:
             for result in results:
                 result_box.insert(END, f"{result}\n")
         else:
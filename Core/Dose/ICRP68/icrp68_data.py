@@ -1,8 +1,8 @@
 ##### IMPORTS #####
-import csv
 import pandas as pd
+from Utility.Functions.files import save_file
 from Utility.Functions.gui_utility import no_selection
-from Utility.Functions.files import save_file, resource_path
+from Utility.Functions.icrp_store import get_icrp_nuclide
 
 #####################################################################################
 # EXPORT SECTION
@@ -14,7 +14,8 @@ The function handles the following error:
    No selected element
 If the error is not applicable, a dataframe is set up
 with the ICRP68 coefficients for the selected nuclide.
-The dataframe is populated from the corresponding ICRP68 file.
+The dataframe is populated from the corresponding ICRP68 table,
+with one column per variant of the nuclide.
 Finally, we pass on the work to the save_file function.
 """
 def export_data(root, mode, isotope, error_label):
@@ -35,19 +36,10 @@ def export_data(root, mode, isotope, error_label):
     df = pd.DataFrame(columns=cols)
 
     # Populates dataframe
-    db_path = resource_path('Data/ICRP Coefficients/ICRP68/'+mode+'.csv')
-    with open(db_path, 'r') as file:
-        reader = csv.DictReader(file)
-        filled_first = False
-        for row in reader:
-            if row["Nuclide"] == isotope:
-                if not filled_first:
-                    for key, val in row.items():
-                        if key != "Nuclide":
-                            df.loc[len(df.index)] = [key, val]
-                            filled_first = True
-                else:
-                    df.insert(len(df.columns), isotope+'_', pd.Series(list(row.values())[1:]))
-                    df.columns = list(df.columns[:-1]) + [isotope]
+    data = get_icrp_nuclide("ICRP68", mode, isotope)
+    if data is not None:
+        rows = [[key] + list(values) for key, values in data.items()]
+        variants = len(rows[0]) - 1
+        df = pd.DataFrame(rows, columns=[names_col] + [values_col] * variants)
 
     save_file(df, "Data", error_label, isotope, mode.lower(), False)
\ No newline at end of file
@@ -0,0 +1,48 @@
+##### IMPORTS #####
+from tkinter import END
+from Utility.Functions.gui_utility import edit_result, no_selection
+from Utility.Functions.compiled_data import icrp_label_columns
+from Utility.Functions.icrp_store import get_age_column, icrp72_age_groups
+
+#####################################################################################
+# CALCULATIONS SECTION
+#####################################################################################
+
+"""
+This function is called when the Calculate button is hit.
+The function handles the following error:
+   No selected element
+If the error is not applicable, the coefficient of every
+age group is retrieved from the database, and then
+displayed in the result label with one line per age group.
+"""
+def handle_calculation(root, mode, coefficient, isotope, result_box):
+    root.focus()
+
+    # Clears result box
+    result_box.config(state="normal")
+    result_box.delete("1.0", END)
+
+    # Error-check for no selected element
+    if isotope == "":
+        edit_result(no_selection, result_box)
+        return
+
+    # Finds coefficient for every age group and variant of the nuclide
+    results = get_age_column(mode, isotope, coefficient)
+
+    # Fills result box
+    if results is not None and results.shape[1] > 0:
+        if coefficient == "Half Life":
+            lines = [f"{results[0, 0]}"]
+        elif coefficient in icrp_label_columns:
+            lines = [f"{age}: {', '.join(values)}"
+                     for age, values in zip(icrp72_age_groups, results)]
+        else:
+            lines = [f"{age}: {', '.join(f'{value:.4g}' for value in values)} Sv/Bq"
+                     for age, values in zip(icrp72_age_groups, results)]
+        for line in lines:
+            result_box.insert(END, f"{line}\n")
+        result_box.config(state="disabled", height=len(lines))
+    else:
+        edit_result("Error: Invalid request.", result_box)
\ No newline at end of file
@@ -0,0 +1,46 @@
+##### IMPORTS #####
+import pandas as pd
+from Utility.Functions.files import save_file
+from Utility.Functions.gui_utility import no_selection
+from Utility.Functions.icrp_store import get_age_nuclide, icrp72_age_groups
+
+#####################################################################################
+# EXPORT SECTION
+#####################################################################################
+
+"""
+This function is called when the Calculate button is hit.
+The function handles the following error:
+   No selected element
+If the error is not applicable, a dataframe is set up
+with the ICRP72 coefficients for the selected nuclide.
+The dataframe is populated from the ICRP72 tables of every
+age group, with one column per age group and variant of the nuclide.
+Finally, we pass on the work to the save_file function.
+"""
+def export_data(root, mode, isotope, error_label):
+    root.focus()
+
+    # Error-check for no selected element
+    if isotope == "":
+        error_label.config(style="Error.TLabel", text=no_selection)
+        return
+
+    error_label.config(text="")
+
+    # Sets up columns for dataframe
+    names_col = "Nuclide"
+    cols = [names_col] + [isotope + " (" + age + ")" for age in icrp72_age_groups]
+
+    df = pd.DataFrame(columns=cols)
+
+    # Populates dataframe
+    data = get_age_nuclide(mode, isotope)
+    if data is not None:
+        rows = [[key] + list(values.ravel()) for key, values in data.items()]
+        variants = next(iter(data.values())).shape[1]
+        cols = [names_col] + [isotope + " (" + age + ")"
+                              for age in icrp72_age_groups for _ in range(variants)]
+        df = pd.DataFrame(rows, columns=cols)
+
+    save_file(df, "Data", error_label, isotope, "icrp72_" + mode.lower(), False)
\ No newline at end of file
@@ -1,10 +1,10 @@
 ##### IMPORTS #####
 import csv
-import shelve
 import pandas as pd
 import tkinter as tk
 from Utility.Functions.gui_utility import window, no_selection
 from Utility.Functions.files import save_file, resource_path, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.math_utility import atomic_mass_numerator, atomic_mass_denominator
 
 #####################################################################################
@@ -31,7 +31,7 @@ def handle_action(root, element, error_label, export = False):
 
     # Gets atomic mass units from user prefs
     db_path = get_user_data_path("Settings/General/Elements")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         num = prefs.get("am_num", "g")
         den = prefs.get("am_den", "mol")
 
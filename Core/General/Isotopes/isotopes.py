@@ -1,9 +1,9 @@
 ##### IMPORTS #####
-import shelve
-import radioactivedecay as rd
 from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.gui_utility import edit_result, no_selection
 from Utility.Functions.math_utility import atomic_mass_numerator, atomic_mass_denominator
+from Utility.Functions.nuclide_store import get_nuclide
 
 #####################################################################################
 # CALCULATIONS SECTION
@@ -37,8 +37,7 @@ This function retrieves the proton number
 given a particular isotope.
 """
 def nuclide_proton_number(isotope, result_box):
-    nuc = rd.Nuclide(isotope)
-    result = nuc.Z
+    result = get_nuclide(isotope)["Z"]
     edit_result(result, result_box)
 
 """
@@ -46,8 +45,7 @@ This function retrieves the nucleon number
 given a particular isotope.
 """
 def nuclide_nucleon_number(isotope, result_box):
-    nuc = rd.Nuclide(isotope)
-    result = nuc.A
+    result = get_nuclide(isotope)["A"]
     edit_result(result, result_box)
 
 """
@@ -58,12 +56,11 @@ The result is then converted to the desired units.
 def nuclide_atomic_mass(isotope, result_box):
     # Gets atomic mass units from user prefs
     db_path = get_user_data_path("Settings/General/Isotopes")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         num = prefs.get("am_num", "g")
         den = prefs.get("am_den", "mol")
 
-    nuc = rd.Nuclide(isotope)
-    result = nuc.atomic_mass
+    result = get_nuclide(isotope)["atomic_mass"]
     result *= atomic_mass_numerator[num]
     result /= atomic_mass_denominator[den]
     edit_result(result, result_box, num, den)
\ No newline at end of file
@@ -1,11 +1,14 @@
 ##### IMPORTS #####
-import shelve
+import numpy as np
 from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.files import get_user_data_path
-from Utility.Functions.gui_utility import edit_result, non_number, no_selection
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.result_utility import (
+    Results, edit_result, error_codes, error_messages, non_number, no_selection, result_unit
+)
 from Utility.Functions.math_utility import (
     density_numerator, density_denominator,
-    find_data, find_density, errors, energy_units
+    find_data_array, find_density, energy_units
 )
 
 #####################################################################################
@@ -17,6 +20,10 @@ csda_numerator = {"mg" : 1000, "g" : 1, "kg" : 0.001}
 csda_denominator = {"mm\u00B2" : 10 ** 2, "cm\u00B2" : 1,
                     "m\u00B2" : 0.01 ** 2}
 
+# Calculation modes, in the order of the unit choices
+mode_choices = ["CSDA Range",
+                "Density"]
+
 #####################################################################################
 # CALCULATIONS SECTION
 #####################################################################################
@@ -28,32 +35,16 @@ The function handles the following errors:
    Non-number energy input
 If neither error is applicable, the energy input
 is converted to MeV to match the raw data.
-Then, the function decides what calculation to perform
-based on the selected calculation mode.
-Finally, if the calculation did not cause an error,
-the result is converted to the desired units, and then
-displayed in the result label.
+Then, the result is found in the units from the user prefs
+and displayed in the result label, along with the range
+in units of length for the CSDA Range mode.
 """
 def handle_calculation(root, category, mode, item, energy_str,
                        result_box, range_result):
     root.focus()
 
     # Gets units from user prefs
-    db_path = get_user_data_path("Settings/Shielding/Alphas")
-    with shelve.open(db_path) as prefs:
-        csda_num = prefs.get("csda_num", "g")
-        d_num = prefs.get("d_num", "g")
-        csda_den = prefs.get("csda_den", "cm\u00B2")
-        d_den = prefs.get("d_den", "cm\u00B3")
-        energy_unit = prefs.get("energy_unit", "MeV")
-
-    # Gets applicable units
-    num_units = [csda_num, d_num]
-    den_units = [csda_den, d_den]
-    mode_choices = ["CSDA Range",
-                    "Density"]
-    num = get_unit(num_units, mode_choices, mode)
-    den = get_unit(den_units, mode_choices, mode)
+    num, den, energy_unit = get_units(mode)
 
     # Error-check for no selected item
     if item == "":
@@ -73,26 +64,62 @@ def handle_calculation(root, category, mode, item, energy_str,
 
     # Converts energy_target to MeV to comply with the raw data
     energy_target *= energy_units[energy_unit]
+    results = find_results(category, mode, item, [energy_target], num, den)
 
-    if mode == "Density":
-        result = find_density(category, item)
-        result2 = 0
+    # Displays result label
+    if results.valid()[0]:
+        if results.secondary is not None:
+            edit_result(f"{results.secondary[0]:.4g} {results.secondary_units}", range_result)
+        edit_result(f"{results.values[0]:.4g}", result_box, num=num, den=den)
     else:
-        result = find_data(category, mode, item, energy_target, "Alphas")
-        result2 = find_density(category, item)
+        edit_result(error_messages[results.errors[0]], result_box)
 
-    # Displays result label
-    if not result in errors:
-        # Converts result to desired units
-        if mode == "CSDA Range":
-            result *= csda_numerator[num]
-            result /= csda_denominator[den]
-            result2 *= density_numerator[num]
-            result2 /= density_denominator[den.split("\u00B2", 1)[0] + "\u00B3"]
-            edit_result(f"{(result/result2):.4g} {den.split("\u00B2", 1)[0]}", range_result)
-        else:
-            result *= density_numerator[num]
-            result /= density_denominator[den]
-        edit_result(f"{result:.4g}", result_box, num=num, den=den)
+"""
+This function gets the numerator and denominator units of
+a calculation mode, along with the energy unit, from user prefs.
+"""
+def get_units(mode):
+    db_path = get_user_data_path("Settings/Shielding/Alphas")
+    with open_prefs(db_path) as prefs:
+        csda_num = prefs.get("csda_num", "g")
+        d_num = prefs.get("d_num", "g")
+        csda_den = prefs.get("csda_den", "cm\u00B2")
+        d_den = prefs.get("d_den", "cm\u00B3")
+        energy_unit = prefs.get("energy_unit", "MeV")
+
+    # Gets applicable units
+    num_units = [csda_num, d_num]
+    den_units = [csda_den, d_den]
+    num = get_unit(num_units, mode_choices, mode)
+    den = get_unit(den_units, mode_choices, mode)
+    return num, den, energy_unit
+
+"""
+This function finds the results of a calculation for an item at
+every energy in energy_targets (MeV), in the provided units.
+For the CSDA Range mode, the ranges are also divided by the density
+of the item to get lengths, which are the secondary results.
+The results are returned along with the error of each energy
+(see Results).
+"""
+def find_results(category, mode, item, energy_targets, num, den):
+    targets = np.asarray(energy_targets, dtype=float)
+
+    if mode == "Density":
+        values = np.full(targets.shape, find_density(category, item))
+        low = high = np.zeros(targets.shape, dtype=bool)
     else:
-        edit_result(result, result_box)
\ No newline at end of file
+        values, low, high = find_data_array(category, mode, item, targets, "Alphas")
+        values2 = find_density(category, item)
+
+    # Converts results to desired units
+    if mode == "CSDA Range":
+        values *= csda_numerator[num]
+        values /= csda_denominator[den]
+        values2 *= density_numerator[num]
+        values2 /= density_denominator[den.split("\u00B2", 1)[0] + "\u00B3"]
+        return Results(values, error_codes(low, high), result_unit(num, den),
+                       values/values2, den.split("\u00B2", 1)[0])
+    values *= density_numerator[num]
+    values /= density_denominator[den]
+    return Results(values, error_codes(low, high), result_unit(num, den))
\ No newline at end of file
@@ -1,7 +1,6 @@
 ##### IMPORTS #####
 import io
 import csv
-import shelve
 import pandas as pd
 import matplotlib.pyplot as plt
 from Utility.Functions.plot import configure_plot
@@ -9,9 +8,11 @@ from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.gui_utility import no_selection
 from Utility.Functions.choices import element_choices, material_choices
 from Utility.Functions.files import save_file, resource_path, get_user_data_path
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.coefficient_store import get_table, get_energies
 from Utility.Functions.math_utility import (
     density_numerator, density_denominator,
-    find_data, find_density, energy_units
+    find_data_array, find_density, energy_units
 )
 from Core.Shielding.Electrons.electrons_calculations import (
     range_energy_curve,
@@ -47,7 +48,7 @@ def export_data(root, item, category, mode, choice, save, error_label):
 
     # Gets units and linear selector from user prefs
     db_path = get_user_data_path("Settings/Shielding/Electrons")
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         csda_num = prefs.get("csda_num", "g")
         rec_num = prefs.get("rec_num", "g")
         d_num = prefs.get("d_num", "g")
@@ -87,9 +88,8 @@ def export_data(root, item, category, mode, choice, save, error_label):
 
     df = pd.DataFrame(columns=cols)
     if category in element_choices:
-        # Load the CSV file
-        db_path = resource_path('Data/NIST Coefficients/Electrons/Elements/' + item + '.csv')
-        df2 = pd.read_csv(db_path)
+        # Load the coefficient table
+        df2 = pd.DataFrame(get_table(item, "Electrons"))
 
         df[energy_col] = df2["Kinetic Energy"]
 
@@ -110,7 +110,7 @@ def export_data(root, item, category, mode, choice, save, error_label):
             make_df_for_material(file, df, item, category, mode, energy_unit)
     else:
         db_path = get_user_data_path('Custom Materials/_' + item)
-        with shelve.open(db_path) as db:
+        with open_prefs(db_path) as db:
             stored_data = db[item]
             stored_data = stored_data.replace('\\n', '\n')
 
@@ -153,9 +153,9 @@ exporting data for a material. First, we retrieve
 the energy values for the dataframe by taking the values
 from the raw data of the first element and then removing
 any values that are out of range for any of the remaining
-elements. Then, for each energy value, we get the corresponding
-calculation mode value by calling the find_data function
-with the mode. If Range-Energy Curve is the selected calculation mode,
+elements. Then, we get the corresponding calculation mode
+values for all energy values at once by calling the
+find_data_array function with the mode. If Range-Energy Curve is the selected calculation mode,
 then instead of finding the values in the data, we calculate them.
 """
 def make_df_for_material(file_like, df, material, category, mode, energy_unit):
@@ -165,27 +165,14 @@ def make_df_for_material(file_like, df, material, category, mode, energy_unit):
     # Create the dataframe
     vals = []
     for row in reader:
-        db_path = resource_path('Data/NIST Coefficients/Electrons/Elements/' + row['Element'] + '.csv')
+        # Gets energy values to use as dots
+        new_vals = get_energies(row['Element'], "Electrons").tolist()
         if len(vals) == 0:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                # Gets energy values to use as dots
-                for row2 in reader2:
-                    vals.append(float(row2["Kinetic Energy"]))
+            vals = new_vals
         else:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                new_vals = []
-                # Gets energy values to use as dots
-                for row2 in reader2:
-                    new_vals.append(float(row2["Kinetic Energy"]))
-                max_val = max(new_vals)
-                min_val = min(new_vals)
-                vals = [val for val in vals if min_val <= val <= max_val]
+            max_val = max(new_vals)
+            min_val = min(new_vals)
+            vals = [val for val in vals if min_val <= val <= max_val]
 
     # Gets rid of bad R.E.C. energy values
     if mode == "Range-Energy Curve":
@@ -193,11 +180,10 @@ def make_df_for_material(file_like, df, material, category, mode, energy_unit):
         max_val = 10
         vals = [val for val in vals if min_val <= val <= max_val]
 
-    # Finds the data for mode at each energy value and adds to dataframe
-    for index, val in enumerate(vals):
-        if mode == "Range-Energy Curve":
-            x = range_energy_curve(val, energy_unit, None)
-        else:
-            x = find_data(category, mode, material, val, "Electrons")
-        row = [val, x]
-        df.loc[index] = row
\ No newline at end of file
+    # Finds the data for mode at all energy values and adds to dataframe
+    if mode == "Range-Energy Curve":
+        values = [range_energy_curve(val, energy_unit, None) for val in vals]
+    else:
+        values, _, _ = find_data_array(category, mode, material, vals, "Electrons")
+    df[df.columns[0]] = vals
+    df[df.columns[1]] = values
\ No newline at end of file
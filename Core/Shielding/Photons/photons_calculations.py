@@ -1,12 +1,16 @@
 ##### IMPORTS #####
-import shelve
+import numpy as np
 from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.files import get_user_data_path
-from Utility.Functions.gui_utility import edit_result, non_number, no_selection
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.result_utility import (
+    Results, edit_result, error_codes, error_messages, non_number, no_selection, result_unit
+)
 from Utility.Functions.math_utility import (
     density_numerator, density_denominator,
-    find_data, find_density, errors, energy_units
+    find_data_sum, find_density, energy_units
 )
+from Utility.Functions.coefficient_store import MissingDataError
 
 #####################################################################################
 # UNITS SECTION
@@ -19,6 +23,11 @@ lac_numerator = {"1" : 1}
 mac_denominator = {"mg" : 1000, "g" : 1, "kg" : 0.001}
 lac_denominator = {"mm" : 10, "cm" : 1, "m" : 0.01}
 
+# Calculation modes, in the order of the unit choices
+mode_choices = ["Mass Attenuation Coefficient",
+                "Density",
+                "Linear Attenuation Coefficient"]
+
 #####################################################################################
 # CALCULATIONS SECTION
 #####################################################################################
@@ -30,38 +39,15 @@ The function handles the following errors:
    Non-number energy input
 If neither error is applicable, the energy input
 is converted to MeV to match the raw data.
-Then, the function decides what calculation to perform
-based on the selected calculation mode.
-If we are finding an attenuation coefficient and multiple
-interactions are selected, the function iterates over the interactions
-and sums their coefficient components.
-Finally, if the calculation did not cause an error,
-the result is converted to the desired units, and then
-displayed in the result label.
+Then, the result is found in the units from the user prefs
+and displayed in the result label.
 """
 def handle_calculation(root, category, mode, interactions, item,
                        energy_str, result_box):
     root.focus()
 
     # Gets units from user prefs
-    db_path = get_user_data_path("Settings/Shielding/Photons")
-    with shelve.open(db_path) as prefs:
-        mac_num = prefs.get("mac_num", "cm\u00B2")
-        d_num = prefs.get("d_num", "g")
-        lac_num = prefs.get("lac_num", "1")
-        mac_den = prefs.get("mac_den", "g")
-        d_den = prefs.get("d_den", "cm\u00B3")
-        lac_den = prefs.get("lac_den", "cm")
-        energy_unit = prefs.get("energy_unit", "MeV")
-
-    # Gets applicable units
-    num_units = [mac_num, d_num, lac_num]
-    den_units = [mac_den, d_den, lac_den]
-    mode_choices = ["Mass Attenuation Coefficient",
-                    "Density",
-                    "Linear Attenuation Coefficient"]
-    num = get_unit(num_units, mode_choices, mode)
-    den = get_unit(den_units, mode_choices, mode)
+    num, den, energy_unit = get_units(mode)
 
     # Error-check for no selected item
     if item == "":
@@ -81,37 +67,299 @@ def handle_calculation(root, category, mode, interactions, item,
 
     # Converts energy_target to MeV to comply with the raw data
     energy_target *= energy_units[energy_unit]
-    result = 0
+    results = find_results(category, mode, interactions, item, [energy_target], num, den)
+
+    # Displays result label
+    if results.valid()[0]:
+        edit_result(f"{results.values[0]:.4g}", result_box, num=num, den=den)
+    else:
+        edit_result(error_messages[results.errors[0]], result_box)
+
+"""
+This function gets the numerator and denominator units of
+a calculation mode, along with the energy unit, from user prefs.
+"""
+def get_units(mode):
+    db_path = get_user_data_path("Settings/Shielding/Photons")
+    with open_prefs(db_path) as prefs:
+        mac_num = prefs.get("mac_num", "cm\u00B2")
+        d_num = prefs.get("d_num", "g")
+        lac_num = prefs.get("lac_num", "1")
+        mac_den = prefs.get("mac_den", "g")
+        d_den = prefs.get("d_den", "cm\u00B3")
+        lac_den = prefs.get("lac_den", "cm")
+        energy_unit = prefs.get("energy_unit", "MeV")
+
+    # Gets applicable units
+    num_units = [mac_num, d_num, lac_num]
+    den_units = [mac_den, d_den, lac_den]
+    num = get_unit(num_units, mode_choices, mode)
+    den = get_unit(den_units, mode_choices, mode)
+    return num, den, energy_unit
+
+"""
+This function finds the results of a calculation for an item at
+every energy in energy_targets (MeV), in the provided units.
+If we are finding an attenuation coefficient and multiple
+interactions are selected, the coefficient components of the
+interactions are summed.
+The results are returned along with the error of each energy
+(see Results).
+"""
+def find_results(category, mode, interactions, item, energy_targets, num, den):
+    targets = np.asarray(energy_targets, dtype=float)
 
     if mode == "Mass Attenuation Coefficient":
-        for interaction in interactions:
-            mac = find_data(category, interaction, item, energy_target, "Photons")
-            if mac in errors:
-                result = mac
-                break
-            result += mac
+        values, low, high = find_data_sum(category, interactions, item, targets, "Photons")
     elif mode == "Density":
-        result = find_density(category, item)
+        values = np.full(targets.shape, find_density(category, item))
+        low = high = np.zeros(targets.shape, dtype=bool)
     else:
-        for interaction in interactions:
-            mac = find_data(category, interaction, item, energy_target, "Photons")
-            if mac in errors:
-                result = mac
-                break
-            result += (mac * find_density(category, item))
+        values, low, high = find_data_sum(category, interactions, item, targets, "Photons",
+                                          weight=find_density(category, item))
 
-    # Displays result label
-    if not result in errors:
-        # Converts result to desired units
-        if mode == "Mass Attenuation Coefficient":
-            result *= mac_numerator[num]
-            result /= mac_denominator[den]
-        elif mode == "Density":
-            result *= density_numerator[num]
-            result /= density_denominator[den]
-        else:
-            result *= lac_numerator[num]
-            result /= lac_denominator[den]
-        edit_result(f"{result:.4g}", result_box, num=num, den=den)
+    # Converts results to desired units
+    if mode == "Mass Attenuation Coefficient":
+        values *= mac_numerator[num]
+        values /= mac_denominator[den]
+    elif mode == "Density":
+        values *= density_numerator[num]
+        values /= density_denominator[den]
     else:
-        edit_result(result, result_box)
\ No newline at end of file
+        values *= lac_numerator[num]
+        values /= lac_denominator[den]
+    return Results(values, error_codes(low, high), result_unit(num, den))
+
+"""
+This function finds the results of a calculation for several items
+at every energy in energy_targets (MeV), in the provided units.
+The category is either shared by every item or provided for each item.
+The results are 2-D arrays with one row per item and one column per
+energy. Items without usable data (e.g., a material without a
+composition file, without a numeric density, or with an element
+without data for an interaction) have the no_data error at every energy.
+"""
+def find_results_matrix(category, mode, interactions, items, energy_targets, num, den):
+    targets = np.asarray(energy_targets, dtype=float)
+    categories = [category] * len(items) if isinstance(category, str) else category
+
+    values = np.full((len(items), len(targets)), np.nan)
+    codes = np.full((len(items), len(targets)), "no_data", dtype="U16")
+    for row, (item_category, item) in enumerate(zip(categories, items)):
+        try:
+            results = find_results(item_category, mode, interactions, item, targets, num, den)
+        except (OSError, ValueError, MissingDataError):
+            continue
+        values[row] = results.values
+        codes[row] = results.errors
+
+    return Results(values, codes, result_unit(num, den))
+
+#####################################################################################
+# TRANSMISSION SECTION
+#####################################################################################
+
+"""
+This function finds the narrow-beam transmission of photons through
+a stack of layers at every energy in energy_targets (MeV).
+Each layer is a (category, item, thickness) tuple, in the order the beam
+crosses them, with the thickness in length_unit. A layer's thickness can
+be an array to sweep over; each such layer adds an axis to the results,
+in the order of the layers, before the energy axis.
+The linear attenuation coefficient of each layer is found once for every
+energy, so that sweeping over many thicknesses only costs the products
+and exponentials.
+The results are returned as a dictionary with:
+   optical_thickness: sum of the linear attenuation coefficient times the thickness of each layer
+   transmission: fraction of photons crossing the stack without interacting
+   attenuation_factor: inverse of the transmission
+   errors: error of each energy (see Results), which gives NaN results
+"""
+def find_transmission(layers, interactions, energy_targets, length_unit="cm"):
+    targets = np.asarray(energy_targets, dtype=float)
+    thicknesses = [np.asarray(thickness, dtype=float) for _, _, thickness in layers]
+    swept = [thickness.ndim > 0 for thickness in thicknesses]
+    axes = sum(swept)
+
+    optical_thickness = np.zeros(targets.shape)
+    codes = np.full(targets.shape, "", dtype="U16")
+    axis = 0
+    for (category, item, _), thickness, sweep in zip(layers, thicknesses, swept):
+        results = find_results(category, "Linear Attenuation Coefficient", interactions,
+                               item, targets, "1", length_unit)
+        codes = np.where(codes == "", results.errors, codes)
+
+        # Puts the layer's thicknesses on its own axis
+        shape = [1] * (axes + 1)
+        if sweep:
+            shape[axis] = thickness.size
+            axis += 1
+        optical_thickness = optical_thickness + thickness.reshape(shape) * results.values
+
+    optical_thickness = np.where(codes == "", optical_thickness, np.nan)
+    with np.errstate(over='ignore'):
+        attenuation_factor = np.exp(optical_thickness)
+    return {"optical_thickness" : optical_thickness,
+            "transmission" : np.exp(-optical_thickness),
+            "attenuation_factor" : attenuation_factor,
+            "errors" : codes}
+
+"""
+This function finds the narrow-beam transmission of a spectrum's photon
+lines, with energies (MeV) and yields per decay, through a stack of layers
+(see find_transmission). The attenuation of every line in each layer is
+found at once. The transmission of every line is the product of its
+transmission through each layer, so the yield-weighted sums over the lines
+are taken as a single tensor contraction, without the transmission of
+every line for every combination of swept thicknesses.
+Lines outside of the photon data (e.g., X-rays below 1 keV) are left out
+of the spectrum; their errors are kept.
+The results are returned as a dictionary with:
+   intensity: photons transmitted per decay
+   energy_intensity: photon energy transmitted per decay (MeV)
+   transmission: fraction of the spectrum's photons transmitted
+   energy_transmission: fraction of the spectrum's photon energy transmitted
+   errors: error of each line
+"""
+def find_spectrum_transmission(layers, interactions, energies, yields, length_unit="cm"):
+    energies = np.asarray(energies, dtype=float)
+    codes = np.full(energies.shape, "", dtype="U16")
+
+    # Transmission of every line through each layer, with one axis per swept layer
+    factors = []
+    subscripts = []
+    for category, item, thickness in layers:
+        results = find_results(category, "Linear Attenuation Coefficient", interactions,
+                               item, energies, "1", length_unit)
+        codes = np.where(codes == "", results.errors, codes)
+        thickness = np.asarray(thickness, dtype=float)
+        if thickness.ndim > 0:
+            thickness = thickness.reshape(-1, 1)
+            subscripts.append(chr(ord("a") + len(subscripts)))
+        else:
+            subscripts.append("")
+        factors.append(np.exp(-thickness * results.values))
+
+    valid = codes == ""
+    yields = np.where(valid, yields, 0.0)
+    factors = [np.where(valid, factor, 0.0) for factor in factors]
+
+    # Sums the yield-weighted transmissions over the lines
+    equation = ",".join(subscript + "z" for subscript in subscripts) + ",z->" + "".join(subscripts)
+    intensity = np.einsum(equation, *factors, yields, optimize=True)
+    energy_intensity = np.einsum(equation, *factors, yields * energies, optimize=True)
+
+    # Fractions are NaN if no line is in the photon data
+    with np.errstate(divide='ignore', invalid='ignore'):
+        transmission = intensity / np.sum(yields)
+        energy_transmission = energy_intensity / np.sum(yields * energies)
+    return {"intensity" : intensity,
+            "energy_intensity" : energy_intensity,
+            "transmission" : transmission,
+            "energy_transmission" : energy_transmission,
+            "errors" : codes}
+
+#####################################################################################
+# THICKNESS SECTION
+#####################################################################################
+
+# Iteration limit and relative tolerance when solving for a spectrum's thickness
+max_iterations = 100
+tolerance = 1e-12
+
+"""
+This function finds the thickness of shielding needed for a target
+narrow-beam transmission, for several items at every energy in
+energy_targets (MeV). The thickness is in length_unit.
+Without weights, a thickness is found for every item and energy, as a
+2-D array with one row per item and one column per energy.
+With weights (e.g., the yields of a spectrum's lines), a single thickness
+is found for every item, for which the weighted mean of the transmissions
+at every energy equals the target.
+If layers are provided (see find_transmission), each with a single
+thickness, they are crossed before the shielding, and the thickness added to them is found.
+"""
+def find_thickness_matrix(category, interactions, items, energy_targets, transmission,
+                          length_unit="cm", weights=None, layers=None):
+    mu, codes = find_lac_matrix(category, interactions, items, energy_targets, length_unit)
+
+    base = 0.0
+    if layers:
+        stack = find_transmission(layers, interactions, energy_targets, length_unit)
+        base = stack["optical_thickness"]
+        codes = np.where(codes == "", stack["errors"], codes)
+
+    thickness = solve_thickness(mu, transmission, weights, base)
+    return Results(thickness, codes if weights is None else spectrum_errors(codes),
+                   length_unit)
+
+"""
+This function finds the half-value and tenth-value layers of several items
+at every energy in energy_targets (MeV), in length_unit.
+The half-value layers are the values of the results and the tenth-value
+layers are the secondary results. As with find_thickness_matrix, weights
+give a single half-value and tenth-value layer for every item's spectrum.
+"""
+def find_value_layers(category, interactions, items, energy_targets,
+                      length_unit="cm", weights=None):
+    mu, codes = find_lac_matrix(category, interactions, items, energy_targets, length_unit)
+    if weights is not None:
+        codes = spectrum_errors(codes)
+    return Results(solve_thickness(mu, 0.5, weights), codes, length_unit,
+                   solve_thickness(mu, 0.1, weights), length_unit)
+
+"""
+This function finds the linear attenuation coefficients of several items
+at every energy in energy_targets (MeV), in the inverse of length_unit,
+along with the error of each item and energy.
+"""
+def find_lac_matrix(category, interactions, items, energy_targets, length_unit):
+    results = find_results_matrix(category, "Linear Attenuation Coefficient", interactions,
+                                  items, energy_targets, "1", length_unit)
+    return results.values, results.errors
+
+"""
+This function finds the first error of each row of error codes,
+or "" if the row has no errors.
+"""
+def spectrum_errors(codes):
+    first = np.argmax(codes != "", axis=-1)
+    return np.take_along_axis(codes, first[..., None], axis=-1)[..., 0]
+
+"""
+This function finds the thickness of shielding for which the narrow-beam
+transmission equals target, given linear attenuation coefficients with
+one energy per column (last axis).
+Without weights, a thickness is found for every coefficient by inverting
+the exponential attenuation. With weights, a single thickness is found for
+every row, for which the weighted mean of the transmissions equals target.
+It is found with Newton's method on the log of the transmission, for every
+row at once. The log of the transmission is convex in the thickness, so
+the iterations from zero thickness approach the root without overshooting.
+base is the optical thickness already crossed at every energy.
+The thickness is zero where base alone reaches the target.
+"""
+def solve_thickness(mu, target, weights=None, base=0.0):
+    mu = np.asarray(mu, dtype=float)
+    goal = -np.log(target)
+    if weights is None:
+        return np.maximum((goal - base) / mu, 0.0)
+
+    with np.errstate(divide='ignore'):
+        log_weights = np.log(np.asarray(weights, dtype=float) / np.sum(weights))
+    exponents = log_weights - base - np.zeros(mu.shape)
+    thickness = np.zeros(mu.shape[:-1])
+    for _ in range(max_iterations):
+        # Log of the transmission and its slope, shifted to avoid underflow
+        shift = np.max(exponents, axis=-1, keepdims=True)
+        terms = np.exp(exponents - shift)
+        total = np.sum(terms, axis=-1)
+        log_transmission = np.log(total) + shift[..., 0]
+        slope = np.sum(terms * mu, axis=-1) / total
+
+        step = np.maximum(thickness + (log_transmission + goal) / slope, 0.0) - thickness
+        thickness += step
+        exponents -= step[..., None] * mu
+        if not np.any(np.abs(step) > tolerance * thickness):
+            break
+    return thickness
\ No newline at end of file
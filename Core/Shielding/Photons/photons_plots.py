@@ -1,18 +1,21 @@
 ##### IMPORTS #####
 import io
 import csv
-import shelve
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from Utility.Functions.plot import configure_plot
-from Utility.Functions.logic_utility import get_unit
 from Utility.Functions.gui_utility import no_selection
-from Utility.Functions.choices import element_choices, material_choices
+from Utility.Functions.choices import element_choices, material_choices, get_choices
 from Utility.Functions.files import save_file, resource_path, get_user_data_path
-from Utility.Functions.math_utility import find_data, find_density, energy_units
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.coefficient_store import get_table, get_energies
+from Utility.Functions.material_store import get_mixture_column
+from Utility.Functions.math_utility import find_data_array, find_density, energy_units
 from Core.Shielding.Photons.photons_calculations import (
     mac_numerator, mac_denominator,
-    lac_numerator, lac_denominator
+    lac_numerator, lac_denominator,
+    get_units, find_results_matrix
 )
 
 #####################################################################################
@@ -37,6 +40,8 @@ calculation mode, we also need to multiply the interaction
 columns by the item's density.
 Then, if the selected export type is Plot, we call
 configure_plot.
+If the selected export type is Matrix, the work is passed on
+to the export_matrix function instead.
 Finally, if the file is meant to be saved, we pass on the
 work to the save_file function. Otherwise, we show the plot.
 """
@@ -44,24 +49,7 @@ def export_data(root, item, category, mode, interactions, choice, save, error_la
     root.focus()
 
     # Gets units from user prefs
-    db_path = get_user_data_path("Settings/Shielding/Photons")
-    with shelve.open(db_path) as prefs:
-        mac_num = prefs.get("mac_num", "cm\u00B2")
-        d_num = prefs.get("d_num", "g")
-        lac_num = prefs.get("lac_num", "1")
-        mac_den = prefs.get("mac_den", "g")
-        d_den = prefs.get("d_den", "cm\u00B3")
-        lac_den = prefs.get("lac_den", "cm")
-        energy_unit = prefs.get("energy_unit", "MeV")
-
-    # Gets applicable units
-    num_units = [mac_num, d_num, lac_num]
-    den_units = [mac_den, d_den, lac_den]
-    mode_choices = ["Mass Attenuation Coefficient",
-                    "Density",
-                    "Linear Attenuation Coefficient"]
-    num = get_unit(num_units, mode_choices, mode)
-    den = get_unit(den_units, mode_choices, mode)
+    num, den, energy_unit = get_units(mode)
 
     # Error-check for no selected item
     if item == "":
@@ -75,6 +63,10 @@ def export_data(root, item, category, mode, interactions, choice, save, error_la
 
     error_label.config(style="Error.TLabel", text="")
 
+    if choice == "Matrix":
+        export_matrix(item, category, mode, interactions, error_label)
+        return
+
     # Sets up columns for dataframe
     energy_col = "Photon Energy (" + energy_unit + ")"
     cols = [energy_col]
@@ -83,9 +75,8 @@ def export_data(root, item, category, mode, interactions, choice, save, error_la
 
     df = pd.DataFrame(columns=cols)
     if category in element_choices:
-        # Load the CSV file
-        db_path = resource_path('Data/NIST Coefficients/Photons/Elements/' + item + '.csv')
-        df2 = pd.read_csv(db_path)
+        # Load the coefficient table
+        df2 = pd.DataFrame(get_table(item, "Photons"))
 
         df[energy_col] = df2["Photon Energy"]
 
@@ -97,7 +88,7 @@ def export_data(root, item, category, mode, interactions, choice, save, error_la
             make_df_for_material(file, df, item, category, interactions)
     else:
         db_path = get_user_data_path('Custom Materials/_' + item)
-        with shelve.open(db_path) as db:
+        with open_prefs(db_path) as db:
             stored_data = db[item]
             stored_data = stored_data.replace('\\n', '\n')
 
@@ -138,6 +129,34 @@ def export_data(root, item, category, mode, interactions, choice, save, error_la
             df.rename(columns={interaction: interaction+unit}, inplace=True)
         save_file(df, choice, error_label, item, "attenuation")
 
+"""
+This function exports the results for every item of the category
+as a single table, with a row for each energy of the selected item's
+data and a column for each item.
+The results of all items are found at once by find_results_matrix,
+summing the selected interactions. Results that cannot be found
+(e.g., energies outside of an item's data) are left empty.
+"""
+def export_matrix(item, category, mode, interactions, error_label):
+    num, den, energy_unit = get_units(mode)
+
+    # Energies of the selected item's data
+    if category in element_choices:
+        energies = get_energies(item, "Photons", interactions[0])
+    else:
+        energies, _ = get_mixture_column(category, item, interactions[0], "Photons")
+
+    items = get_choices(category, "Shielding", "Photons")
+    results = find_results_matrix(category, mode, interactions, items, energies, num, den)
+
+    # Sets up dataframe with the results of each item as a column
+    energy_col = "Photon Energy (" + energy_unit + ")"
+    df = pd.DataFrame(results.values.T, columns=[name + " (" + results.units + ")"
+                                                 for name in items])
+    df.insert(0, energy_col, np.asarray(energies) / energy_units[energy_unit])
+
+    save_file(df, "Matrix", error_label, category, "attenuation")
+
 #####################################################################################
 # DATA SECTION
 #####################################################################################
@@ -148,9 +167,9 @@ exporting data for a material. First, we retrieve
 the energy values for the dataframe by taking the values
 from the raw data of the first element and then removing
 any values that are out of range for any of the remaining
-elements. Then, for each energy value, we get the M.A.C. values
-for the rest of the row by calling the find_data function
-with each interaction. If L.A.C. is the selected calculation mode,
+elements. Then, we get the M.A.C. values for all energy
+values at once by calling the find_data_array function
+with the interactions. If L.A.C. is the selected calculation mode,
 the export_data function will handle the conversion by multiplying
 these rows by the density.
 """
@@ -161,32 +180,17 @@ def make_df_for_material(file_like, df, material, category, interactions):
     # Create the dataframe
     vals = []
     for row in reader:
-        db_path = resource_path('Data/NIST Coefficients/Photons/Elements/' + row['Element'] + '.csv')
+        # Gets energy values to use as dots
+        new_vals = get_energies(row['Element'], "Photons").tolist()
         if len(vals) == 0:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                # Gets energy values to use as dots
-                for row2 in reader2:
-                    vals.append(float(row2["Photon Energy"]))
+            vals = new_vals
         else:
-            with open(db_path, 'r') as file:
-                # Reads in file
-                reader2 = csv.DictReader(file)
-
-                new_vals = []
-                # Gets energy values to use as dots
-                for row2 in reader2:
-                    new_vals.append(float(row2["Photon Energy"]))
-                max_val = max(new_vals)
-                min_val = min(new_vals)
-                vals = [val for val in vals if min_val <= val <= max_val]
-
-    # Finds the M.A.C. at each energy value and adds to dataframe
-    for index, val in enumerate(vals):
-        row = [val]
-        for interaction in interactions:
-            x = find_data(category, interaction, material, val, "Photons")
-            row.append(x)
-        df.loc[index] = row
\ No newline at end of file
+            max_val = max(new_vals)
+            min_val = min(new_vals)
+            vals = [val for val in vals if min_val <= val <= max_val]
+
+    # Finds the M.A.C. at all energy values and adds to dataframe
+    values, _, _ = find_data_array(category, interactions, material, vals, "Photons")
+    df[df.columns[0]] = vals
+    for index, interaction in enumerate(interactions):
+        df[df.columns[index + 1]] = values[:, index]
\ No newline at end of file
@@ -0,0 +1,734 @@
+##### IMPORTS #####
+import re
+import numpy as np
+import Core.Shielding.Photons.photons_calculations as shielding_photons
+import Core.Shielding.Electrons.electrons_calculations as shielding_electrons
+import Core.Shielding.Alphas.alphas_calculations as shielding_alphas
+import Core.Deposition.Photons.photons_calculations as deposition_photons
+import Core.Deposition.Electrons.electrons_calculations as deposition_electrons
+import Core.Deposition.Alphas.alphas_calculations as deposition_alphas
+from Utility.Functions.result_utility import CalculationError, Results, error_codes
+from Utility.Functions.range_store import find_energy_array, find_residual_energy_array, \
+                                          find_slab_energies
+from Utility.Functions.decay_store import get_photon_lines, get_equilibrium_ratios
+from Utility.Functions.chain_store import get_chain, decay_series as chain_decay_series, \
+                                          amount_per_atom
+from Utility.Functions.kerma_store import get_kerma_table, kerma_cutoffs, kerma_units
+from Utility.Functions.math_utility import get_density_index, find_density, energy_units, \
+                                          density_numerator, density_denominator
+
+#####################################################################################
+# MODULES SECTION
+#####################################################################################
+
+# The toolbox can be used from Python without the app through the
+# functions of this module. They take one or more energies and return
+# the results at every energy at once (see Results in result_utility).
+# Energies that cannot be calculated are marked in the errors of the
+# results, and calculations that cannot be performed at all raise a
+# CalculationError. Neither tkinter nor matplotlib is imported.
+
+# The calculation modules, paired with their default interactions
+# (None if they do not take interactions)
+modules = {
+    "Shielding/Photons" : (shielding_photons, ["Total Attenuation with Coherent Scattering"]),
+    "Shielding/Electrons" : (shielding_electrons, None),
+    "Shielding/Alphas" : (shielding_alphas, None),
+    "Deposition/Photons" : (deposition_photons, None),
+    "Deposition/Electrons" : (deposition_electrons, ["Stopping Power - Total"]),
+    "Deposition/Alphas" : (deposition_alphas, ["Total Stopping Power"])
+}
+
+# Interaction choices of the modules that take interactions
+interaction_choices = {
+    "Shielding/Photons" : ["Total Attenuation with Coherent Scattering",
+                           "Total Attenuation without Coherent Scattering",
+                           "Pair Production in Electron Field",
+                           "Pair Production in Nuclear Field",
+                           "Scattering - Incoherent",
+                           "Scattering - Coherent",
+                           "Photo-Electric Absorption"],
+    "Deposition/Electrons" : ["Stopping Power - Total",
+                              "Stopping Power - Collision",
+                              "Stopping Power - Radiative"],
+    "Deposition/Alphas" : ["Total Stopping Power",
+                           "Electronic Stopping Power",
+                           "Nuclear Stopping Power"]
+}
+
+# Numerator units of the stopping powers (e.g., MeV * cm\u00B2)
+stopping_numerator = [energy + " * " + area for energy in deposition_electrons.sp_e_numerator
+                      for area in deposition_electrons.sp_l_numerator]
+
+# Numerator and denominator unit choices of every mode with units, keyed by module
+unit_choices = {
+    "Shielding/Photons" : {
+        "Mass Attenuation Coefficient" : (shielding_photons.mac_numerator,
+                                          shielding_photons.mac_denominator),
+        "Density" : (density_numerator, density_denominator),
+        "Linear Attenuation Coefficient" : (shielding_photons.lac_numerator,
+                                            shielding_photons.lac_denominator)},
+    "Shielding/Electrons" : {
+        "CSDA Range" : (shielding_electrons.csda_numerator, shielding_electrons.csda_denominator),
+        "Range-Energy Curve" : (shielding_electrons.csda_numerator,
+                                shielding_electrons.csda_denominator),
+        "Density" : (density_numerator, density_denominator)},
+    "Shielding/Alphas" : {
+        "CSDA Range" : (shielding_alphas.csda_numerator, shielding_alphas.csda_denominator),
+        "Density" : (density_numerator, density_denominator)},
+    "Deposition/Photons" : {
+        "Mass Energy-Absorption" : (deposition_photons.mea_numerator,
+                                    deposition_photons.mea_denominator),
+        "Density" : (density_numerator, density_denominator)},
+    "Deposition/Electrons" : {
+        "Mass Stopping Power" : (stopping_numerator, deposition_electrons.sp_denominator),
+        "Density" : (density_numerator, density_denominator)},
+    "Deposition/Alphas" : {
+        "Mass Stopping Power" : (stopping_numerator, deposition_alphas.sp_denominator),
+        "Density" : (density_numerator, density_denominator)}
+}
+
+# Categories searched for an item when no category is provided
+item_categories = ["All Elements", "All Materials", "Custom Materials"]
+
+#####################################################################################
+# CALCULATIONS SECTION
+#####################################################################################
+
+"""
+This function finds the mass attenuation coefficients of an item
+(element or material) for photons at the given energies.
+If the units are inverse lengths (e.g., 1/cm), the linear attenuation
+coefficients are found instead.
+If multiple interactions are provided, their coefficients are summed.
+"""
+def attenuation(item, energies, interactions=None, units="cm\u00B2/g",
+                category=None, energy_unit="MeV"):
+    num, _ = parse_units(units)
+    mode = "Linear Attenuation Coefficient" if num == "1" else "Mass Attenuation Coefficient"
+    return calculate("Shielding/Photons", item, mode, energies, units=units,
+                     interactions=interactions, category=category, energy_unit=energy_unit)
+
+"""
+This function finds the mass attenuation coefficients of several
+items at the given energies, as a matrix with one row per item and
+one column per energy.
+As with attenuation, inverse length units give the linear attenuation
+coefficients, and the coefficients of multiple interactions are summed.
+The category of each item is found if no categories are provided.
+"""
+def attenuation_matrix(items, energies, interactions=None, units="cm\u00B2/g",
+                       categories=None, energy_unit="MeV"):
+    num, _ = parse_units(units)
+    mode = "Linear Attenuation Coefficient" if num == "1" else "Mass Attenuation Coefficient"
+
+    # Error-check for unknown items, a non-number energy input,
+    # and unknown units or interactions
+    categories = find_categories(items, categories)
+    energy_targets = read_energies(energies, energy_unit)
+    num, den = read_units("Shielding/Photons", mode, units)
+    interactions = read_interactions("Shielding/Photons", interactions)
+    return shielding_photons.find_results_matrix(categories, mode, interactions, items,
+                                                 energy_targets, num, den)
+
+"""
+This function finds the narrow-beam transmission of photons through
+a stack of layers at the given energies.
+Each layer is an (item, thickness) pair, or an (item, thickness, category)
+tuple, in the order the beam crosses them, with the thickness in
+length_unit. A layer's thickness can be an array to sweep over
+(see find_transmission in the Shielding/Photons calculations).
+If multiple interactions are provided, their coefficients are summed.
+"""
+def transmission(layers, energies, interactions=None, length_unit="cm", energy_unit="MeV"):
+    # Error-check for unknown items, an unknown length unit,
+    # and a non-number energy input
+    stack = read_layers(layers)
+    read_length_unit(length_unit)
+    energy_targets = read_energies(energies, energy_unit)
+    interactions = read_interactions("Shielding/Photons", interactions)
+    try:
+        return shielding_photons.find_transmission(stack, interactions, energy_targets,
+                                                   length_unit)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data")
+
+"""
+This function finds the narrow-beam transmission of an isotope's photon
+lines (gamma rays, X-rays, and annihilation photons) through a stack of
+layers (see transmission), weighted by the yield of every line.
+If progeny is True, the lines of the isotope's progeny at equilibrium
+are included.
+The results are those of find_spectrum_transmission in the
+Shielding/Photons calculations, along with the nuclide, energy (MeV),
+and yield of every line.
+The function handles the following errors by raising a CalculationError:
+   Unknown isotope
+   Isotope without photon lines in the photon data
+"""
+def spectrum_transmission(isotope, layers, progeny=False, interactions=None, length_unit="cm"):
+    # Error-check for unknown items and an unknown length unit
+    stack = read_layers(layers)
+    read_length_unit(length_unit)
+
+    # Error-check for an unknown isotope
+    lines = get_photon_lines(isotope, progeny)
+    if lines is None:
+        raise CalculationError("unknown_item", isotope)
+
+    interactions = read_interactions("Shielding/Photons", interactions)
+    try:
+        results = shielding_photons.find_spectrum_transmission(stack, interactions,
+                                                               lines["energy"], lines["yield"],
+                                                               length_unit)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data")
+
+    # Error-check for no photon lines in the photon data
+    if not np.any(results["errors"] == ""):
+        raise CalculationError("no_data", isotope)
+    return dict(results, **lines)
+
+"""
+This function finds the air-kerma rate constant of an isotope, the
+air-kerma rate at 1 m from a point source of unit activity, from the
+precomputed air-kerma table (see kerma_store).
+The cutoff (MeV) leaves out the photons below it; it must be one of the
+cutoffs of the table. If progeny is True, the constants of the isotope's
+progeny at equilibrium are added, weighted by their activity per decay
+of the isotope.
+The function handles the following errors by raising a CalculationError:
+   Unknown isotope
+   Unknown energy cutoff or units
+"""
+def air_kerma_constant(isotope, cutoff=0.0, units="mGy m\u00B2/(GBq h)", progeny=False):
+    table = get_kerma_table()
+
+    # Error-check for an unknown isotope
+    if isotope not in table["nuclides"]:
+        raise CalculationError("unknown_item", isotope)
+    row = read_kerma_units(cutoff, units)
+
+    ratios = get_equilibrium_ratios(isotope) if progeny else {isotope : 1.0}
+    constant = sum(ratio * table["values"][row, table["nuclides"][nuclide]]
+                   for nuclide, ratio in ratios.items() if nuclide in table["nuclides"])
+    return float(constant) * kerma_units[units]
+
+"""
+This function returns the air-kerma rate constant of every isotope
+in the precomputed air-kerma table, as a dictionary keyed by isotope.
+As with air_kerma_constant, the cutoff must be one of the cutoffs of
+the table.
+"""
+def air_kerma_table(cutoff=0.0, units="mGy m\u00B2/(GBq h)"):
+    table = get_kerma_table()
+    row = read_kerma_units(cutoff, units)
+    values = table["values"][row] * kerma_units[units]
+    return {nuclide : float(values[column]) for nuclide, column in table["nuclides"].items()}
+
+"""
+This function finds the thickness of shielding needed for a target
+narrow-beam transmission of photons, for several items at the given
+energies, in length_unit.
+Without weights, the results are a matrix with one row per item and one
+column per energy. With weights (e.g., the yields of a spectrum's lines),
+a single thickness is found for every item, for which the weighted mean
+of the transmissions at every energy equals the target.
+If layers are provided (see transmission), they are crossed before the
+shielding, and the thickness added to them is found.
+The category of each item is found if no categories are provided.
+"""
+def shield_thickness(items, energies, transmission=1e-3, weights=None, layers=None,
+                     interactions=None, length_unit="cm", categories=None, energy_unit="MeV"):
+    # Error-check for unknown items, an unknown length unit,
+    # and a non-number energy input
+    categories = find_categories(items, categories)
+    stack = read_layers(layers) if layers else []
+    read_length_unit(length_unit)
+    energy_targets = read_energies(energies, energy_unit)
+    weights = read_weights(weights, energy_targets)
+
+    # Error-check for a non-number transmission or one outside of (0, 1]
+    try:
+        transmission = float(transmission)
+    except (TypeError, ValueError):
+        raise CalculationError("non_number_input", transmission)
+    if not 0 < transmission <= 1:
+        raise CalculationError("invalid_transmission", transmission)
+
+    interactions = read_interactions("Shielding/Photons", interactions)
+    try:
+        return shielding_photons.find_thickness_matrix(categories, interactions, items,
+                                                       energy_targets, transmission,
+                                                       length_unit, weights, stack)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data")
+
+"""
+This function finds the half-value layers of several items at the given
+energies, in length_unit. The tenth-value layers are the secondary results.
+As with shield_thickness, weights give a single half-value and tenth-value
+layer for every item's spectrum.
+"""
+def value_layers(items, energies, weights=None, interactions=None, length_unit="cm",
+                 categories=None, energy_unit="MeV"):
+    # Error-check for unknown items, an unknown length unit,
+    # and a non-number energy input
+    categories = find_categories(items, categories)
+    read_length_unit(length_unit)
+    energy_targets = read_energies(energies, energy_unit)
+    weights = read_weights(weights, energy_targets)
+
+    interactions = read_interactions("Shielding/Photons", interactions)
+    try:
+        return shielding_photons.find_value_layers(categories, interactions, items,
+                                                   energy_targets, length_unit, weights)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data")
+
+"""
+This function finds the mass energy-absorption coefficients of an
+item for photons at the given energies.
+"""
+def energy_absorption(item, energies, units="cm\u00B2/g", category=None, energy_unit="MeV"):
+    return calculate("Deposition/Photons", item, "Mass Energy-Absorption", energies,
+                     units=units, category=category, energy_unit=energy_unit)
+
+"""
+This function finds the mass stopping powers of an item for electrons
+or alphas at the given energies. The linear stopping powers are the
+secondary results.
+If multiple interactions are provided, their stopping powers are summed.
+"""
+def stopping_power(item, energies, particle="Electrons", interactions=None,
+                   units="MeV * cm\u00B2/g", category=None, energy_unit="MeV"):
+    return calculate("Deposition/" + particle, item, "Mass Stopping Power", energies,
+                     units=units, interactions=interactions, category=category,
+                     energy_unit=energy_unit)
+
+"""
+This function finds the CSDA ranges of an item for electrons or
+alphas at the given energies. The ranges as lengths are the
+secondary results.
+"""
+def csda_range(item, energies, particle="Electrons", units="g/cm\u00B2",
+               category=None, energy_unit="MeV"):
+    return calculate("Shielding/" + particle, item, "CSDA Range", energies,
+                     units=units, category=category, energy_unit=energy_unit)
+
+"""
+This function finds the energies of electrons or alphas whose CSDA range
+in an item equals the given ranges, i.e., the energies needed to
+penetrate those depths. The ranges are mass thicknesses (e.g., g/cm2)
+or lengths (e.g., cm), and the energies are in energy_unit.
+"""
+def csda_energy(item, ranges, particle="Electrons", units="g/cm\u00B2",
+                category=None, energy_unit="MeV"):
+    # Error-check for an unknown item or particle, non-number ranges,
+    # and unknown units
+    category = find_categories([item], category and [category])[0]
+    read_range_particle(particle)
+    range_targets = read_mass_thickness(ranges, units, category, item)
+    read_energies(0.0, energy_unit)
+
+    try:
+        energies, low, high = find_energy_array(category, item, range_targets, particle)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data", item)
+    return Results(energies / energy_units[energy_unit], error_codes(low, high), energy_unit)
+
+"""
+This function finds the residual energies of electrons or alphas after
+crossing a slab of an item, at the given energies, in the continuous
+slowing-down approximation. The thickness is a mass thickness (e.g.,
+g/cm2) or a length (e.g., cm), as a single value or one value per
+energy. Particles that are stopped in the slab have a residual energy
+of zero.
+"""
+def residual_energy(item, energies, thickness, particle="Electrons", units="g/cm\u00B2",
+                    category=None, energy_unit="MeV"):
+    # Error-check for an unknown item or particle, a non-number thickness,
+    # unknown units, and a non-number energy input
+    category = find_categories([item], category and [category])[0]
+    read_range_particle(particle)
+    thickness = read_mass_thickness(thickness, units, category, item)
+    energy_targets = read_energies(energies, energy_unit)
+
+    try:
+        residual, low, high = find_residual_energy_array(category, item, energy_targets,
+                                                         thickness, particle)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data", item)
+    return Results(residual / energy_units[energy_unit], error_codes(low, high), energy_unit)
+
+"""
+This function steps electrons or alphas through a stack of slabs (e.g., a
+detector window and dead layer) at the given energies at once, by
+integrating the total stopping power of each slab.
+Each layer is an (item, thickness) pair, or an (item, thickness, category)
+tuple, in the order the particles cross them. The thicknesses are mass
+thicknesses (e.g., g/cm2) or lengths (e.g., cm), as a single value or one
+value per energy.
+The results are those of find_slab_energies in range_store, with the
+energies in energy_unit.
+The function handles the following errors by raising a CalculationError:
+   Unknown item or particle
+   Non-number, negative, or non-finite thickness
+   Unknown units
+   Non-number energy input
+   No data for an item
+"""
+def slab_energies(layers, energies, particle="Electrons", units="g/cm\u00B2", energy_unit="MeV"):
+    # Error-check for unknown items or particle, invalid thicknesses (in
+    # read_layers and again as mass thicknesses), unknown units, and a
+    # non-number energy input
+    read_range_particle(particle)
+    stack = [(category, item, read_mass_thickness(thickness, units, category, item))
+             for category, item, thickness in read_layers(layers)]
+    energy_targets = read_energies(energies, energy_unit)
+
+    try:
+        results = find_slab_energies(stack, energy_targets, particle)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data")
+    for key in ["exit_energy", "energy_lost", "deposited"]:
+        results[key] = results[key] / energy_units[energy_unit]
+    return results
+
+"""
+This function finds the density of an item.
+A CalculationError is raised if the item has no numeric density
+(e.g., a density that is a function of altitude).
+"""
+def density(item, units="g/cm\u00B3", category=None):
+    return float(calculate("Shielding/Photons", item, "Density", [0.0], units=units,
+                           category=category).values[0])
+
+"""
+This function performs any calculation of a module (e.g., Shielding/Photons)
+for an item at the given energies, as in the app.
+If no units or energy unit are provided, the ones from the user prefs
+are used, as in the app. Units are written as numerator/denominator
+(see parse_units).
+The function handles the following errors by raising a CalculationError:
+   Unknown module
+   No selected item or unknown item
+   Unknown mode
+   Non-number energy input
+   Unknown units or interactions
+   No data for the item (e.g., an element of a material without data,
+   or a density that is not a number)
+"""
+def calculate(module, item, mode, energies, units=None, interactions=None,
+              category=None, energy_unit=None):
+    # Error-check for an unknown module
+    if module not in modules:
+        raise CalculationError("unknown_module", module)
+    calculations, default_interactions = modules[module]
+
+    # Error-check for no selected item and unknown item
+    if item == "":
+        raise CalculationError("no_selection")
+    category = category or find_category(item)
+    if category is None or item not in get_density_index(category):
+        raise CalculationError("unknown_item", item)
+
+    # Error-check for an unknown mode
+    if mode not in calculations.mode_choices:
+        raise CalculationError("unknown_mode", mode)
+    num, den, saved_energy_unit = calculations.get_units(mode)
+    energy_unit = energy_unit or saved_energy_unit
+
+    # Error-check for a non-number energy input
+    energy_targets = read_energies(energies, energy_unit)
+
+    # Error-check for unknown units (modes without units ignore them)
+    if units and num != "":
+        num, den = read_units(module, mode, units)
+
+    # Error-check for unknown interactions
+    args = [category, mode, item, energy_targets, num, den]
+    if default_interactions is not None:
+        args.insert(2, read_interactions(module, interactions))
+
+    # Error-check for missing data (element data file, column, or a
+    # density that is not a number)
+    try:
+        return calculations.find_results(*args)
+    except (OSError, KeyError, ValueError):
+        raise CalculationError("no_data", item)
+
+"""
+This function finds the amounts of every member of an isotope's decay
+chain at every time in times, starting from initial_amount of the
+isotope. The chain's Bateman solution is only factored once, so that any
+number of times is a single matrix product.
+The amounts and times are in the units of radioactivedecay (e.g., Bq, Ci,
+g, mol, num, and s, d, y). The results are in output_unit, or in
+amount_unit if no output unit is provided.
+It returns the members of the chain along with a 2-D array of the
+amounts, with one row per member and one column per time.
+The function handles the following errors by raising a CalculationError:
+   Unknown isotope
+   Unknown units
+   Activity of a stable isotope
+   Non-number, non-finite, or negative time
+"""
+def decay_series(isotope, initial_amount, times, amount_unit="Bq", time_unit="s",
+                 output_unit=None):
+    chain = read_chain(isotope)
+    read_time_unit(time_unit)
+    for unit in [amount_unit, output_unit or amount_unit]:
+        try:
+            amount_per_atom(chain, unit)
+        except ValueError:
+            raise CalculationError("unknown_units", unit)
+    if amount_per_atom(chain, amount_unit)[0] == 0:
+        raise CalculationError("stable_isotope", isotope)
+
+    # Error-check for non-number and negative times, as in the app, so that
+    # the decay is never run backwards
+    try:
+        times = np.asarray(times, dtype=float)
+    except (TypeError, ValueError):
+        raise CalculationError("non_number_input", times)
+    if not np.all(np.isfinite(times)):
+        raise CalculationError("non_number_input", times)
+    if np.any(times < 0):
+        raise CalculationError("negative_time", times)
+    return chain_decay_series(isotope, initial_amount, times, amount_unit, time_unit,
+                              output_unit)
+
+#####################################################################################
+# INPUTS SECTION
+#####################################################################################
+
+"""
+This function finds the category of an item by searching
+the elements, the materials, and then the custom materials.
+None is returned if the item is not in any of them.
+"""
+def find_category(item):
+    for category in item_categories:
+        if item in get_density_index(category):
+            return category
+    return None
+
+"""
+This function finds the category of every item, unless categories
+are provided.
+A CalculationError is raised if an item is not in its category.
+"""
+def find_categories(items, categories=None):
+    if categories is None:
+        categories = [find_category(item) for item in items]
+    for item, category in zip(items, categories):
+        if category is None or item not in get_density_index(category):
+            raise CalculationError("unknown_item", item)
+    return categories
+
+"""
+This function converts units written as numerator/denominator (see
+parse_units) and checks that they are unit choices of a mode of a module.
+A CalculationError is raised otherwise.
+"""
+def read_units(module, mode, units):
+    num, den = parse_units(units)
+    numerators, denominators = unit_choices[module][mode]
+    if num not in numerators or den not in denominators:
+        raise CalculationError("unknown_units", units)
+    return num, den
+
+"""
+This function returns the interactions of a calculation, or the default
+interactions of the module if no interactions are provided.
+A CalculationError is raised if an interaction is not one of the
+interaction choices of the module.
+"""
+def read_interactions(module, interactions):
+    interactions = list(interactions or modules[module][1])
+    for interaction in interactions:
+        if interaction not in interaction_choices[module]:
+            raise CalculationError("unknown_interaction", interaction)
+    return interactions
+
+"""
+This function converts layers written as (item, thickness) pairs or
+(item, thickness, category) tuples into (category, item, thickness)
+tuples, finding the category of each item if it is not provided.
+The function handles the following errors by raising a CalculationError:
+   No layers
+   Unknown item
+   Non-number thickness
+   Negative or non-finite thickness
+"""
+def read_layers(layers):
+    layers = list(layers)
+    if not layers:
+        raise CalculationError("no_layers")
+
+    stack = []
+    for layer in layers:
+        item, thickness = layer[0], layer[1]
+        category = find_categories([item], [layer[2]] if len(layer) > 2 else None)[0]
+        stack.append((category, item, read_thickness(thickness)))
+    return stack
+
+"""
+This function converts one or more thicknesses into an array.
+The function handles the following errors by raising a CalculationError:
+   Non-number thickness
+   Negative or non-finite thickness
+"""
+def read_thickness(thickness):
+    try:
+        values = np.asarray(thickness, dtype=float)
+    except (TypeError, ValueError):
+        raise CalculationError("non_number_input", thickness)
+    if not np.all(np.isfinite(values) & (values >= 0)):
+        raise CalculationError("invalid_thickness", thickness)
+    return values
+
+"""
+This function checks that a particle has CSDA range data.
+A CalculationError is raised otherwise.
+"""
+def read_range_particle(particle):
+    if particle not in ["Electrons", "Alphas"]:
+        raise CalculationError("unknown_module", particle)
+
+"""
+This function converts ranges or thicknesses of an item into mass
+thicknesses in g/cm\u00B2, to comply with the raw data. The units are
+either a mass per area (e.g., g/cm2, mg/cm2) or a length (e.g., cm, mm),
+which is converted with the density of the item.
+The function handles the following errors by raising a CalculationError:
+   Non-number input
+   Negative or non-finite input
+   Unknown units
+   No numeric density for a length
+"""
+def read_mass_thickness(values, units, category, item):
+    values = read_thickness(values)
+
+    if "/" not in units:
+        read_length_unit(units)
+        try:
+            item_density = find_density(category, item)
+        except ValueError:
+            raise CalculationError("no_data", item)
+        return values / shielding_photons.lac_denominator[units] * item_density
+
+    num, den = parse_units(units)
+    if num not in shielding_electrons.csda_numerator \
+            or den not in shielding_electrons.csda_denominator:
+        raise CalculationError("unknown_units", units)
+    return values * shielding_electrons.csda_denominator[den] \
+        / shielding_electrons.csda_numerator[num]
+
+"""
+This function returns the factored decay chain of an isotope.
+A CalculationError is raised if the isotope is unknown.
+"""
+def read_chain(isotope):
+    try:
+        return get_chain(isotope)
+    except ValueError:
+        raise CalculationError("unknown_item", isotope)
+
+"""
+This function checks that a time unit is one of the time units of
+radioactivedecay. A CalculationError is raised otherwise.
+"""
+def read_time_unit(time_unit):
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    if time_unit not in rd.converters.UnitConverterFloat.time_units:
+        raise CalculationError("unknown_units", time_unit)
+
+"""
+This function checks that a length unit is one of the unit choices
+of the app. A CalculationError is raised otherwise.
+"""
+def read_length_unit(length_unit):
+    if length_unit not in shielding_photons.lac_denominator:
+        raise CalculationError("unknown_units", length_unit)
+
+"""
+This function finds the row of an energy cutoff in the air-kerma
+table, after checking that the units are air-kerma units.
+A CalculationError is raised if the cutoff or units are unknown.
+"""
+def read_kerma_units(cutoff, units):
+    if cutoff not in kerma_cutoffs:
+        raise CalculationError("unknown_cutoff", cutoff)
+    if units not in kerma_units:
+        raise CalculationError("unknown_units", units)
+    return kerma_cutoffs.index(cutoff)
+
+"""
+This function converts the weights of a spectrum into an array with
+one weight per energy. None is returned if no weights are provided.
+A CalculationError is raised if the weights are not numbers, do not
+match the energies, or are negative, non-finite, or all zero (a weighted
+mean cannot be taken over them).
+"""
+def read_weights(weights, energy_targets):
+    if weights is None:
+        return None
+    try:
+        weights = np.atleast_1d(np.asarray(weights, dtype=float))
+    except (TypeError, ValueError):
+        raise CalculationError("non_number_input", weights)
+    if weights.shape != energy_targets.shape:
+        raise CalculationError("mismatched_weights")
+    if not (np.all(np.isfinite(weights)) and np.all(weights >= 0) and weights.sum() > 0):
+        raise CalculationError("invalid_weights")
+    return weights
+
+"""
+This function converts one or more energies in the given energy
+unit to an array of energies in MeV, to comply with the raw data.
+The function handles the following errors by raising a CalculationError:
+   Non-number or non-finite energy input
+   Unknown energy unit
+"""
+def read_energies(energies, energy_unit):
+    try:
+        energy_targets = np.atleast_1d(np.asarray(energies, dtype=float))
+    except (TypeError, ValueError):
+        raise CalculationError("non_number")
+    if not np.all(np.isfinite(energy_targets)):
+        raise CalculationError("non_number")
+
+    if energy_unit not in energy_units:
+        raise CalculationError("unknown_units", energy_unit)
+    return energy_targets * energy_units[energy_unit]
+
+"""
+This function converts units written as numerator/denominator
+into the unit choices of the app, where powers are written as
+superscripts (e.g., cm2/g -> cm\u00B2 and g, 1/cm -> 1 and cm,
+MeV cm2/g -> MeV * cm\u00B2 and g).
+Inverse lengths can also be written as cm-1.
+A CalculationError is raised if the units cannot be read.
+"""
+def parse_units(units):
+    if "/" not in units:
+        match = re.fullmatch(r"([A-Za-z]+)\s*(?:\^?-1|\u207B\u00B9)", units.strip())
+        if match is None:
+            raise CalculationError("unknown_units", units)
+        return "1", match.group(1)
+
+    num, den = units.rsplit("/", 1)
+    num = " * ".join(superscript(part) for part in re.split(r"\s*\*\s*|\s+", num.strip()))
+    return num, superscript(den.strip())
+
+"""
+This function writes the power of a unit as a superscript.
+"""
+def superscript(unit):
+    return re.sub(r"([A-Za-z])\^?([23])$",
+                  lambda match: match.group(1) + {"2" : "\u00B2", "3" : "\u00B3"}[match.group(2)],
+                  unit)
\ No newline at end of file
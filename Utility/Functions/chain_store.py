@@ -0,0 +1,217 @@
+##### IMPORTS #####
+import os
+import importlib.util
+import numpy as np
+from Utility.Functions.compiled_data import open_index, write_index, source_stats
+
+#####################################################################################
+# CHAINS SECTION
+#####################################################################################
+
+# radioactivedecay solves the decay of an inventory as N(t) = C E(t) C^-1 N(0),
+# where C and its inverse hold the Bateman solution of every chain and E(t) is
+# the diagonal matrix of exp(-decay constant * t). The amount of each member of
+# an isotope's chain only depends on the isotope's column of C^-1 and on the
+# rows and columns of C of the chain's members. These are taken out of the
+# dataset once per isotope, so that the decay at any number of times is a
+# single product of small dense matrices.
+
+# Decay chains that have already been factored, keyed by isotope
+_chains = {}
+
+"""
+This function returns the factored decay chain of an isotope, as a
+dictionary with:
+   nuclides        -> members of the chain, starting with the isotope,
+                      in the order of the radioactivedecay dataset
+   decay_constants -> decay constant of each member (1/s)
+   atomic_masses   -> atomic mass of each member (g/mol)
+   matrix          -> rows and columns of C of the members
+   coefficients    -> isotope's column of C^-1, for the members
+A ValueError is raised if radioactivedecay has no data for the isotope.
+"""
+def get_chain(isotope):
+    chain = _chains.get(isotope)
+    if chain is not None:
+        return chain
+
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    data = rd.DEFAULTDATA
+    matrices = data.scipy_data
+    column = data.nuclide_dict.get(isotope)
+    if column is None:
+        raise ValueError(isotope + " is not in the decay dataset.")
+
+    members = np.sort(matrices.matrix_c[:, column].nonzero()[0])
+    chain = {"nuclides" : [str(nuclide) for nuclide in data.nuclides[members]],
+             "decay_constants" : matrices.decay_consts[members],
+             "atomic_masses" : matrices.atomic_masses[members],
+             "matrix" : matrices.matrix_c[members][:, members].toarray(),
+             "coefficients" : matrices.matrix_c_inv[members, column].toarray().ravel()}
+    for value in chain.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+
+    _chains[isotope] = chain
+    return chain
+
+"""
+This function finds the number of atoms of every member of an isotope's
+chain at every time in times (s), starting from initial_number atoms of
+the isotope. The numbers are returned as a 2-D array with one row per
+member (see get_chain) and one column per time.
+"""
+def decay_numbers(isotope, initial_number, times):
+    chain = get_chain(isotope)
+    times = np.asarray(times, dtype=float)
+    exponentials = np.exp(-np.multiply.outer(chain["decay_constants"], times))
+    return chain["matrix"] @ (exponentials * (chain["coefficients"] * initial_number)[:, None])
+
+"""
+This function finds the amounts of every member of an isotope's chain at
+every time in times, starting from initial_amount of the isotope.
+The amounts and times are in the units of radioactivedecay (e.g., Bq, Ci,
+g, mol, num, and s, d, y). The results are in output_unit, or in
+amount_unit if no output unit is provided.
+It returns the members of the chain along with a 2-D array of the
+amounts, with one row per member and one column per time.
+A ValueError is raised for unknown isotopes or units.
+"""
+def decay_series(isotope, initial_amount, times, amount_unit="Bq", time_unit="s",
+                 output_unit=None):
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    chain = get_chain(isotope)
+    seconds = rd.converters.UnitConverterFloat.time_unit_conv(
+        np.asarray(times, dtype=float), time_unit, "s", rd.DEFAULTDATA.float_year_conv)
+
+    per_atom = amount_per_atom(chain, amount_unit)[0]
+    if per_atom == 0:
+        raise ValueError(isotope + " is stable, so its activity is always zero.")
+    numbers = decay_numbers(isotope, initial_amount / per_atom, seconds)
+    return chain["nuclides"], numbers * amount_per_atom(chain, output_unit or amount_unit)[:, None]
+
+"""
+This function finds the amount of one atom of every member of a chain in
+a unit of activity, mass, moles, or number of atoms (num).
+A ValueError is raised if the unit is unknown.
+"""
+def amount_per_atom(chain, unit):
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    units = rd.converters.UnitConverterFloat
+    avogadro = rd.converters.QuantityConverterFloat.avogadro
+    match unit_type(unit):
+        case "Activity":
+            return chain["decay_constants"] / units.activity_units[unit]
+        case "Mass":
+            return chain["atomic_masses"] / avogadro / units.mass_units[unit]
+        case "Moles":
+            return np.full(len(chain["nuclides"]), 1 / avogadro / units.moles_units[unit])
+        case "Nuclei Number":
+            return np.ones(len(chain["nuclides"]))
+    raise ValueError(unit + " is not a unit of amount.")
+
+"""
+This function finds the type of amount (Activity, Mass, Moles, or
+Nuclei Number) measured in a unit, or None if the unit is unknown.
+"""
+def unit_type(unit):
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    units = rd.converters.UnitConverterFloat
+    if unit in units.activity_units:
+        return "Activity"
+    if unit in units.mass_units:
+        return "Mass"
+    if unit in units.moles_units:
+        return "Moles"
+    if unit == "num":
+        return "Nuclei Number"
+    return None
+
+#####################################################################################
+# GRAPH SECTION
+#####################################################################################
+
+# The decay chains of every nuclide of the radioactivedecay dataset form a
+# directed acyclic graph. It is kept as a dictionary keyed by nuclide, with:
+#    progeny    -> direct progeny (SF for spontaneous fission)
+#    fractions  -> branching fraction to each direct progeny
+#    modes      -> decay mode to each direct progeny
+#    successors -> every member of the nuclide's chain, the nuclide
+#                  included, in alphabetical order
+# The graph is compiled into Data/Compiled, so that it can be read without
+# importing radioactivedecay.
+
+# Decay dataset of radioactivedecay used for the graph
+graph_dataset = "icrp107_ame2020_nubase2020"
+
+# Decay graph once it has been opened or built
+_graph = {}
+
+"""
+This function returns the decay graph of every nuclide (see above).
+The compiled graph is used if it is available and not stale.
+Otherwise, it is built from radioactivedecay.
+"""
+def get_decay_graph():
+    graph = _graph.get("graph")
+    if graph is not None:
+        return graph
+
+    index = open_index('Radioactive Decay/Decay Graph', decay_graph_sources())
+    if index is not None and index["dataset"] == graph_dataset:
+        graph = index["nuclides"]
+    else:
+        graph = build_decay_graph()
+
+    _graph["graph"] = graph
+    return graph
+
+"""
+This function builds the decay graph of every nuclide from the
+radioactivedecay dataset. The successors of each nuclide are the
+members of its chain in the Bateman solution of radioactivedecay.
+"""
+def build_decay_graph():
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    data = rd.DEFAULTDATA
+    matrix = data.scipy_data.matrix_c.tocsc()
+    graph = {}
+    for i, nuclide in enumerate(data.nuclides):
+        members = matrix.indices[matrix.indptr[i]:matrix.indptr[i + 1]]
+        graph[str(nuclide)] = {"progeny" : [str(child) for child in data.progeny[i]],
+                               "fractions" : [float(fraction) for fraction in data.bfs[i]],
+                               "modes" : [str(mode) for mode in data.modes[i]],
+                               "successors" : sorted(str(member) for member
+                                                     in data.nuclides[members])}
+    return graph
+
+"""
+This function compiles the decay graph.
+"""
+def compile_decay_graph():
+    index = {"sources" : source_stats(decay_graph_sources()),
+             "dataset" : graph_dataset,
+             "nuclides" : build_decay_graph()}
+    write_index('Radioactive Decay/Decay Graph', index)
+    _graph.clear()
+
+"""
+This function returns the source file of the decay graph: the decay
+data of radioactivedecay. The module is located without importing it.
+"""
+def decay_graph_sources():
+    spec = importlib.util.find_spec("radioactivedecay")
+    if spec is None or spec.origin is None:
+        return {}
+    return {graph_dataset : os.path.join(os.path.dirname(spec.origin), graph_dataset,
+                                         "decay_data.npz")}
\ No newline at end of file
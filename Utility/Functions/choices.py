@@ -1,11 +1,8 @@
 ##### IMPORTS #####
 import csv
 import json
-import math
-import shelve
-from tkinter import IntVar
-import radioactivedecay as rd
 from Utility.Functions.files import resource_path, get_user_data_path
+from Utility.Functions.preferences import open_prefs
 
 # Choices using an element or a material
 element_choices = ["Common Elements", "All Elements"]
@@ -56,7 +53,7 @@ def get_choices(category, module, submodule):
 
     # Obtains list of items from shelve
     db_path = get_user_data_path(category)
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         default = []
         if category != "Custom Materials":
             # Obtains list of default items from csv file
@@ -113,10 +110,26 @@ def get_icrp_isotopes(element, publication):
 
 """
 Gets all successors of an isotope in a decay chain.
+The successors are read from the decay graph (see chain_store),
+in alphabetical order. Stable isotopes have no successors.
 """
 def get_successors(isotope):
-    if not isotope or math.isinf(rd.Nuclide(isotope).half_life()):
+    # Imported here since chain_store and nuclide_store are only needed
+    # for decay chains
+    from Utility.Functions.chain_store import get_decay_graph
+    from Utility.Functions.nuclide_store import get_nuclide
+
+    node = get_decay_graph().get(isotope)
+    if node is not None:
+        return list(node["successors"]) if node["progeny"] else []
+
+    if not isotope or get_nuclide(isotope)["stable"]:
         return []
+
+    # Imported here since radioactivedecay (and matplotlib with it) is slow
+    # to import and only needed for decay chains
+    import radioactivedecay as rd
+
     t0 = rd.Inventory({isotope: 0})
     t1 = t0.decay(0)
     activities_og = t1.activities()
@@ -129,6 +142,9 @@ def get_successors(isotope):
 Makes an IntVar for each successor of an isotope.
 """
 def get_nuclide_vars(isotope):
+    # Imported here so that the calculations can run without tkinter
+    from tkinter import IntVar
+
     # Gets successors of isotope
     successors = get_successors(isotope)
 
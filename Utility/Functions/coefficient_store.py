@@ -0,0 +1,112 @@
+##### IMPORTS #####
+import numpy as np
+from Utility.Functions.files import resource_path
+from Utility.Functions.compiled_data import open_nist, read_csv_table
+
+#####################################################################################
+# COLUMNS SECTION
+#####################################################################################
+
+# Name of the energy column in the raw data of each particle
+energy_columns = {"Photons" : "Photon Energy",
+                  "Electrons" : "Kinetic Energy",
+                  "Alphas" : "Alpha Energy"}
+
+#####################################################################################
+# ERRORS SECTION
+#####################################################################################
+
+"""
+This exception is raised when an item (element or material) has no
+data for a column, such as a material with an element whose data does
+not have that column. It is a KeyError, as the missing column was before.
+"""
+class MissingDataError(KeyError):
+    def __init__(self, item, column):
+        super().__init__(column)
+        self.item = item
+        self.column = column
+
+#####################################################################################
+# STORE SECTION
+#####################################################################################
+
+# Coefficient tables that have already been loaded, keyed by (particle, element)
+_tables = {}
+
+# Usable (energy, coefficient) arrays, keyed by (particle, element, column)
+_columns = {}
+
+"""
+This function returns the coefficient table of an element for the
+provided particle. The raw data is only parsed the first time the
+table is requested; afterwards it is served from memory.
+The table maps the energy column and every numeric coefficient column
+to a read-only NumPy array. Empty cells are stored as NaN.
+"""
+def get_table(element, particle):
+    key = (particle, element)
+    table = _tables.get(key)
+    if table is None:
+        table = load_table(element, particle)
+        _tables[key] = table
+    return table
+
+"""
+This function returns the energy grid and the coefficients of a
+single column of an element's data.
+Only the rows before the first empty cell of the column are kept,
+since the data stops there for that column.
+A MissingDataError is raised if the element has no data for the column.
+"""
+def get_column(element, column, particle):
+    key = (particle, element, column)
+    pair = _columns.get(key)
+    if pair is None:
+        table = get_table(element, particle)
+        if column not in table:
+            raise MissingDataError(element, column)
+        energies = table[energy_columns[particle]]
+        values = table[column]
+
+        # Finds first empty cell of the column
+        empty = np.flatnonzero(np.isnan(values))
+        end = empty[0] if len(empty) > 0 else len(values)
+
+        pair = (energies[:end], values[:end])
+        _columns[key] = pair
+    return pair
+
+"""
+This function returns the energy grid of an element's data.
+If a column is provided, only the energies with data in that
+column are returned.
+"""
+def get_energies(element, particle, column=None):
+    table = get_table(element, particle)
+    energies = table[energy_columns[particle]]
+    if column is None:
+        return energies
+    return energies[~np.isnan(table[column])]
+
+"""
+This function loads the raw data of an element into a table.
+If the NIST coefficients have been compiled, the columns are slices
+of the memory-mapped compiled data. Otherwise, the CSV file is parsed.
+"""
+def load_table(element, particle):
+    compiled = open_nist(particle)
+    if compiled is not None and element in compiled[1]["tables"]:
+        values, index = compiled
+        entry = index["tables"][element]
+        return {name : values[index["columns"].index(name), entry["start"]:entry["end"]]
+                for name in entry["columns"]}
+
+    db_path = resource_path('Data/NIST Coefficients/' + particle + '/Elements/' + element + '.csv')
+    _, table = read_csv_table(db_path)
+
+    # Prevents the shared arrays from being edited by callers
+    for column in table.values():
+        column.flags.writeable = False
+
+    return table
\ No newline at end of file
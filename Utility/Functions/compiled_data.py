@@ -0,0 +1,367 @@
+##### IMPORTS #####
+import os
+import csv
+import sys
+import json
+import numpy as np
+from Utility.Functions.files import resource_path
+
+#####################################################################################
+# FORMAT SECTION
+#####################################################################################
+
+# The reference data can be compiled into a binary format that is
+# memory-mapped at runtime instead of being parsed from the CSV files.
+# Every compiled dataset is stored in Data/Compiled as:
+#    <name>.npy         -> numeric values
+#    <name> <part>.npy  -> any additional arrays, such as the text
+#                          values of the ICRP tables (<name> Labels.npy)
+#    <name>.json        -> index with the columns, the row offsets of
+#                          each table, and the size and modification
+#                          time of each source file
+# A compiled dataset is only used if its source files have not
+# changed since it was compiled. Otherwise, the source files are used.
+
+# Folder holding the compiled datasets
+compiled_folder = 'Data/Compiled/'
+
+# Particles with NIST coefficient data
+nist_particles = ["Photons", "Electrons", "Alphas"]
+
+# Columns of the ICRP tables that hold text rather than coefficients
+icrp_label_columns = ["Nuclide", "Half Life", "Type", "f1"]
+
+# Fixes inconsistent column names across ICRP files
+icrp_column_aliases = {"Tye" : "Type"}
+
+# Compiled datasets that have already been opened, keyed by name
+_opened = {}
+
+# Tables that have already been read from a compiled dataset or built
+# from its source files, keyed by name and then by "compiled" (None if
+# not compiled, stale, or unusable) and "built"
+_tables = {}
+
+#####################################################################################
+# CSV SECTION
+#####################################################################################
+
+"""
+This function parses a CSV data file.
+It returns the header along with a dictionary mapping every numeric
+column to a NumPy array. Empty cells are stored as NaN and columns that
+are not numeric are skipped.
+"""
+def read_csv_table(path):
+    with open(path, 'r') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        rows = [row for row in reader if row]
+
+    table = {}
+    for index, name in enumerate(header):
+        try:
+            table[name] = np.array([float(row[index]) if row[index] else np.nan
+                                    for row in rows])
+        except ValueError:
+            continue
+
+    return header, table
+
+"""
+This function parses an ICRP coefficients CSV file.
+It returns the names of the text columns, a 2-D array of the text
+values, the names of the coefficient columns, and a 2-D array of the
+coefficients, with one row per row of the file.
+"""
+def read_icrp_csv(path):
+    with open(path, 'r') as file:
+        reader = csv.reader(file)
+        header = [icrp_column_aliases.get(name, name) for name in next(reader)]
+        rows = [row for row in reader if row]
+
+    label_indices = [i for i, name in enumerate(header) if name in icrp_label_columns]
+    value_indices = [i for i, name in enumerate(header) if name not in icrp_label_columns]
+
+    labels = np.array([[row[i] for i in label_indices] for row in rows], dtype=str)
+    values = np.array([[float(row[i]) for i in value_indices] for row in rows])
+    labels = labels.reshape(len(rows), len(label_indices))
+    values = values.reshape(len(rows), len(value_indices))
+
+    return ([header[i] for i in label_indices], labels,
+            [header[i] for i in value_indices], values)
+
+#####################################################################################
+# COMPILE SECTION
+#####################################################################################
+
+"""
+This function compiles every dataset.
+It is run as a build step before packaging the app, and can be
+run again at any time after the data has been edited.
+"""
+def compile_data():
+    for particle in nist_particles:
+        compile_nist(particle)
+
+    for publication in ["ICRP68", "ICRP72"]:
+        folder = resource_path('Data/ICRP Coefficients/' + publication)
+        for file_name in sorted(os.listdir(folder)):
+            name = file_name[:-4]
+            if file_name.endswith('.csv') and name.startswith(("Ingestion", "Inhalation")):
+                compile_icrp(publication, name)
+
+    # Imported here since material_store depends on this module
+    from Utility.Functions.material_store import compile_materials
+    for particle in nist_particles:
+        compile_materials(particle)
+
+    # Imported here since decay_store depends on this module
+    from Utility.Functions.decay_store import compile_energies, compile_radiations
+    compile_energies()
+    compile_radiations()
+
+    # Imported here since kerma_store depends on this module
+    from Utility.Functions.kerma_store import compile_kerma
+    compile_kerma()
+
+    # Imported here since chain_store depends on this module
+    from Utility.Functions.chain_store import compile_decay_graph
+    compile_decay_graph()
+
+    # Imported here since nuclide_store depends on this module
+    from Utility.Functions.nuclide_store import compile_nuclides
+    compile_nuclides()
+
+"""
+This function compiles the NIST coefficients of every element for
+a particle into a single dataset.
+The coefficients are stored column by column, so that each column
+of an element is a contiguous slice of the memory-mapped file.
+"""
+def compile_nist(particle):
+    sources = nist_sources(particle)
+
+    # Parses every element
+    tables = {}
+    for element, path in sources.items():
+        header, table = read_csv_table(path)
+        tables[element] = [name for name in header if name in table], table
+
+    # Lays out the elements one after another
+    columns = []
+    for names, _ in tables.values():
+        columns += [name for name in names if name not in columns]
+    total = sum(len(next(iter(table.values()))) for _, table in tables.values())
+    values = np.full((len(columns), total), np.nan)
+
+    entries = {}
+    start = 0
+    for element, (names, table) in tables.items():
+        end = start + len(table[names[0]])
+        for name in names:
+            values[columns.index(name), start:end] = table[name]
+        entries[element] = {"start" : start, "end" : end, "columns" : names}
+        start = end
+
+    index = {"sources" : source_stats(sources),
+             "columns" : columns,
+             "tables" : entries}
+    write_dataset('NIST Coefficients/' + particle, index, values)
+
+"""
+This function compiles a single ICRP coefficients table.
+"""
+def compile_icrp(publication, name):
+    sources = icrp_sources(publication, name)
+    label_columns, labels, columns, values = read_icrp_csv(sources[name])
+
+    index = {"sources" : source_stats(sources),
+             "labels" : label_columns,
+             "columns" : columns}
+    write_dataset('ICRP Coefficients/' + publication + '/' + name, index, values,
+                  {"Labels" : labels})
+
+"""
+This function writes the files of a compiled dataset.
+Any additional arrays are provided in a dictionary keyed by part name.
+The index is written last, so a dataset is never used before
+it has been fully written.
+"""
+def write_dataset(name, index, values, parts=None):
+    base_path = resource_path(compiled_folder + name)
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+
+    np.save(base_path + '.npy', values)
+    for part, array in (parts or {}).items():
+        np.save(base_path + ' ' + part + '.npy', array)
+    write_index(name, index)
+
+"""
+This function writes the index of a compiled dataset.
+Some datasets, such as the offsets into the Radioactive Decay
+energies files, only consist of an index.
+"""
+def write_index(name, index):
+    base_path = resource_path(compiled_folder + name)
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+
+    with open(base_path + '.json', 'w') as file:
+        json.dump(index, file)
+
+    _opened.pop(name, None)
+    _tables.pop(name, None)
+
+#####################################################################################
+# LOAD SECTION
+#####################################################################################
+
+"""
+This function opens the compiled NIST coefficients of a particle.
+It returns the memory-mapped coefficients and the index, or None if
+the dataset has not been compiled or is stale.
+"""
+def open_nist(particle):
+    name = 'NIST Coefficients/' + particle
+    if name in _opened:
+        return _opened[name]
+    return open_dataset(name, nist_sources(particle))
+
+"""
+This function returns an ICRP coefficients table.
+The compiled dataset is used if it is available and not stale.
+Otherwise, the CSV file is parsed.
+The result is the same as for read_icrp_csv.
+"""
+def read_icrp_table(publication, name):
+    sources = icrp_sources(publication, name)
+    compiled = open_dataset('ICRP Coefficients/' + publication + '/' + name,
+                            sources, ["Labels"])
+    if compiled is None:
+        return read_icrp_csv(sources[name])
+
+    values, index, labels = compiled
+    return index["labels"], labels, index["columns"], values
+
+"""
+This function returns a table that is either read from a compiled
+dataset or built from the dataset's source files. It is given functions
+that return the source files, read the table from the result of
+open_dataset (or return None if the compiled data cannot be used), and
+build the table.
+The compiled dataset is used if it is available and not stale.
+Otherwise, the table is built and kept in memory. If no build function
+is provided, None is returned instead, unless the table was already built.
+The table is only read or built once, until the dataset is compiled again.
+"""
+def get_table(name, sources, read, build=None, parts=()):
+    tables = _tables.setdefault(name, {})
+    if "compiled" not in tables:
+        compiled = open_dataset(name, sources(), parts)
+        tables["compiled"] = None if compiled is None else read(*compiled)
+
+    table = tables["compiled"] or tables.get("built")
+    if table is None and build is not None:
+        table = build()
+        tables["built"] = table
+    return table
+
+"""
+This function opens a compiled dataset given its source files.
+It returns the memory-mapped values, the index, and then the
+memory-mapped arrays of each of the provided parts.
+The result is stored so that the dataset is only opened once.
+"""
+def open_dataset(name, sources, parts=()):
+    if name in _opened:
+        return _opened[name]
+
+    compiled = None
+    base_path = resource_path(compiled_folder + name)
+    try:
+        with open(base_path + '.json', 'r') as file:
+            index = json.load(file)
+        if not is_stale(index, sources):
+            compiled = (load_array(base_path + '.npy'), index)
+            for part in parts:
+                compiled += (load_array(base_path + ' ' + part + '.npy'),)
+    except (OSError, ValueError):
+        compiled = None
+
+    _opened[name] = compiled
+    return compiled
+
+"""
+This function memory-maps an array of a compiled dataset.
+The array is returned as a regular NumPy array that still reads
+from the file, since indexing a memory-mapped array is much slower.
+"""
+def load_array(path):
+    return np.load(path, mmap_mode='r').view(np.ndarray)
+
+"""
+This function opens the index of a compiled dataset that only
+consists of an index. It returns None if the dataset has not been
+compiled or is stale.
+The result is stored so that the index is only opened once.
+"""
+def open_index(name, sources):
+    if name in _opened:
+        return _opened[name]
+
+    index = None
+    base_path = resource_path(compiled_folder + name)
+    try:
+        with open(base_path + '.json', 'r') as file:
+            index = json.load(file)
+        if is_stale(index, sources):
+            index = None
+    except (OSError, ValueError):
+        index = None
+
+    _opened[name] = index
+    return index
+
+"""
+This function checks whether a compiled dataset is stale.
+A dataset is stale if any of its source files was added, removed,
+or modified since it was compiled.
+The data bundled in the executable cannot be modified, and its
+modification times are not preserved, so it is never stale.
+"""
+def is_stale(index, sources):
+    if getattr(sys, 'frozen', False):
+        return False
+    return index["sources"] != source_stats(sources)
+
+#####################################################################################
+# SOURCES SECTION
+#####################################################################################
+
+"""
+This function returns the NIST coefficient files of a particle,
+keyed by element.
+"""
+def nist_sources(particle):
+    folder = resource_path('Data/NIST Coefficients/' + particle + '/Elements')
+    return {file_name[:-4] : os.path.join(folder, file_name)
+            for file_name in sorted(os.listdir(folder)) if file_name.endswith('.csv')}
+
+"""
+This function returns the source file of an ICRP table, keyed by name.
+"""
+def icrp_sources(publication, name):
+    return {name : resource_path('Data/ICRP Coefficients/' + publication + '/' + name + '.csv')}
+
+"""
+This function returns the size and modification time of each source file.
+"""
+def source_stats(sources):
+    stats = {}
+    for key, path in sources.items():
+        stat = os.stat(path)
+        stats[key] = [stat.st_size, stat.st_mtime_ns]
+    return stats
+
+if __name__ == "__main__":
+    compile_data()
\ No newline at end of file
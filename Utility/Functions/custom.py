@@ -1,10 +1,11 @@
 ##### IMPORTS #####
 import io
 import csv
-import shelve
 import tkinter as tk
 from Utility.Functions.choices import get_choices
 from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.material_store import compile_custom_material
 from Utility.Functions.math_utility import density_numerator, density_denominator
 
 """
@@ -23,7 +24,8 @@ The function handles the following errors:
    Element weights do not sum to 1; select normalize to fix
 If there are no errors, the element weights input is cleaned up.
 Then, the material name is added to the list of Custom Materials in shelve.
-The material data is also stored in shelve, with the density converted to g/cm^3.
+The material data is also stored in shelve, with the density converted to g/cm^3,
+along with the material's coefficients compiled for each particle.
 Finally, the input boxes are cleared.
 """
 def add_custom(root, name_box, density_box, weights_box, error_label, normalize,
@@ -129,7 +131,7 @@ def add_custom(root, name_box, density_box, weights_box, error_label, normalize,
 
     # Add material name to list of Custom Materials
     db_path = get_user_data_path('Custom Materials')
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         choices = prefs.get("Custom Materials", [])
         if not name in choices:
             choices.append(name)
@@ -137,13 +139,16 @@ def add_custom(root, name_box, density_box, weights_box, error_label, normalize,
 
     # Save material data to shelve
     db_path2 = get_user_data_path('Custom Materials/_' + name)
-    with shelve.open(db_path2) as db:
+    with open_prefs(db_path2) as db:
         # Store name
         db[name] = csv_data
 
         # Convert density to g/cm^3 before storing
         db[name + '_Density'] = str(float(density) * density_denominator[d_den] / density_numerator[d_num])
 
+    # Compiles the material's coefficients
+    compile_custom_material(name)
+
     # Clear input boxes
     name_box.delete(0, tk.END)
     weights_box.delete("1.0", "end")
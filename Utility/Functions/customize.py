@@ -1,7 +1,7 @@
 ##### IMPORTS #####
-import shelve
 from Utility.Functions.gui_utility import get_width
 from Utility.Functions.files import get_user_data_path
+from Utility.Functions.preferences import open_prefs
 from Utility.Functions.logic_utility import valid_saved
 
 """
@@ -25,7 +25,7 @@ Finally, the non_common dropdown is updated accordingly.
 """
 def add_c(category, non_common, common, var, dropdown):
     db_path = get_user_data_path(category)
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         # Adds item to common
         item = var.get()
         if item == "":
@@ -50,7 +50,7 @@ Finally, the item is appended to the non_common list.
 """
 def remove_c(category, common, non_common, var, dropdown):
     db_path = get_user_data_path(category)
-    with shelve.open(db_path) as prefs:
+    with open_prefs(db_path) as prefs:
         # Removes item from common
         item = var.get()
         if item == "":
@@ -0,0 +1,350 @@
+##### IMPORTS #####
+import os
+import re
+import json
+import math
+import numpy as np
+from Utility.Functions.files import resource_path
+from Utility.Functions.compiled_data import get_table, open_index, write_dataset, \
+                                            write_index, source_stats
+from Utility.Functions.nuclide_store import get_nuclide
+
+#####################################################################################
+# ENERGIES SECTION
+#####################################################################################
+
+# Whitespace and separators between the entries of an energies file
+_separators = re.compile(r'[\s,:]*')
+
+"""
+This function returns the data of an isotope (half-life and radiations)
+from the energies file of its element, or None if there is no energies
+file for the element or the file has no data for the isotope.
+If the energies file has been indexed, only the isotope's part of the
+file is read and parsed. Otherwise, the whole file is parsed.
+"""
+def get_isotope_data(element, isotope):
+    db_path = energies_path(element)
+    if not os.path.isfile(db_path):
+        return None
+    index = open_index('Radioactive Decay/Energies/' + element, {element : db_path})
+    if index is None:
+        with open(db_path, 'r') as file:
+            return json.load(file).get(isotope)
+
+    offsets = index["isotopes"].get(isotope)
+    if offsets is None:
+        return None
+
+    start, end = offsets
+    with open(db_path, 'rb') as file:
+        file.seek(start)
+        return json.loads(file.read(end - start))
+
+"""
+This function finds the byte offsets of each isotope's data in the
+energies file of an element.
+The file is decoded as Latin-1 so that each character is one byte,
+which keeps the offsets valid for any encoding of the file.
+"""
+def index_energies(db_path):
+    with open(db_path, 'rb') as file:
+        text = file.read().decode('latin-1')
+
+    decoder = json.JSONDecoder()
+    offsets = {}
+
+    # Steps through each "isotope": {...} entry of the top-level object
+    position = _separators.match(text, text.index('{') + 1).end()
+    while text[position] != '}':
+        isotope, position = decoder.raw_decode(text, position)
+        start = _separators.match(text, position).end()
+        _, end = decoder.raw_decode(text, start)
+        offsets[isotope] = [start, end]
+        position = _separators.match(text, end).end()
+
+    return offsets
+
+"""
+This function indexes the energies file of every element.
+"""
+def compile_energies():
+    folder = resource_path('Data/Radioactive Decay/Energies')
+    for file_name in sorted(os.listdir(folder)):
+        if file_name.endswith('.json'):
+            element = file_name[:-5]
+            db_path = energies_path(element)
+            index = {"sources" : source_stats({element : db_path}),
+                     "isotopes" : index_energies(db_path)}
+            write_index('Radioactive Decay/Energies/' + element, index)
+
+"""
+This function returns the path to the energies file of an element.
+"""
+def energies_path(element):
+    return resource_path('Data/Radioactive Decay/Energies/' + element + '.json')
+
+"""
+This function returns the energies file of every element, keyed by element.
+"""
+def energies_sources():
+    folder = resource_path('Data/Radioactive Decay/Energies')
+    return {file_name[:-5] : os.path.join(folder, file_name)
+            for file_name in sorted(os.listdir(folder)) if file_name.endswith('.json')}
+
+#####################################################################################
+# RADIATIONS SECTION
+#####################################################################################
+
+# The radiation lines of every isotope are also kept in a single
+# columnar database, with one array per field of the lines:
+#    nuclide -> position of the isotope in the list of nuclides
+#    type    -> position of the radiation type in radiation_types
+#    yield   -> yield of the line
+#    energy  -> energy of the line (MeV)
+# The lines of each isotope are stored one after another, so that the
+# lines of an isotope are a slice of each array. The lines are also
+# indexed by energy through the order array, which sorts them by energy,
+# and the sorted energies, which are searched for energy ranges.
+
+# Radiation types found in the energies files
+radiation_types = [
+    "Gamma Ray", "Annihilation Photon",
+    "X-Ray", "Beta- Particle", "Beta+ Particle",
+    "Internal Conversion Electron", "Auger Electron",
+    "Alpha Particle", "Alpha Recoil Nucleus",
+    "Prompt Gamma Ray", "Delayed Gamma Ray",
+    "Fission Fragment", "Neutron", "Unknown"
+]
+
+# Name of the compiled radiation database
+radiations_dataset = 'Radioactive Decay/Radiations'
+
+# Parts of the compiled radiation database, in the order read by read_radiations
+radiations_parts = ["Nuclides", "Types", "Order", "Sorted Energies"]
+
+"""
+This function returns the radiation lines of an isotope as a dictionary
+mapping type, yield, and energy to arrays, or None if there is no data
+for the isotope.
+If the radiation database has been compiled, the arrays are slices
+of the memory-mapped database. Otherwise, the isotope's data is read
+from the energies file of its element.
+"""
+def get_radiation_lines(element, isotope):
+    database = get_table(radiations_dataset, energies_sources, read_radiations,
+                         parts=radiations_parts)
+    if database is not None:
+        offsets = database["offsets"].get(isotope)
+        if offsets is None:
+            return None
+        start, end = offsets
+        return {field : database[field][start:end] for field in ["type", "yield", "energy"]}
+
+    data = get_isotope_data(element, isotope)
+    if data is None:
+        return None
+    return radiation_columns(data["radiations"])
+
+"""
+This function finds the radiation lines of every isotope with an energy
+(MeV) between energy_low and energy_high, inclusively.
+The lines can be restricted to a list of radiation types and to yields
+greater than min_yield.
+It returns a dictionary mapping nuclide, type, yield, and energy to
+arrays, with the lines sorted by energy. The nuclides are names of
+isotopes, and the types are names of radiation types.
+"""
+def find_radiation_lines(energy_low, energy_high, rad_types=None, min_yield=0.0):
+    database = get_radiation_database()
+
+    # Binary search for the energy range
+    start = np.searchsorted(database["sorted"], energy_low, side='left')
+    end = np.searchsorted(database["sorted"], energy_high, side='right')
+    rows = database["order"][start:end]
+
+    # Applies type and yield filters
+    keep = database["yield"][rows] > min_yield
+    if rad_types is not None:
+        codes = [radiation_types.index(rad_type) for rad_type in rad_types]
+        keep &= np.isin(database["type"][rows], codes)
+    rows = rows[keep]
+
+    return {"nuclide" : np.array(database["nuclides"])[database["nuclide"][rows]],
+            "type" : np.array(radiation_types)[database["type"][rows]],
+            "yield" : database["yield"][rows],
+            "energy" : database["energy"][rows]}
+
+"""
+This function returns the radiation database.
+The compiled database is used if it is available and not stale.
+Otherwise, the database is built from the energies files and kept
+in memory.
+"""
+def get_radiation_database():
+    return get_table(radiations_dataset, energies_sources, read_radiations,
+                     build_radiation_database, radiations_parts)
+
+"""
+This function builds the radiation database from the energies files
+(see get_radiation_database).
+"""
+def build_radiation_database():
+    return radiation_database(*build_radiations())
+
+"""
+This function reads the radiation database from its compiled dataset.
+"""
+def read_radiations(values, index, nuclide, types, order, sorted_energies):
+    return {"nuclides" : index["nuclides"],
+            "offsets" : index["offsets"],
+            "nuclide" : nuclide,
+            "type" : types,
+            "yield" : values[0],
+            "energy" : values[1],
+            "order" : order,
+            "sorted" : sorted_energies}
+
+"""
+This function converts a list of radiations from an energies file
+into arrays of their types, yields, and energies.
+"""
+def radiation_columns(radiations):
+    return {"type" : np.array([radiation_types.index(rad["type"]) for rad in radiations],
+                              dtype=np.int8),
+            "yield" : np.array([rad["yield"] for rad in radiations], dtype=float),
+            "energy" : np.array([rad["energy_MeV"] for rad in radiations], dtype=float)}
+
+"""
+This function parses every energies file into the columns of the
+radiation database.
+It returns the list of nuclides, the offsets of each nuclide's lines,
+and the columns.
+"""
+def build_radiations():
+    nuclides = []
+    offsets = {}
+    parts = []
+    start = 0
+    for element, db_path in energies_sources().items():
+        with open(db_path, 'r') as file:
+            data = json.load(file)
+        for isotope, isotope_data in data.items():
+            columns = radiation_columns(isotope_data["radiations"])
+            columns["nuclide"] = np.full(len(columns["type"]), len(nuclides), dtype=np.int32)
+            end = start + len(columns["type"])
+            nuclides.append(isotope)
+            offsets[isotope] = [start, end]
+            parts.append(columns)
+            start = end
+
+    columns = {field : np.concatenate([part[field] for part in parts])
+               for field in ["nuclide", "type", "yield", "energy"]}
+    return nuclides, offsets, columns
+
+"""
+This function adds the energy index to the columns of the radiation
+database. A stable sort keeps lines of equal energy in database order.
+"""
+def radiation_database(nuclides, offsets, columns):
+    order = np.argsort(columns["energy"], kind='stable').astype(np.int32)
+    return dict(columns, nuclides=nuclides, offsets=offsets,
+                order=order, sorted=columns["energy"][order])
+
+"""
+This function compiles the radiation database.
+"""
+def compile_radiations():
+    database = build_radiation_database()
+
+    index = {"sources" : source_stats(energies_sources()),
+             "nuclides" : database["nuclides"],
+             "offsets" : database["offsets"]}
+    write_dataset(radiations_dataset, index,
+                  np.array([database["yield"], database["energy"]]),
+                  {"Nuclides" : database["nuclide"],
+                   "Types" : database["type"],
+                   "Order" : database["order"],
+                   "Sorted Energies" : database["sorted"]})
+
+#####################################################################################
+# SPECTRA SECTION
+#####################################################################################
+
+# Radiation types that are photons
+photon_types = ["Gamma Ray", "Annihilation Photon", "X-Ray",
+                "Prompt Gamma Ray", "Delayed Gamma Ray"]
+
+# Equilibrium activity ratios that have already been found, keyed by isotope
+_equilibria = {}
+
+"""
+This function returns the photon lines of an isotope as a dictionary
+mapping nuclide, yield (per decay of the isotope), and energy (MeV) to
+arrays, or None if there is no data for the isotope.
+If progeny is True, the lines of the isotope's progeny at equilibrium
+are included, with their yields scaled by the activity of the progeny
+per decay of the isotope (see get_equilibrium_ratios).
+"""
+def get_photon_lines(isotope, progeny=False):
+    if get_radiation_lines(isotope.split("-")[0], isotope) is None:
+        return None
+    ratios = get_equilibrium_ratios(isotope) if progeny else {isotope : 1.0}
+    photon_codes = [radiation_types.index(rad_type) for rad_type in photon_types]
+
+    nuclides, yields, energies = [], [], []
+    for nuclide, ratio in ratios.items():
+        # Progeny without data are left out
+        lines = get_radiation_lines(nuclide.split("-")[0], nuclide)
+        if lines is None:
+            continue
+        keep = np.isin(lines["type"], photon_codes)
+        nuclides.append(np.full(np.count_nonzero(keep), nuclide))
+        yields.append(lines["yield"][keep] * ratio)
+        energies.append(lines["energy"][keep])
+
+    return {"nuclide" : np.concatenate(nuclides),
+            "yield" : np.concatenate(yields),
+            "energy" : np.concatenate(energies)}
+
+"""
+This function finds the activity of each member of an isotope's decay
+chain per unit activity of the isotope, once the chain has reached
+equilibrium (secular or transient). The ratio of each member is the sum,
+over every path from the isotope, of the product of the branching fraction
+and the factor decay_constant / (decay_constant - parent_decay_constant)
+of each step. Members that outlive the isotope never reach equilibrium,
+so they and their progeny are left out, as are stable members.
+Isotopes unknown to radioactivedecay have no progeny.
+The ratios are returned as a dictionary keyed by nuclide, starting with
+the isotope itself.
+"""
+def get_equilibrium_ratios(isotope):
+    ratios = _equilibria.get(isotope)
+    if ratios is not None:
+        return dict(ratios)
+
+    ratios = {isotope : 1.0}
+    try:
+        parent_constant = math.log(2) / get_nuclide(isotope)["half_life"]
+    except ValueError:
+        paths = []
+    else:
+        paths = [(isotope, 1.0)]
+    while paths:
+        nuclide, ratio = paths.pop()
+        member = get_nuclide(nuclide)
+        for daughter, fraction in zip(member["progeny"], member["fractions"]):
+            # Spontaneous fission has no nuclide
+            try:
+                constant = math.log(2) / get_nuclide(daughter)["half_life"]
+            except ValueError:
+                continue
+            if constant <= parent_constant:
+                continue
+            daughter_ratio = ratio * fraction * constant / (constant - parent_constant)
+            ratios[daughter] = ratios.get(daughter, 0.0) + float(daughter_ratio)
+            paths.append((daughter, daughter_ratio))
+
+    _equilibria[isotope] = ratios
+    return dict(ratios)
\ No newline at end of file
@@ -4,8 +4,7 @@ import sys
 import platform
 import subprocess
 from pathlib import Path
-from tkinter.filedialog import asksaveasfilename
-from Utility.Functions.gui_utility import edit_result
+from Utility.Functions.result_utility import edit_result
 
 #####################################################################################
 # OPEN SECTION
@@ -34,11 +33,15 @@ def resource_path(relative_path):
     base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
     return os.path.join(base_path, relative_path)
 
+# User data folders that have already been created
+_user_data_dirs = set()
+
 """
 This function finds the true path to user data given the relative path.
 Used for opening a shelve db file.
 This function is necessary due to potential path differences depending
 on whether you are running in an IDE/terminal or an executable.
+The folders are only created the first time they are needed.
 """
 def get_user_data_path(relative_path):
     # Base folder: next to script/executable
@@ -55,10 +58,10 @@ def get_user_data_path(relative_path):
         if ".app" in str(exe_dir):
             user_data_dir = Path.home() / "Library" / "Application Support" / "MyApp" / "UserData"
 
-    user_data_dir.mkdir(parents=True, exist_ok=True)
-
     full_path = user_data_dir / relative_path
-    full_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure subdirectories exist
+    if full_path.parent not in _user_data_dirs:
+        full_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure subdirectories exist
+        _user_data_dirs.add(full_path.parent)
     return str(full_path)
 
 """
@@ -98,6 +101,9 @@ def save_file(obj, choice, error_label, item, name, box = False):
     if choice == "Plot":
         file_format = ".png"
 
+    # Imported here so that the calculations can run without tkinter
+    from tkinter.filedialog import asksaveasfilename
+
     # Show the "Save As" dialog
     file_path = asksaveasfilename(
         defaultextension=file_format,
@@ -4,44 +4,14 @@ import tkinter as tk
 from tkinter import ttk
 import tkinter.font as font
 from Utility.Functions.logic_utility import valid_saved
-
-#####################################################################################
-# ERRORS SECTION
-#####################################################################################
-
-### ERROR MESSAGES ###
-no_selection = "Error: No selected item."
-non_number = "Error: Non-number energy input."
-too_low = "Error: Energy too low."
-too_high = "Error: Energy too high."
-errors = [no_selection, non_number, too_low, too_high]
+from Utility.Functions.result_utility import (
+    no_selection, non_number, too_low, too_high, errors, edit_result
+)
 
 #####################################################################################
 # GUI SECTION
 #####################################################################################
 
-"""
-This function edits the contents of the result label.
-The label needs to be enabled at the start and disabled
-at the end in order to prevent the user from being able
-to input text.
-The previous results are cleared and then the new
-results are inserted. If the text being displayed is not
-an error, the unit is assed to the end.
-"""
-def edit_result(result, result_box, num="", den=""):
-    # Clears result label and inserts new result
-    result_box.config(state="normal")
-    result_box.delete("1.0", tk.END)
-    result_box.insert(tk.END, result)
-    unit = num + "/" + den
-    if num == "1":
-        unit = den + "\u207B\u00B9"
-    if not result in errors and num != "":
-        result_box.insert(tk.END, " ")
-        result_box.insert(tk.END, unit)
-    result_box.config(state="disabled")
-
 """
 This function makes an empty "spacer" frame with y-padding.
 This is used to control the space between sections.
@@ -93,9 +63,13 @@ def make_unit_dropdown(frame, var, choices, on_select):
 
 """
 This function makes a Combobox dropdown for export options.
+The Matrix option exports every item of the category at once,
+and is only offered by the modules that support it.
 """
-def make_export_dropdown(frame, var, on_select):
+def make_export_dropdown(frame, var, on_select, matrix=False):
     export_choices = ["Plot", "Data"]
+    if matrix:
+        export_choices.append("Matrix")
     return make_dropdown(frame, var, export_choices, on_select)
 
 """
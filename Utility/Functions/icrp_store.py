@@ -0,0 +1,177 @@
+##### IMPORTS #####
+import numpy as np
+from Utility.Functions.compiled_data import read_icrp_table
+from Utility.Functions.logic_utility import icrp_72_nuclide_alias
+
+#####################################################################################
+# STORE SECTION
+#####################################################################################
+
+# ICRP tables that have already been loaded, keyed by (publication, name)
+_icrp_tables = {}
+
+"""
+This function returns the data of a nuclide in an ICRP coefficients
+table, as a dictionary mapping every column other than Nuclide to an
+array with one value per variant (absorption type, f1) of the nuclide.
+Text columns (Half Life, Type, f1) are arrays of strings and coefficient
+columns are float arrays. None is returned if the table has no data for
+the nuclide.
+"""
+def get_icrp_nuclide(publication, name, nuclide):
+    table = get_icrp_table(publication, name)
+    rows = table["rows"].get(nuclide)
+    if rows is None:
+        return None
+
+    start, end = rows
+    return {column : table["data"][column][start:end] for column in table["columns"]}
+
+"""
+This function returns the values of a single column of a nuclide in
+an ICRP coefficients table, with one value per variant of the nuclide.
+None is returned if the table has no data for the nuclide or column.
+"""
+def get_icrp_column(publication, name, nuclide, column):
+    table = get_icrp_table(publication, name)
+    rows = table["rows"].get(nuclide)
+    if rows is None or column not in table["data"]:
+        return None
+
+    start, end = rows
+    return table["data"][column][start:end]
+
+"""
+This function returns an ICRP coefficients table indexed by nuclide.
+The table is only loaded the first time it is requested; afterwards
+it is served from memory.
+The rows of the table are regrouped so that the variants of each
+nuclide are next to each other, keeping their order in the file.
+The variants of a nuclide are then the same slice of every column.
+"""
+def get_icrp_table(publication, name):
+    key = (publication, name)
+    table = _icrp_tables.get(key)
+    if table is None:
+        table = load_icrp_table(publication, name)
+        _icrp_tables[key] = table
+    return table
+
+"""
+This function loads an ICRP coefficients table and indexes it by nuclide.
+"""
+def load_icrp_table(publication, name):
+    label_columns, labels, columns, values = read_icrp_table(publication, name)
+    nuclides = labels[:, label_columns.index("Nuclide")]
+
+    # Fixes inconsistent nuclide names across ICRP72 files
+    if publication == "ICRP72":
+        nuclides = np.array([icrp_72_nuclide_alias(nuclide) for nuclide in nuclides])
+
+    # Orders nuclides by first appearance, keeping their variants in order
+    _, first, inverse = np.unique(nuclides, return_index=True, return_inverse=True)
+    order = np.argsort(first[inverse], kind='stable')
+    nuclides = nuclides[order]
+
+    # Stores each column contiguously
+    labels = np.ascontiguousarray(labels[order].T)
+    values = np.ascontiguousarray(values[order].T)
+
+    # Finds the rows of each nuclide
+    starts = np.flatnonzero(np.r_[True, nuclides[1:] != nuclides[:-1]])
+    ends = np.r_[starts[1:], len(nuclides)]
+    rows = {str(nuclides[start]) : (int(start), int(end)) for start, end in zip(starts, ends)}
+
+    # Maps every column to its array
+    data = {}
+    for i, column in enumerate(label_columns):
+        data[column] = labels[i]
+    for i, column in enumerate(columns):
+        data[column] = values[i]
+    for array in data.values():
+        array.flags.writeable = False
+
+    return {"columns" : [column for column in label_columns + columns if column != "Nuclide"],
+            "data" : data,
+            "rows" : rows}
+
+#####################################################################################
+# AGE GROUPS SECTION
+#####################################################################################
+
+# Age groups of the ICRP72 tables, from youngest to oldest
+icrp72_age_groups = ["Newborn", "1 yr-old", "5 yr-old", "10 yr-old", "15 yr-old", "Adult"]
+
+# Age-dependent ICRP72 tables that have already been loaded, keyed by mode
+_age_tables = {}
+
+"""
+This function returns the data of a nuclide for every ICRP72 age group,
+as a dictionary mapping every column other than Nuclide to a 2-D array
+with one row per age group and one column per variant of the nuclide.
+None is returned if there is no data for the nuclide.
+"""
+def get_age_nuclide(mode, nuclide):
+    table = get_age_table(mode)
+    rows = table["rows"].get(nuclide)
+    if rows is None:
+        return None
+
+    start, end = rows
+    return {column : table["data"][column][:, start:end] for column in table["columns"]}
+
+"""
+This function returns the values of a single column of a nuclide for
+every ICRP72 age group, as a 2-D array with one row per age group and
+one column per variant of the nuclide.
+None is returned if there is no data for the nuclide or column.
+"""
+def get_age_column(mode, nuclide, column):
+    table = get_age_table(mode)
+    rows = table["rows"].get(nuclide)
+    if rows is None or column not in table["data"]:
+        return None
+
+    start, end = rows
+    return table["data"][column][:, start:end]
+
+"""
+This function returns the ICRP72 tables of every age group for an intake
+mode (Ingestion or Inhalation), combined into a single table.
+The table is only loaded the first time it is requested; afterwards
+it is served from memory.
+"""
+def get_age_table(mode):
+    table = _age_tables.get(mode)
+    if table is None:
+        table = load_age_table(mode)
+        _age_tables[mode] = table
+    return table
+
+"""
+This function combines the ICRP72 tables of every age group for an
+intake mode. The rows of each age group's table are lined up with the
+rows of the first one, so that every column is a 2-D array with one row
+per age group, and the variants of a nuclide are the same slice of
+every row.
+"""
+def load_age_table(mode):
+    tables = [get_icrp_table("ICRP72", mode + " " + age) for age in icrp72_age_groups]
+    reference = tables[0]
+
+    # Finds the rows of each age group's table matching the reference rows
+    positions = np.empty((len(tables), len(reference["data"]["Nuclide"])), dtype=int)
+    for i, table in enumerate(tables):
+        for nuclide, (start, end) in reference["rows"].items():
+            table_start, table_end = table["rows"][nuclide]
+            positions[i, start:end] = np.arange(table_start, table_end)
+
+    data = {}
+    for column in reference["columns"]:
+        data[column] = np.array([table["data"][column][positions[i]]
+                                 for i, table in enumerate(tables)])
+        data[column].flags.writeable = False
+
+    return {"columns" : reference["columns"],
+            "data" : data,
+            "rows" : reference["rows"]}
\ No newline at end of file
@@ -0,0 +1,136 @@
+##### IMPORTS #####
+import csv
+import math
+import numpy as np
+from Utility.Functions.files import resource_path
+from Utility.Functions.math_utility import find_data_array
+from Utility.Functions.compiled_data import get_table, write_dataset, source_stats
+from Utility.Functions.decay_store import get_radiation_database, energies_sources, \
+                                          radiation_types, photon_types
+
+#####################################################################################
+# KERMA SECTION
+#####################################################################################
+
+# The air-kerma rate constant of a nuclide is the air-kerma rate at 1 m from
+# a point source of unit activity, in Gy m^2 / (Bq s). It is the sum over the
+# nuclide's photon lines of yield * energy * (mass energy-absorption
+# coefficient of air) / (4 pi). Lines below the energy cutoff are left out,
+# as are lines below the photon data (1 keV).
+# The constants of every nuclide are found at once from the radiation
+# database and kept as a table with one row per cutoff and one column per
+# nuclide, which can be compiled like the other datasets.
+
+# Material whose mass energy-absorption coefficients are used for air
+kerma_material = "Air (dry, near sea level)"
+
+# Energy cutoffs (MeV) of the table
+kerma_cutoffs = [0.0, 0.02]
+
+# Joules per MeV
+joules_per_mev = 1.602176634e-13
+
+# Units of the constants paired with their factor in relation to Gy m^2 / (Bq s)
+kerma_units = {"Gy m\u00B2/(Bq s)" : 1,
+               "\u00B5Gy m\u00B2/(GBq h)" : 1e6 * 1e9 * 3600,
+               "mGy m\u00B2/(GBq h)" : 1e3 * 1e9 * 3600,
+               "\u00B5Gy m\u00B2/(MBq h)" : 1e6 * 1e6 * 3600}
+
+# Name of the compiled air-kerma table
+kerma_dataset = 'Radioactive Decay/Air Kerma'
+
+"""
+This function returns the air-kerma rate constant of a nuclide, in
+Gy m^2 / (Bq s), for photons above one of the energy cutoffs of the table.
+None is returned if there is no data for the nuclide.
+"""
+def get_kerma_constant(nuclide, cutoff=0.0):
+    table = get_kerma_table()
+    column = table["nuclides"].get(nuclide)
+    if column is None:
+        return None
+    return float(table["values"][kerma_cutoffs.index(cutoff), column])
+
+"""
+This function returns the air-kerma table as a dictionary with:
+   nuclides -> column of every nuclide in values
+   values   -> 2-D array of the constants, one row per cutoff
+The compiled table is used if it is available and not stale.
+Otherwise, the table is built and kept in memory.
+"""
+def get_kerma_table():
+    return get_table(kerma_dataset, kerma_sources, read_kerma, build_kerma_table)
+
+"""
+This function builds the air-kerma table (see get_kerma_table).
+"""
+def build_kerma_table():
+    nuclides, values = build_kerma()
+    return {"nuclides" : {nuclide : i for i, nuclide in enumerate(nuclides)},
+            "values" : values}
+
+"""
+This function finds the air-kerma rate constant of every nuclide in the
+radiation database for every cutoff.
+The mass energy-absorption coefficients of air are found for every photon
+line in a single lookup, and the lines are summed by nuclide.
+It returns the list of nuclides and the 2-D array of constants.
+"""
+def build_kerma():
+    database = get_radiation_database()
+    photon_codes = [radiation_types.index(rad_type) for rad_type in photon_types]
+    rows = np.flatnonzero(np.isin(database["type"], photon_codes))
+    energies = database["energy"][rows]
+
+    mea, low, high = find_data_array("All Materials", "Mass Energy-Absorption",
+                                     kerma_material, energies, "Photons")
+    valid = ~(low | high)
+
+    # Kerma rate of each line at 1 m, converting cm^2/g to m^2/kg
+    rates = np.where(valid, database["yield"][rows] * energies * joules_per_mev
+                     * mea * 0.1 / (4 * math.pi), 0.0)
+
+    nuclides = list(database["nuclides"])
+    values = np.array([np.bincount(database["nuclide"][rows], weights=rates * (energies >= cutoff),
+                                   minlength=len(nuclides))
+                       for cutoff in kerma_cutoffs])
+    values.flags.writeable = False
+    return nuclides, values
+
+"""
+This function reads the air-kerma table from its compiled dataset.
+None is returned if the table was compiled for other cutoffs.
+"""
+def read_kerma(values, index):
+    if index["cutoffs"] != kerma_cutoffs:
+        return None
+    return {"nuclides" : {nuclide : i for i, nuclide in enumerate(index["nuclides"])},
+            "values" : values}
+
+"""
+This function compiles the air-kerma table.
+"""
+def compile_kerma():
+    nuclides, values = build_kerma()
+    index = {"sources" : source_stats(kerma_sources()),
+             "nuclides" : nuclides,
+             "cutoffs" : kerma_cutoffs}
+    write_dataset(kerma_dataset, index, values)
+
+"""
+This function returns the source files of the air-kerma table: the
+energies file of every element, and the composition and photon data
+of air.
+"""
+def kerma_sources():
+    composition_path = resource_path('Data/General Data/Material Composition/'
+                                     + kerma_material + '.csv')
+    with open(composition_path, 'r') as file:
+        elements = [row["Element"] for row in csv.DictReader(file)]
+
+    sources = energies_sources()
+    sources[kerma_material] = composition_path
+    for element in elements:
+        sources["Photons " + element] = resource_path('Data/NIST Coefficients/Photons/Elements/'
+                                                      + element + '.csv')
+    return sources
\ No newline at end of file
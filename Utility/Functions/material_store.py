@@ -0,0 +1,288 @@
+##### IMPORTS #####
+import io
+import os
+import csv
+import hashlib
+import numpy as np
+from Utility.Functions.preferences import open_prefs
+from Utility.Functions.files import resource_path, get_user_data_path
+from Utility.Functions.coefficient_store import energy_columns, get_table, get_column, \
+                                               MissingDataError
+from Utility.Functions.compiled_data import nist_particles, open_dataset, write_dataset
+
+#####################################################################################
+# STORE SECTION
+#####################################################################################
+
+# Mixture tables that have already been loaded, keyed by (particle, material)
+_materials = {}
+
+# Mixture tables of Custom Materials, keyed by (particle, material)
+_custom_materials = {}
+
+"""
+This function returns the energy grid and the coefficients of a
+single column of a material's mixture table, for either a built-in
+material or a custom material depending on the category.
+Mixture tables only have the columns shared by every element of the
+material, so a MissingDataError is raised if an element has no data
+for the column.
+"""
+def get_mixture_column(category, material, column, particle):
+    try:
+        if category == "Custom Materials":
+            return get_custom_material_table(material, particle)[column]
+        return get_material_column(material, column, particle)
+    except KeyError:
+        raise MissingDataError(material, column) from None
+
+"""
+This function returns the energy grid and the coefficients of a
+single column of a built-in material's mixture table.
+"""
+def get_material_column(material, column, particle):
+    return get_material_table(material, particle)[column]
+
+"""
+This function returns the mixture table of a built-in material for
+the provided particle. The table is only loaded the first time it is
+requested; afterwards it is served from memory.
+The table maps every coefficient column shared by the material's
+elements to a pair of arrays (energies, coefficients).
+"""
+def get_material_table(material, particle):
+    key = (particle, material)
+    table = _materials.get(key)
+    if table is None:
+        table = load_material_table(material, particle)
+        _materials[key] = table
+    return table
+
+"""
+This function loads the mixture table of a built-in material.
+If the material was compiled and its composition and element data have
+not changed since, the compiled table is used. Otherwise, the table is
+rebuilt from the composition.
+"""
+def load_material_table(material, particle):
+    composition_data = read_composition(material)
+    composition = list(csv.DictReader(io.StringIO(composition_data.decode())))
+    key = material_key(composition_data, composition, particle)
+
+    compiled = open_materials(particle)
+    if compiled is not None:
+        values, index = compiled
+        entry = index["tables"].get(material)
+        if entry is not None and entry["key"] == key:
+            return {name : (values[0, start:end], values[1, start:end])
+                    for name, (start, end) in entry["columns"].items()}
+
+    return build_mixture_table(composition, particle)
+
+"""
+This function returns the mixture table of a custom material for the
+provided particle. The table is only loaded the first time it is
+requested; afterwards it is served from memory.
+"""
+def get_custom_material_table(material, particle):
+    key = (particle, material)
+    table = _custom_materials.get(key)
+    if table is None:
+        table = load_custom_material_table(material, particle)
+        _custom_materials[key] = table
+    return table
+
+"""
+This function loads the mixture table of a custom material.
+The table is compiled when the material is added and stored next to
+its composition in the material's shelve file. If the composition or
+the element data have changed since, or the material was added before
+tables were compiled, the table is rebuilt and stored again.
+"""
+def load_custom_material_table(material, particle):
+    composition_data = read_custom_composition(material)
+    composition = list(csv.DictReader(io.StringIO(composition_data)))
+    key = material_key(composition_data.encode(), composition, particle)
+
+    db_path = get_user_data_path('Custom Materials/_' + material)
+    with open_prefs(db_path) as db:
+        compiled = db.get(material + '_' + particle)
+        if compiled is not None and compiled["key"] == key:
+            table = compiled["columns"]
+        else:
+            table = build_mixture_table(composition, particle)
+            db[material + '_' + particle] = {"key" : key, "columns" : table}
+
+    # Prevents the shared arrays from being edited by callers
+    for energies, values in table.values():
+        energies.flags.writeable = False
+        values.flags.writeable = False
+
+    return table
+
+"""
+This function compiles the mixture tables of a custom material for
+every particle. It is called when the material is added.
+Particles without data for one of the material's elements are skipped.
+"""
+def compile_custom_material(material):
+    for particle in nist_particles:
+        _custom_materials.pop((particle, material), None)
+        try:
+            get_custom_material_table(material, particle)
+        except OSError:
+            continue
+
+#####################################################################################
+# MIXTURE SECTION
+#####################################################################################
+
+"""
+This function builds the mixture table of a material given the rows
+of its composition, each with a Weight and an Element.
+Only the columns that every element has are included.
+"""
+def build_mixture_table(composition, particle):
+    elements = [row['Element'] for row in composition]
+    weights = [float(row['Weight']) for row in composition]
+    tables = [get_table(element, particle) for element in elements]
+
+    columns = [name for name in tables[0]
+               if name != energy_columns[particle] and all(name in table for table in tables)]
+    return {column : mix_column(elements, weights, column, particle) for column in columns}
+
+"""
+This function applies the mixture rule to a column of the material's
+elements, by summing the weighted values of each element.
+The values are computed on a merged energy grid made of every energy
+of the elements at which all of them have data. Energies that are
+repeated in an element's data (absorption edges) are kept repeated, so
+that the table returns exactly the value find_data_for_material would
+at every energy of the grid, and linear interpolation between them
+gives the same values as interpolating each element.
+"""
+def mix_column(elements, weights, column, particle):
+    pairs = [get_column(element, column, particle) for element in elements]
+
+    # Error-check for an element without data for the column
+    if any(len(energies) == 0 for energies, _ in pairs):
+        return np.array([]), np.array([])
+
+    # Energies at which every element has data
+    low = max(energies[0] for energies, _ in pairs)
+    high = min(energies[-1] for energies, _ in pairs)
+    grid = np.unique(np.concatenate([energies for energies, _ in pairs]))
+    grid = grid[(grid >= low) & (grid <= high)]
+
+    # Repeats energies as many times as any element repeats them
+    counts = np.ones(len(grid), dtype=int)
+    for energies, _ in pairs:
+        counts = np.maximum(counts, np.searchsorted(energies, grid, side='right') -
+                                    np.searchsorted(energies, grid, side='left'))
+    merged = np.repeat(grid, counts)
+    rank = np.arange(len(merged)) - np.repeat(np.cumsum(counts) - counts, counts)
+    last = (rank == np.repeat(counts, counts) - 1) & (rank > 0)
+
+    # Sums each component's weighted values
+    values = np.zeros(len(merged))
+    for (energies, coefficients), weight in zip(pairs, weights):
+        left = np.searchsorted(energies, merged, side='left')
+        right = np.searchsorted(energies, merged, side='right')
+        element_values = np.empty(len(merged))
+
+        # Uses the matching row of the element, the first one before an
+        # absorption edge and the last one after it
+        exact = right > left
+        position = np.where(last, right - 1, np.minimum(left + rank, right - 1))
+        element_values[exact] = coefficients[position[exact]]
+
+        # Uses linear interpolation between the element's rows otherwise
+        near_high = left[~exact]
+        near_low = near_high - 1
+        percentage = (merged[~exact] - energies[near_low]) / (energies[near_high] - energies[near_low])
+        element_values[~exact] = coefficients[near_low] + percentage * \
+                                 (coefficients[near_high] - coefficients[near_low])
+
+        values += weight * element_values
+
+    values.flags.writeable = False
+    return merged, values
+
+#####################################################################################
+# CACHE SECTION
+#####################################################################################
+
+"""
+This function reads the composition file of a built-in material.
+"""
+def read_composition(material):
+    db_path = resource_path('Data/General Data/Material Composition/' + material + '.csv')
+    with open(db_path, 'rb') as file:
+        return file.read()
+
+"""
+This function reads the composition of a custom material from its
+shelve file.
+"""
+def read_custom_composition(material):
+    db_path = get_user_data_path('Custom Materials/_' + material)
+    with open_prefs(db_path) as db:
+        return db[material].replace('\\n', '\n')
+
+"""
+This function returns the key of a material's mixture table, a hash
+of its composition and of the data files of its elements.
+The key changes whenever any of those files change.
+"""
+def material_key(composition_data, composition, particle):
+    digest = hashlib.sha1(composition_data)
+    for row in composition:
+        db_path = resource_path('Data/NIST Coefficients/' + particle + '/Elements/'
+                                + row['Element'] + '.csv')
+        with open(db_path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+"""
+This function opens the compiled mixture tables of a particle.
+The compiled tables are checked one by one through their keys,
+so the dataset itself has no source files.
+"""
+def open_materials(particle):
+    return open_dataset('Materials/' + particle, {})
+
+"""
+This function compiles the mixture tables of every built-in material
+for a particle. Materials containing an element without data for the
+particle are skipped.
+"""
+def compile_materials(particle):
+    folder = resource_path('Data/General Data/Material Composition')
+    materials = sorted(file_name[:-4] for file_name in os.listdir(folder)
+                       if file_name.endswith('.csv'))
+
+    columns = [[], []]
+    entries = {}
+    start = 0
+    for material in materials:
+        composition_data = read_composition(material)
+        composition = list(csv.DictReader(io.StringIO(composition_data.decode())))
+        try:
+            key = material_key(composition_data, composition, particle)
+            table = build_mixture_table(composition, particle)
+        except OSError:
+            continue
+
+        # Lays out the columns one after another
+        entry = {"key" : key, "columns" : {}}
+        for name, (energies, values) in table.items():
+            end = start + len(energies)
+            columns[0].append(energies)
+            columns[1].append(values)
+            entry["columns"][name] = [start, end]
+            start = end
+        entries[material] = entry
+
+    values = np.array([np.concatenate(columns[0]), np.concatenate(columns[1])])
+    write_dataset('Materials/' + particle, {"sources" : {}, "tables" : entries}, values)
+    _materials.clear()
\ No newline at end of file
@@ -2,10 +2,13 @@
 import io
 import sys
 import csv
-import shelve
-from Utility.Functions.gui_utility import errors, too_low, too_high
+import numpy as np
+from Utility.Functions.result_utility import errors, too_low, too_high
 from Utility.Functions.files import resource_path, get_user_data_path
+from Utility.Functions.preferences import open_prefs, add_prefs_listener
 from Utility.Functions.choices import element_choices, material_choices
+from Utility.Functions.material_store import get_mixture_column, read_custom_composition
+from Utility.Functions.coefficient_store import energy_columns, get_column
 
 #####################################################################################
 # UNITS SECTION
@@ -38,54 +41,106 @@ def linear_interpolation(target, near_low, near_high, val_low, val_high):
 # DATA SECTION
 #####################################################################################
 
+# Density indexes that have already been built, keyed by
+# Elements, Materials, or Custom Materials
+_density_indexes = {}
+
 """
 This function finds the density of the provided item.
-If the category is Custom Materials, the density is retrieved
-from shelve, where the user-inputted density is stored.
-Otherwise, the density is retrieved from the data.
+The density is read from the density index of the item's category,
+which is only built the first time it is needed.
+If the item is not in the index, None is returned.
 """
 def find_density(category, item):
-    if category == "Custom Materials":
-        db_path = get_user_data_path('Custom Materials/_' + item)
-        with shelve.open(db_path) as db:
-            return float(db[item + '_Density'])
+    density = get_density_index(category).get(item)
+    if density is None:
+        return None
+    return float(density)
+
+"""
+This function returns the density index of the provided category,
+a dictionary mapping each item to its density as stored in the data.
+"""
+def get_density_index(category):
+    name = 'Custom Materials' if category == 'Custom Materials' else\
+           'Elements' if category in element_choices else 'Materials'
+    index = _density_indexes.get(name)
+    if index is None:
+        index = load_density_index(name)
+        _density_indexes[name] = index
+    return index
+
+"""
+This function builds a density index.
+For Custom Materials, the densities are retrieved from shelve,
+where the user-inputted density of each material is stored.
+Otherwise, the densities are retrieved from the data.
+"""
+def load_density_index(name):
+    index = {}
+
+    if name == "Custom Materials":
+        db_path = get_user_data_path('Custom Materials')
+        with open_prefs(db_path) as prefs:
+            materials = prefs.get("Custom Materials", [])
+        for material in materials:
+            db_path = get_user_data_path('Custom Materials/_' + material)
+            with open_prefs(db_path) as db:
+                if material + '_Density' in db:
+                    index[material] = db[material + '_Density']
+        return index
 
-    name = 'Elements' if category in element_choices else 'Materials'
     db_path = resource_path('Data/General Data/Density/' + name + '.csv')
     with open(db_path, 'r') as file:
         reader = csv.DictReader(file)
         for row in reader:
-            if row and row['Name'] == item:
-                return float(row['Density'])
+            if row and not row['Name'] in index:
+                index[row['Name']] = row['Density']
 
-    return None
+    return index
+
+"""
+This function clears the density index of Custom Materials.
+It is called whenever the list of Custom Materials changes, so that
+the index is rebuilt with the new material the next time it is needed.
+"""
+def clear_custom_density_index(*_):
+    _density_indexes.pop('Custom Materials', None)
+
+add_prefs_listener(get_user_data_path('Custom Materials'), clear_custom_density_index)
 
 """
 This function handles finding a value from the raw data for the selected item.
 Based on the selected category, it passes on the calculation to either
 find_data_for_element or find_data_for_material, and then returns the result.
+Materials (built-in and custom) are looked up in their precomputed
+mixture tables, so they cost the same as elements.
 """
 def find_data(category, column, item, energy_target, particle):
     if category in element_choices:
         result = find_data_for_element(item, column, energy_target, particle)
-    elif category in material_choices:
-        db_path = resource_path('Data/General Data/Material Composition/' + item + '.csv')
-        with open(db_path, 'r') as file:
-            result = find_data_for_material(file, column, energy_target, particle)
     else:
-        db_path = get_user_data_path('Custom Materials/_' + item)
-        with shelve.open(db_path) as db:
-            stored_data = db[item]
-            stored_data = stored_data.replace('\\n', '\n')
-
-        # Create file-like object from the stored string
-        csv_file_like = io.StringIO(stored_data)
+        energies, coefficients = get_mixture_column(category, item, column, particle)
+        result = interpolate_data(energies, coefficients, energy_target)
 
-        result = find_data_for_material(csv_file_like, column,
-                                        energy_target, particle)
+        # Finds which element of the material is out of range
+        if result in errors:
+            with open_composition(category, item) as file:
+                result = find_data_for_material(file, column, energy_target, particle)
 
     return result
 
+"""
+This function opens the composition of a material as a file-like
+object, for either a built-in material or a custom material depending
+on the category.
+"""
+def open_composition(category, material):
+    if category in material_choices:
+        db_path = resource_path('Data/General Data/Material Composition/' + material + '.csv')
+        return open(db_path, 'r')
+    return io.StringIO(read_custom_composition(material))
+
 """
 This function handles finding a value from the raw data for a material,
 by summing the weighted values of each material making up the element.
@@ -110,7 +165,22 @@ def find_data_for_material(file_like, column, energy_target, particle):
 
 """
 This function handles finding a value from the raw data for an element.
-The data for the particular element is parsed.
+The data for the particular element is served from the coefficient store,
+which only parses the raw data the first time it is needed.
+The work is passed on to the interpolate_data function.
+"""
+def find_data_for_element(element, column, energy_target, particle):
+    # Error-check for an unknown particle
+    if particle not in energy_columns:
+        sys.exit()
+
+    # Retrieves the energies and coefficients of the column
+    energies, coefficients = get_column(element, column, particle)
+    return interpolate_data(energies, coefficients, energy_target)
+
+"""
+This function finds the value of a column at the target energy,
+given the energies and coefficients of the column.
 The function handles the following errors:
    Energy too low
    Energy too high
@@ -119,68 +189,177 @@ the data is returned directly. Otherwise, if the input did not cause
 an error, linear interpolation is used with the closest energy value
 on each side of the inputted energy value from the data.
 """
-def find_data_for_element(element, column, energy_target, particle):
-    # Variables for the nearest energy value on either side
-    closest_low = 0.0
-    closest_high = float('inf')
-
-    # Variables for the coefficients of the nearest energy values on either side
-    low_coefficient = 0.0
-    high_coefficient = float('inf')
-
-    # Retrieves name of energy column
-    energy_col = "Photon Energy" if particle == "Photons" else\
-                 "Kinetic Energy" if particle == "Electrons" else\
-                 "Alpha Energy" if particle == "Alphas" else None
-    if energy_col is None:
-        sys.exit()
+def interpolate_data(energies, coefficients, energy_target):
+    # Finds the first energy value that is not less than the target,
+    # which we can do because the data is sorted in ascending order
+    # by energy
+    index = int(np.searchsorted(energies, energy_target))
 
-    # Opens file
-    db_path = resource_path('Data/NIST Coefficients/' + particle + '/Elements/' + element + '.csv')
-    with open(db_path, 'r') as file:
-        # Reads in file in dictionary format
-        reader = csv.DictReader(file)
-
-        for row in reader:
-            # Retrieves energy value of row
-            energy = float(row[energy_col])
-
-            # Stops searching if we run out of data
-            if not row[column]:
-                break
-
-            # If energy value matches target exactly, uses
-            # the coefficient of this row
-            elif energy == energy_target:
-                return float(row[column])
-
-            # If energy value is less than the target, uses
-            # this energy and its coefficient as the closest
-            # value lower than the energy so far, which we know
-            # is true because the data is sorted in ascending order
-            # by energy
-            elif energy < energy_target:
-                closest_low = energy
-                low_coefficient = float(row[column])
-
-            # If energy value is greater than the target, uses
-            # this energy and its coefficient as the closest
-            # value higher than the energy and then exits the loop,
-            # which we know is true because the data is sorted in
-            # ascending order by energy
-            else:
-                closest_high = energy
-                high_coefficient = float(row[column])
-                break
+    # If energy value matches target exactly, uses
+    # the coefficient of this row
+    if index < len(energies) and energies[index] == energy_target:
+        return float(coefficients[index])
 
     # Error-check for an energy input smaller than all data
-    if closest_low == 0.0:
+    if index == 0:
         return too_low
 
     # Error-check for an energy input larger than all data
-    if closest_high == float('inf'):
+    if index == len(energies):
         return too_high
 
     # Uses linear interpolation to find the exact coefficient
-    return linear_interpolation(energy_target, closest_low, closest_high,
-                                low_coefficient, high_coefficient)
\ No newline at end of file
+    return linear_interpolation(energy_target,
+                                float(energies[index - 1]), float(energies[index]),
+                                float(coefficients[index - 1]), float(coefficients[index]))
+
+#####################################################################################
+# BATCH SECTION
+#####################################################################################
+
+"""
+This function is the batched counterpart of find_data.
+It finds the values of one or more columns at every energy in
+energy_targets in a single pass over the raw data.
+If column is a single column, the values are returned as a 1-D array.
+If column is a list of columns, the values are returned as a 2-D array
+with one row per energy and one column per data column.
+Instead of an error message, two boolean masks of the same shape are
+returned alongside the values, marking the energies that were too low
+and too high. Masked values are set to NaN.
+"""
+def find_data_array(category, column, item, energy_targets, particle):
+    columns = [column] if isinstance(column, str) else list(column)
+
+    if category in element_choices:
+        results = [find_data_for_element_array(item, col, energy_targets, particle)
+                   for col in columns]
+    else:
+        results = [find_data_for_mixture_array(category, item, col, energy_targets, particle)
+                   for col in columns]
+
+    if isinstance(column, str):
+        return results[0]
+
+    # Stacks the results of each column side by side
+    values, low, high = zip(*results)
+    return np.stack(values, axis=-1), np.stack(low, axis=-1), np.stack(high, axis=-1)
+
+"""
+This function finds the values of several columns at every energy in
+energy_targets and sums them, as when several interactions are selected.
+Each value is multiplied by weight before it is summed (e.g., by the
+density of the item for linear coefficients).
+As in the calculations, an energy keeps the error of the first column
+that could not provide a value.
+"""
+def find_data_sum(category, columns, item, energy_targets, particle, weight=1):
+    targets = np.asarray(energy_targets, dtype=float)
+    values = np.zeros(targets.shape)
+    low = np.zeros(targets.shape, dtype=bool)
+    high = np.zeros(targets.shape, dtype=bool)
+
+    for column in columns:
+        values_of_column, low_of_column, high_of_column = \
+            find_data_array(category, column, item, targets, particle)
+        error = low | high
+        low |= low_of_column & ~error
+        high |= high_of_column & ~error
+        values += values_of_column * weight
+
+    values[low | high] = np.nan
+    return values, low, high
+
+"""
+This function finds the values of a column for a material (built-in
+or custom) using its precomputed mixture table.
+For energies outside of the table, the material's composition is used
+to find which element is out of range, as in find_data.
+"""
+def find_data_for_mixture_array(category, material, column, energy_targets, particle):
+    energies, coefficients = get_mixture_column(category, material, column, particle)
+    values, low, high = interpolate_data_array(energies, coefficients, energy_targets)
+
+    # Finds which element of the material is out of range
+    error = low | high
+    if error.any():
+        with open_composition(category, material) as file:
+            composition = list(csv.DictReader(file))
+        targets = np.asarray(energy_targets, dtype=float)
+        _, low_of_material, high_of_material = \
+            find_data_for_material_array(composition, column, targets[error], particle)
+        low[error] = low_of_material
+        high[error] = high_of_material
+
+    return values, low, high
+
+"""
+This function is the batched counterpart of find_data_for_material.
+The rows of the material's composition are provided as dictionaries
+with Weight and Element keys.
+The weighted values of each element are summed for every energy.
+As in find_data_for_material, an energy keeps the error of the first
+element in the composition that could not provide a value.
+"""
+def find_data_for_material_array(composition, column, energy_targets, particle):
+    targets = np.asarray(energy_targets, dtype=float)
+    values = np.zeros(targets.shape)
+    low = np.zeros(targets.shape, dtype=bool)
+    high = np.zeros(targets.shape, dtype=bool)
+
+    # Sums each component's weighted values
+    for row in composition:
+        values_of_element, low_of_element, high_of_element = \
+            find_data_for_element_array(row['Element'], column, targets, particle)
+        error = low | high
+        low |= low_of_element & ~error
+        high |= high_of_element & ~error
+        values += float(row['Weight']) * values_of_element
+
+    values[low | high] = np.nan
+    return values, low, high
+
+"""
+This function is the batched counterpart of find_data_for_element.
+"""
+def find_data_for_element_array(element, column, energy_targets, particle):
+    # Error-check for an unknown particle
+    if particle not in energy_columns:
+        sys.exit()
+
+    # Retrieves the energies and coefficients of the column
+    energies, coefficients = get_column(element, column, particle)
+    return interpolate_data_array(energies, coefficients, energy_targets)
+
+"""
+This function is the batched counterpart of interpolate_data.
+Each energy is bracketed by the closest energy values on each side
+using a binary search over the data. Exact matches use the
+coefficient of that row directly, and the remaining energies within
+the data are linearly interpolated.
+"""
+def interpolate_data_array(energies, coefficients, energy_targets):
+    targets = np.asarray(energy_targets, dtype=float)
+    values = np.full(targets.shape, np.nan)
+
+    # Finds the first energy value that is not less than each target
+    index = np.searchsorted(energies, targets)
+    inside = index < len(energies)
+
+    # Uses the coefficient of rows that match a target exactly
+    exact = np.zeros(targets.shape, dtype=bool)
+    exact[inside] = energies[index[inside]] == targets[inside]
+    values[exact] = coefficients[index[exact]]
+
+    # Error-check for energy inputs outside of the data
+    low = (index == 0) & ~exact
+    high = ~inside & ~exact
+
+    # Uses linear interpolation for every other target
+    between = ~(exact | low | high)
+    near_high = index[between]
+    values[between] = linear_interpolation(targets[between],
+                                           energies[near_high - 1], energies[near_high],
+                                           coefficients[near_high - 1], coefficients[near_high])
+
+    return values, low, high
\ No newline at end of file
@@ -0,0 +1,152 @@
+##### IMPORTS #####
+import json
+import math
+import numpy as np
+from functools import lru_cache
+from Utility.Functions.files import resource_path
+from Utility.Functions.compiled_data import get_table, write_dataset, source_stats
+from Utility.Functions.chain_store import get_decay_graph, decay_graph_sources, graph_dataset
+
+#####################################################################################
+# NUCLIDES SECTION
+#####################################################################################
+
+# The metadata of a nuclide (proton number Z, nucleon number A, atomic mass,
+# half-life, stability, and direct progeny) is shared by every module through
+# get_nuclide, instead of each module building its own rd.Nuclide.
+# The numeric metadata of every nuclide in Data/Radioactive Decay/Isotopes.json
+# is kept as a flat table with one row per nuclide, which can be compiled like
+# the other datasets. Nuclides that are not in the table (e.g., names written
+# differently) are looked up in radioactivedecay.
+
+# Columns of the nuclides table
+nuclide_columns = ["Z", "A", "Atomic Mass", "Half Life"]
+
+# Largest number of nuclides whose metadata is kept in memory
+nuclide_cache_size = 512
+
+# Name of the compiled nuclides table
+nuclides_dataset = 'Radioactive Decay/Nuclides'
+
+"""
+This function returns the metadata of a nuclide as a dictionary with:
+   Z           -> proton number
+   A           -> nucleon number
+   atomic_mass -> atomic mass (g/mol)
+   half_life   -> half-life (s), inf for stable nuclides
+   stable      -> whether the nuclide is stable
+   progeny     -> direct progeny (SF for spontaneous fission)
+   fractions   -> branching fraction to each direct progeny
+The metadata of the most recently used nuclides is kept in memory and
+shared by every caller, so it must not be modified.
+A ValueError is raised if radioactivedecay has no data for the nuclide.
+"""
+@lru_cache(maxsize=nuclide_cache_size)
+def get_nuclide(nuclide):
+    table = get_nuclide_table()
+    row = table["nuclides"].get(nuclide)
+    if row is None:
+        return build_nuclide(nuclide)
+
+    z, a, atomic_mass, half_life = (float(value) for value in table["values"][row])
+    node = get_decay_graph()[nuclide]
+    return {"Z" : int(z),
+            "A" : int(a),
+            "atomic_mass" : atomic_mass,
+            "half_life" : half_life,
+            "stable" : math.isinf(half_life),
+            "progeny" : tuple(node["progeny"]),
+            "fractions" : tuple(node["fractions"])}
+
+"""
+This function finds the metadata of a nuclide from radioactivedecay
+(see get_nuclide).
+"""
+def build_nuclide(nuclide):
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    nuc = rd.Nuclide(nuclide)
+    half_life = float(nuc.half_life('s'))
+    return {"Z" : nuc.Z,
+            "A" : nuc.A,
+            "atomic_mass" : float(nuc.atomic_mass),
+            "half_life" : half_life,
+            "stable" : math.isinf(half_life),
+            "progeny" : tuple(nuc.progeny()),
+            "fractions" : tuple(float(fraction) for fraction in nuc.branching_fractions())}
+
+"""
+This function returns the nuclides table as a dictionary with:
+   nuclides -> row of every nuclide in values
+   values   -> 2-D array of the metadata, one column per nuclide_columns
+The compiled table is used if it is available and not stale.
+Otherwise, the table is built and kept in memory.
+"""
+def get_nuclide_table():
+    return get_table(nuclides_dataset, nuclide_sources, read_nuclides, build_nuclide_table)
+
+"""
+This function builds the nuclides table (see get_nuclide_table).
+"""
+def build_nuclide_table():
+    nuclides, values = build_nuclides()
+    return {"nuclides" : {nuclide : i for i, nuclide in enumerate(nuclides)},
+            "values" : values}
+
+"""
+This function finds the numeric metadata of every nuclide in
+Isotopes.json. It returns the list of nuclides and the 2-D array
+of metadata.
+"""
+def build_nuclides():
+    # Imported here since radioactivedecay is slow to import
+    import radioactivedecay as rd
+
+    with open(isotopes_path(), 'r') as file:
+        isotopes = json.load(file)
+    nuclides = [nuclide for element in isotopes.values() for nuclide in element
+                if nuclide in rd.DEFAULTDATA.nuclide_dict]
+
+    values = np.empty((len(nuclides), len(nuclide_columns)))
+    for i, nuclide in enumerate(nuclides):
+        nuc = rd.Nuclide(nuclide)
+        values[i] = [nuc.Z, nuc.A, nuc.atomic_mass, nuc.half_life('s')]
+    return nuclides, values
+
+"""
+This function reads the nuclides table from its compiled dataset.
+None is returned if the table was compiled from other decay data.
+"""
+def read_nuclides(values, index):
+    if index["dataset"] != graph_dataset:
+        return None
+    return {"nuclides" : {nuclide : i for i, nuclide in enumerate(index["nuclides"])},
+            "values" : values}
+
+"""
+This function compiles the nuclides table.
+"""
+def compile_nuclides():
+    nuclides, values = build_nuclides()
+    index = {"sources" : source_stats(nuclide_sources()),
+             "dataset" : graph_dataset,
+             "nuclides" : nuclides,
+             "columns" : nuclide_columns}
+    write_dataset(nuclides_dataset, index, values)
+    get_nuclide.cache_clear()
+
+"""
+This function returns the source files of the nuclides table:
+Isotopes.json and the decay data of radioactivedecay.
+"""
+def nuclide_sources():
+    sources = decay_graph_sources()
+    sources["Isotopes"] = isotopes_path()
+    return sources
+
+"""
+This function returns the path of Isotopes.json.
+"""
+def isotopes_path():
+    return resource_path('Data/Radioactive Decay/Isotopes.json')
\ No newline at end of file
@@ -0,0 +1,147 @@
+##### IMPORTS #####
+import copy
+import atexit
+import shelve
+import threading
+
+#####################################################################################
+# PREFERENCES SECTION
+#####################################################################################
+
+# User data (settings, common items, custom materials) is stored in shelve
+# files. Each shelve file is only read the first time it is opened; afterwards
+# reads are served from memory. Writes update memory right away and are
+# written to the shelve file shortly after, together with any other writes
+# made in the meantime.
+
+# Seconds to wait before writing changes to the shelve files
+flush_delay = 1.0
+
+# Contents of the shelve files that have already been read, keyed by path
+_prefs = {}
+
+# Changes that have not been written yet, keyed by path
+_pending = {}
+
+# Functions to call when a value changes, keyed by path
+_listeners = {}
+
+# Guards the pending changes and the flush timer
+_lock = threading.RLock()
+_timer = None
+
+"""
+This class gives access to the preferences stored in a shelve file,
+with the same interface as an open shelve file.
+Values are copied when they are read or written, so that editing a
+value does not change the stored preferences unless it is written back,
+as with shelve.
+"""
+class Preferences:
+    def __init__(self, path):
+        self.path = path
+        self.values = load_prefs(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def __getitem__(self, key):
+        return copy.deepcopy(self.values[key])
+
+    def __setitem__(self, key, value):
+        set_pref(self.path, key, value)
+
+    def get(self, key, default=None):
+        return copy.deepcopy(self.values.get(key, default))
+
+"""
+This function opens the preferences stored in a shelve file
+given its path (see get_user_data_path).
+It is used in place of shelve.open.
+"""
+def open_prefs(path):
+    return Preferences(path)
+
+"""
+This function returns the contents of a shelve file.
+The file is only read the first time; afterwards it is served from memory.
+"""
+def load_prefs(path):
+    values = _prefs.get(path)
+    if values is None:
+        with _lock:
+            with shelve.open(path) as db:
+                values = {key : db[key] for key in db}
+        _prefs[path] = values
+    return values
+
+"""
+This function changes a value stored in a shelve file.
+The change is made in memory right away and written to the
+file later by flush_prefs. The listeners of the file are
+then notified of the change.
+"""
+def set_pref(path, key, value):
+    global _timer
+
+    value = copy.deepcopy(value)
+    load_prefs(path)[key] = value
+
+    with _lock:
+        _pending.setdefault(path, {})[key] = value
+        if _timer is None:
+            _timer = threading.Timer(flush_delay, flush_prefs)
+            _timer.daemon = True
+            _timer.start()
+
+    for listener in list(_listeners.get(path, [])):
+        listener(key, copy.deepcopy(value))
+
+"""
+This function writes every pending change to the shelve files.
+It is called shortly after values are changed and when the app exits.
+"""
+def flush_prefs():
+    global _timer
+
+    with _lock:
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+        for path, changes in _pending.items():
+            with shelve.open(path) as db:
+                db.update(changes)
+        _pending.clear()
+
+atexit.register(flush_prefs)
+
+#####################################################################################
+# LISTENERS SECTION
+#####################################################################################
+
+# The app shows a single screen at a time, and every screen reads its
+# preferences when it is created, so screens do not need to listen for
+# changes. Listeners are meant for values kept in memory that are derived
+# from preferences, such as the density index of the custom materials.
+
+"""
+This function registers a function to call whenever a value
+stored in a shelve file changes. The function is given the
+key and the new value.
+"""
+def add_prefs_listener(path, listener):
+    _listeners.setdefault(path, []).append(listener)
+
+"""
+This function removes a function registered with add_prefs_listener.
+"""
+def remove_prefs_listener(path, listener):
+    listeners = _listeners.get(path, [])
+    if listener in listeners:
+        listeners.remove(listener)
\ No newline at end of file
@@ -0,0 +1,262 @@
+##### IMPORTS #####
+import numpy as np
+from Utility.Functions.choices import element_choices
+from Utility.Functions.coefficient_store import get_column
+from Utility.Functions.material_store import get_mixture_column
+from Utility.Functions.result_utility import error_codes
+from Utility.Functions.math_utility import interpolate_data_array
+
+#####################################################################################
+# RANGE SECTION
+#####################################################################################
+
+# The CSDA ranges of an item for electrons or alphas increase with energy,
+# so the same data that gives the range of an energy also gives the energy
+# of a range, by swapping the energy and range columns. Both directions use
+# the linear interpolation of the calculations, which makes them exact
+# inverses of each other between the data points.
+
+# Name of the range column in the raw data
+range_column = "CSDA Range"
+
+# Range-energy tables that have already been built, keyed by
+# (particle, category, item)
+_range_tables = {}
+
+"""
+This function returns the range-energy table of an item (element or
+material) for electrons or alphas, as a pair of arrays (energies in MeV,
+CSDA ranges in g/cm^2). Rows that do not increase the range are
+dropped, so that the ranges are strictly increasing and can be searched.
+The table is only built the first time it is requested, or again if the
+data of the item has been reloaded since (e.g., an edited custom material).
+"""
+def get_range_table(category, item, particle):
+    energies, ranges = get_item_column(category, item, range_column, particle)
+
+    key = (particle, category, item)
+    cached = _range_tables.get(key)
+    if cached is not None and cached[0] is ranges:
+        return cached[1]
+
+    # Keeps the rows that increase the range
+    keep = np.r_[True, np.diff(np.maximum.accumulate(ranges)) > 0]
+    table = (energies[keep], ranges[keep])
+    for array in table:
+        array.flags.writeable = False
+
+    _range_tables[key] = (ranges, table)
+    return table
+
+"""
+This function finds the CSDA range (g/cm^2) of an item for electrons
+or alphas at every energy in energy_targets (MeV).
+It returns the ranges along with masks of the energies below and above
+the data, whose ranges are NaN.
+"""
+def find_range_array(category, item, energy_targets, particle):
+    energies, ranges = get_range_table(category, item, particle)
+    return interpolate_data_array(energies, ranges, energy_targets)
+
+"""
+This function finds the energy (MeV) for which the CSDA range of an item
+for electrons or alphas equals every range in range_targets (g/cm^2),
+i.e., the energy needed to penetrate that depth.
+It returns the energies along with masks of the ranges below and above
+the data, whose energies are NaN.
+"""
+def find_energy_array(category, item, range_targets, particle):
+    energies, ranges = get_range_table(category, item, particle)
+    return interpolate_data_array(ranges, energies, range_targets)
+
+"""
+This function finds the residual energy (MeV) of electrons or alphas
+after crossing a slab of an item, at every energy in energy_targets
+(MeV). The thickness of the slab (g/cm^2) is a single value or one
+value per energy. In the continuous slowing-down approximation, the
+residual range is the range at the energy less the thickness, and the
+residual energy is the energy of that range. Particles whose range is
+no greater than the thickness are stopped and have a residual energy
+of zero, as do residual ranges below the data.
+It returns the residual energies along with masks of the energies below
+and above the data, whose residual energies are NaN.
+"""
+def find_residual_energy_array(category, item, energy_targets, thickness, particle):
+    energies, ranges = get_range_table(category, item, particle)
+    ranges_of_targets, low, high = interpolate_data_array(energies, ranges, energy_targets)
+
+    residual_ranges = ranges_of_targets - thickness
+    residual_energies, _, _ = interpolate_data_array(ranges, energies, residual_ranges)
+    residual_energies = np.where(residual_ranges < ranges[0], 0.0, residual_energies)
+    residual_energies[low | high] = np.nan
+    return residual_energies, low, high
+
+#####################################################################################
+# SLOWING-DOWN SECTION
+#####################################################################################
+
+# Particles slowing down in matter are followed through their range
+# rather than stepped through the slab: the stopping power is linear in
+# energy between the data points, as in the calculations, so the range
+# (the integral of 1 / stopping power over energy) and its inverse have a
+# closed form on every interval. Below the data, the stopping power is
+# taken as constant down to zero energy, such that the range at the first
+# data point is its tabulated CSDA range. Crossing a slab then amounts to
+# subtracting its mass thickness from the range, for every energy at once.
+
+# Stopping power columns that slow the particles down, and the columns
+# of the energy that is deposited locally (radiative losses of electrons
+# leave as bremsstrahlung)
+stopping_columns = {"Electrons" : "Stopping Power - Total",
+                    "Alphas" : "Total Stopping Power"}
+deposition_columns = {"Electrons" : "Stopping Power - Collision",
+                      "Alphas" : "Total Stopping Power"}
+
+# Slowing-down tables that have already been built, keyed by
+# (particle, category, item)
+_slowing_tables = {}
+
+"""
+This function returns the slowing-down table of an item for electrons or
+alphas, as a dictionary mapping energy (MeV), stopping power (MeV cm^2/g),
+range (g/cm^2), and deposit (MeV) to arrays with one value per data
+point, starting from zero energy. The deposit is the energy deposited
+locally while slowing down from each energy to zero.
+The table is only built the first time it is requested, or again if the
+data of the item has been reloaded since.
+"""
+def get_slowing_table(category, item, particle):
+    energies, source = get_item_column(category, item, stopping_columns[particle], particle)
+
+    key = (particle, category, item)
+    cached = _slowing_tables.get(key)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+
+    # Fraction of the energy lost that is deposited locally
+    deposit_energies, deposit_powers = get_item_column(category, item,
+                                                       deposition_columns[particle], particle)
+    deposit_powers, _, _ = interpolate_data_array(deposit_energies, deposit_powers, energies)
+    fractions = np.where(np.isnan(deposit_powers), 1.0, deposit_powers / source)
+
+    # Starts the table at zero energy, with a constant stopping power below
+    # the data that gives the tabulated CSDA range of the first point
+    range_energies, ranges = get_item_column(category, item, range_column, particle)
+    energies = np.r_[0.0, energies]
+    stopping_powers = np.r_[energies[1] / np.interp(energies[1], range_energies, ranges), source]
+    fractions = np.r_[fractions[0], fractions]
+
+    widths = np.diff(energies)
+    slopes = np.r_[0.0, np.diff(source) / widths[1:]]
+    ranges = np.r_[0.0, np.cumsum(range_in_segment(widths, stopping_powers[:-1], slopes))]
+    deposits = np.r_[0.0, np.cumsum(widths * (fractions[:-1] + fractions[1:]) / 2)]
+
+    table = {"energy" : energies, "stopping_power" : stopping_powers,
+             "slope" : np.r_[slopes, 0.0], "range" : ranges, "deposit" : deposits}
+    for array in table.values():
+        array.flags.writeable = False
+
+    _slowing_tables[key] = (source, table)
+    return table
+
+"""
+This function returns the energy grid and the values of a column of
+an item's data (element or material).
+"""
+def get_item_column(category, item, column, particle):
+    if category in element_choices:
+        return get_column(item, column, particle)
+    return get_mixture_column(category, item, column, particle)
+
+"""
+This function finds the range covered while slowing down from the
+start of an interval of the table by each energy difference, where the
+stopping power starts at stopping_powers and changes linearly with
+the slopes. It is the integral of 1 / stopping power over energy.
+"""
+def range_in_segment(energy_differences, stopping_powers, slopes):
+    growth = slopes * energy_differences / stopping_powers
+    with np.errstate(divide='ignore', invalid='ignore'):
+        curved = np.log1p(growth) / slopes
+    return np.where(np.abs(growth) < 1e-12, energy_differences / stopping_powers, curved)
+
+"""
+This function finds the energy difference from the start of an interval
+of the table for which the range covered equals range_differences.
+It is the inverse of range_in_segment.
+"""
+def energy_in_segment(range_differences, stopping_powers, slopes):
+    exponents = slopes * range_differences
+    with np.errstate(divide='ignore', invalid='ignore'):
+        curved = stopping_powers * np.expm1(exponents) / slopes
+    return np.where(np.abs(exponents) < 1e-12, range_differences * stopping_powers, curved)
+
+"""
+This function finds the range (g/cm^2) of electrons or alphas at every
+energy in energy_targets (MeV), from the slowing-down table.
+It returns the ranges along with masks of the negative energies and of
+the energies above the data, whose ranges are NaN.
+"""
+def find_slowing_range_array(table, energy_targets):
+    targets = np.asarray(energy_targets, dtype=float)
+    low = targets < 0
+    high = targets > table["energy"][-1]
+
+    index = np.clip(np.searchsorted(table["energy"], targets, side='right') - 1,
+                    0, len(table["energy"]) - 1)
+    ranges = table["range"][index] + range_in_segment(targets - table["energy"][index],
+                                                      table["stopping_power"][index],
+                                                      table["slope"][index])
+    ranges[low | high] = np.nan
+    return ranges, low, high
+
+"""
+This function finds the energy (MeV) of electrons or alphas at every
+range in range_targets (g/cm^2), from the slowing-down table.
+Ranges that are not positive give zero energy.
+"""
+def find_slowing_energy_array(table, range_targets):
+    targets = np.maximum(np.asarray(range_targets, dtype=float), 0.0)
+    index = np.clip(np.searchsorted(table["range"], targets, side='right') - 1,
+                    0, len(table["range"]) - 2)
+    return table["energy"][index] + energy_in_segment(targets - table["range"][index],
+                                                      table["stopping_power"][index],
+                                                      table["slope"][index])
+
+"""
+This function steps electrons or alphas through a stack of slabs, at
+every energy in energy_targets (MeV) at once.
+Each layer is a (category, item, thickness) tuple, in the order the
+particles cross them, with the thickness in g/cm^2 as a single value or
+one value per energy.
+The results are returned as a dictionary with:
+   exit_energy: energy after each layer (MeV), one row per layer
+   energy_lost: energy lost in each layer (MeV), one row per layer
+   deposited: energy deposited locally in each layer (MeV), one row per
+              layer; for electrons, it leaves out the radiative losses
+   errors: error of each initial energy (see Results), which gives NaN results
+"""
+def find_slab_energies(layers, energy_targets, particle):
+    energies = np.asarray(energy_targets, dtype=float)
+    codes = np.full(energies.shape, "", dtype="U16")
+    exit_energies = np.empty((len(layers),) + energies.shape)
+    deposited = np.empty((len(layers),) + energies.shape)
+
+    for i, (category, item, thickness) in enumerate(layers):
+        table = get_slowing_table(category, item, particle)
+        ranges, low, high = find_slowing_range_array(table, energies)
+        codes = np.where(codes == "", error_codes(low, high), codes)
+
+        exit_energy = find_slowing_energy_array(table, ranges - thickness)
+        exit_energies[i] = exit_energy
+        deposited[i] = np.interp(energies, table["energy"], table["deposit"]) \
+            - np.interp(exit_energy, table["energy"], table["deposit"])
+        energies = exit_energy
+
+    exit_energies[:, codes != ""] = np.nan
+    deposited[:, codes != ""] = np.nan
+    entry_energies = np.r_[[np.asarray(energy_targets, dtype=float)], exit_energies[:-1]]
+    return {"exit_energy" : exit_energies,
+            "energy_lost" : entry_energies - exit_energies,
+            "deposited" : deposited,
+            "errors" : codes}
\ No newline at end of file
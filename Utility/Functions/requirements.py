@@ -8,6 +8,7 @@ requirements installed on their device.
 """
 def check_requirements():
     try:
+        import numpy
         import matplotlib
         import pandas
         import radioactivedecay
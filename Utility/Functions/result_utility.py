@@ -0,0 +1,123 @@
+##### IMPORTS #####
+import numpy as np
+
+#####################################################################################
+# ERRORS SECTION
+#####################################################################################
+
+### ERROR MESSAGES ###
+no_selection = "Error: No selected item."
+non_number = "Error: Non-number energy input."
+too_low = "Error: Energy too low."
+too_high = "Error: Energy too high."
+errors = [no_selection, non_number, too_low, too_high]
+
+### ERROR MESSAGES (OUTSIDE OF THE APP) ###
+unknown_module = "Error: Unknown module."
+unknown_item = "Error: Unknown item."
+unknown_mode = "Error: Unknown mode."
+unknown_units = "Error: Unknown units."
+unknown_interaction = "Error: Unknown interaction."
+no_data = "Error: No data for item."
+non_number_input = "Error: Non-number input."
+mismatched_weights = "Error: Weights do not match energies."
+invalid_transmission = "Error: Transmission must be between 0 and 1."
+unknown_cutoff = "Error: Unknown energy cutoff."
+stable_isotope = "Error: Isotope is stable."
+invalid_thickness = "Error: Thickness must be finite and cannot be negative."
+invalid_weights = "Error: Weights must be finite, non-negative, and not all zero."
+negative_time = "Error: Time cannot be negative."
+no_layers = "Error: No layers."
+
+# Error messages keyed by the error codes of calculation results
+error_messages = {"no_selection" : no_selection, "non_number" : non_number,
+                  "too_low" : too_low, "too_high" : too_high,
+                  "unknown_module" : unknown_module, "unknown_item" : unknown_item,
+                  "unknown_mode" : unknown_mode, "unknown_units" : unknown_units,
+                  "unknown_interaction" : unknown_interaction, "no_data" : no_data,
+                  "non_number_input" : non_number_input,
+                  "mismatched_weights" : mismatched_weights,
+                  "invalid_transmission" : invalid_transmission,
+                  "unknown_cutoff" : unknown_cutoff,
+                  "stable_isotope" : stable_isotope,
+                  "invalid_thickness" : invalid_thickness,
+                  "invalid_weights" : invalid_weights,
+                  "negative_time" : negative_time,
+                  "no_layers" : no_layers}
+
+"""
+This exception is raised when a calculation cannot be performed
+at all, such as when the item is unknown.
+It stores the error code (see error_messages) and, if applicable,
+the value that caused the error.
+"""
+class CalculationError(ValueError):
+    def __init__(self, code, value=None):
+        message = error_messages[code]
+        if value is not None:
+            message = message[:-1] + " (" + str(value) + ")."
+        super().__init__(message)
+        self.code = code
+        self.value = value
+
+#####################################################################################
+# RESULTS SECTION
+#####################################################################################
+
+"""
+This class holds the results of a calculation at one or more energies:
+   values -> array with the result at each energy, in the units of
+             the results (NaN where the energy caused an error)
+   errors -> array with the error code of each energy (e.g., too_low
+             or too_high), or "" where there was no error
+   units  -> units of the results
+Some modes also have a secondary result with its own units, such as the
+CSDA range as a length. It is None for the other modes.
+"""
+class Results:
+    def __init__(self, values, errors, units, secondary=None, secondary_units=""):
+        self.values = values
+        self.errors = errors
+        self.units = units
+        self.secondary = secondary
+        self.secondary_units = secondary_units
+
+    def valid(self):
+        return self.errors == ""
+
+"""
+This function makes the array of error codes of a calculation
+from the masks of the energies that were too low and too high.
+"""
+def error_codes(low, high):
+    return np.where(low, "too_low", np.where(high, "too_high", ""))
+
+"""
+This function returns the unit label of a result given
+its numerator and denominator units.
+"""
+def result_unit(num, den):
+    if num == "":
+        return ""
+    if num == "1":
+        return den + "\u207B\u00B9"
+    return num + "/" + den
+
+"""
+This function edits the contents of the result label.
+The label needs to be enabled at the start and disabled
+at the end in order to prevent the user from being able
+to input text.
+The previous results are cleared and then the new
+results are inserted. If the text being displayed is not
+an error, the unit is assed to the end.
+"""
+def edit_result(result, result_box, num="", den=""):
+    # Clears result label and inserts new result
+    result_box.config(state="normal")
+    result_box.delete("1.0", "end")
+    result_box.insert("end", result)
+    if not result in errors and num != "":
+        result_box.insert("end", " ")
+        result_box.insert("end", result_unit(num, den))
+    result_box.config(state="disabled")
\ No newline at end of file
@@ -1,4 +1,5 @@
 ##### IMPORTS #####
+import numpy as np
 from datetime import datetime
 
 #####################################################################################
@@ -56,52 +57,74 @@ It checks for the following errors:
 If no errors apply, we return the difference between the two dates in seconds.
 """
 def time_elapsed(start_date, end_date):
-    start_split = start_date.split("-")
-    end_split = end_date.split("-")
+    start_error = date_error(start_date)
+    end_error = date_error(end_date)
 
-    # Error check for invalid format
-    if len(start_split) != 3 or len(end_split) != 3:
-        return format_error
+    # Error check for invalid format, then invalid month, in either date
+    for error in [format_error, month_error]:
+        if error in [start_error, end_error]:
+            return error
+
+    # Error check for invalid day
+    if start_error:
+        return start_error
+    if end_error:
+        return end_error
+
+    # Format
+    fmt = "%Y-%m-%d"
+
+    # Start and end dates
+    d1 = datetime.strptime(start_date, fmt)
+    d2 = datetime.strptime(end_date, fmt)
+
+    # Difference in days
+    diff_days = (d2 - d1).days
+    return diff_days
+
+"""
+This function checks a single date in the YYYY-MM-DD format.
+It checks for the following errors:
+   Invalid number of dash separators
+   Invalid length of year/month/day
+   Non-integer date inputs
+   Negative date inputs
+   Invalid month
+   Invalid day
+The error message is returned, or "" if the date is valid.
+"""
+def date_error(date):
+    split = date.split("-")
 
     # Error check for invalid format
-    if len(start_split[0]) != 4 or len(end_split[0]) != 4 or\
-        len(start_split[1]) != 2 or len(end_split[1]) != 2 or\
-        len(start_split[2]) != 2 or len(end_split[2]) != 2:
+    if len(split) != 3:
+        return format_error
+    if len(split[0]) != 4 or len(split[1]) != 2 or len(split[2]) != 2:
         return format_error
 
-    # Error check for non-integer date/time inputs
+    # Error check for non-integer date inputs
     try:
-        for x in range(3):
-            start_split[x] = int(start_split[x])
-            end_split[x] = int(end_split[x])
+        year, month, day = [int(x) for x in split]
     except ValueError:
         return format_error
 
-    # Error check for negative date/time inputs
-    for x in range(3):
-        if start_split[x] < 0 or end_split[x] < 0:
-            return format_error
+    # Error check for negative date inputs
+    if year < 0 or month < 0 or day < 0:
+        return format_error
 
     # Error check for invalid month
-    if start_split[1] < 1 or start_split[1] > 12 or\
-       end_split[1] < 1 or end_split[1] > 12:
+    if month < 1 or month > 12:
         return month_error
 
     # Error check for invalid day
-    start_day_error = day_error(start_split[0], start_split[1], start_split[2])
-    end_day_error = day_error(end_split[0], end_split[1], end_split[2])
-    if start_day_error:
-        return start_day_error
-    if end_day_error:
-        return end_day_error
-
-    # Format
-    fmt = "%Y-%m-%d"
+    return day_error(year, month, day)
 
-    # Start and end dates
-    d1 = datetime.strptime(start_date, fmt)
-    d2 = datetime.strptime(end_date, fmt)
-
-    # Difference in days
-    diff_days = (d2 - d1).days
-    return diff_days
\ No newline at end of file
+"""
+This function calculates the days elapsed between every start date and
+every end date at once, as a 2-D array with one row per start date and
+one column per end date. The dates must already be valid (see date_error).
+"""
+def days_elapsed(start_dates, end_dates):
+    start_days = np.array(start_dates, dtype='datetime64[D]')
+    end_days = np.array(end_dates, dtype='datetime64[D]')
+    return (end_days[None, :] - start_days[:, None]).astype(float)
\ No newline at end of file
@@ -0,0 +1,139 @@
+##### IMPORTS #####
+import os
+import csv
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Resolves the job and output paths before changing the working directory
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs Health Physics Toolbox calculations from a job file "
+                    "without opening the app."
+    )
+    parser.add_argument("jobs", help="CSV, JSON, or JSON Lines file with one job per row. "
+                                     "Columns: module, item, mode, energy, units, and "
+                                     "optionally category, interactions (separated by ;), "
+                                     "and energy_unit.")
+    parser.add_argument("-o", "--output", help="CSV file to write the results to "
+                                               "(default: standard output)")
+    args = parser.parse_args()
+    args.jobs = os.path.abspath(args.jobs)
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+# Keeps matplotlib off the Tk backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Set working directory
+if getattr(sys, "frozen", False):
+    base_dir = Path(getattr(sys, "_MEIPASS", "."))
+else:
+    base_dir = Path(__file__).parent
+os.chdir(base_dir)
+
+##### IMPORTS #####
+from Core.api import calculate
+from Utility.Functions.result_utility import CalculationError, error_messages
+
+# Columns of the results
+result_columns = ["module", "item", "mode", "energy", "energy_unit",
+                  "result", "units", "secondary", "secondary_units", "error"]
+
+#####################################################################################
+# JOBS SECTION
+#####################################################################################
+
+"""
+This function reads the jobs from a CSV, JSON, or JSON Lines file.
+Jobs are yielded one at a time. CSV and JSON Lines files are read
+one row at a time so that large job files do not need to be held in
+memory, whereas a JSON file is read as a whole.
+"""
+def read_jobs(path):
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding="utf-8-sig") as file:
+        if extension == ".json":
+            yield from json.load(file)
+        elif extension == ".jsonl":
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(file):
+                yield row
+
+"""
+This function runs a single job and returns its row of results.
+The job is passed on to the calculate function of the API, which
+reads the units as numerator/denominator (e.g., cm2/g, 1/cm,
+MeV cm2/g). If no units are provided, the units from the user
+prefs are used, as in the app.
+Lists (e.g., the interactions of a JSON job) are joined with ;.
+Any error is reported in the error column, so that a job that fails
+never stops the remaining jobs.
+"""
+def run_job(job):
+    job = {key.strip().lower() : job_value(value) for key, value in job.items()
+           if key is not None and value is not None}
+    row = {column : job.get(column, "") for column in result_columns}
+
+    mode = job.get("mode", "")
+    energy = job.get("energy", "")
+    if mode == "Density" and energy == "":
+        energy = 0.0
+    interactions = [interaction.strip() for interaction
+                    in job.get("interactions", "").split(";") if interaction.strip()]
+
+    try:
+        results = calculate(job.get("module", "").replace("\\", "/"), job.get("item", ""),
+                            mode, [energy], units=job.get("units") or None,
+                            interactions=interactions or None,
+                            category=job.get("category") or None,
+                            energy_unit=job.get("energy_unit") or None)
+    except CalculationError as e:
+        row["error"] = str(e)
+        return row
+    except Exception as e:
+        row["error"] = "Error: Calculation failed (" + str(e) + ")."
+        return row
+
+    if not results.valid()[0]:
+        row["error"] = error_messages[results.errors[0]]
+        return row
+
+    row["result"] = repr(float(results.values[0]))
+    row["units"] = results.units
+    if results.secondary is not None:
+        row["secondary"] = repr(float(results.secondary[0]))
+        row["secondary_units"] = results.secondary_units
+    return row
+
+"""
+This function converts a value of a job to a stripped string.
+The items of a list are joined with ;.
+"""
+def job_value(value):
+    if isinstance(value, (list, tuple)):
+        return ";".join(str(item).strip() for item in value)
+    return str(value).strip()
+
+"""
+This function runs every job of a job file and writes the results
+as CSV, one row at a time, to the output file or standard output.
+"""
+def run_jobs(jobs_path, output_path=None):
+    file = open(output_path, 'w', newline='', encoding="utf-8-sig") if output_path \
+           else sys.stdout
+    try:
+        writer = csv.DictWriter(file, fieldnames=result_columns)
+        writer.writeheader()
+        for job in read_jobs(jobs_path):
+            writer.writerow(run_job(job))
+    finally:
+        if output_path:
+            file.close()
+
+if __name__ == "__main__":
+    run_jobs(args.jobs, args.output)
\ No newline at end of file
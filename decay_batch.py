@@ -0,0 +1,103 @@
+##### IMPORTS #####
+import os
+import csv
+import sys
+import argparse
+from pathlib import Path
+
+# Resolves the register and output paths before changing the working directory
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Decays every sealed source of a source register to one or more "
+                    "reference dates, or finds the release dates of waste containers, "
+                    "without opening the app."
+    )
+    parser.add_argument("register", help="CSV file with one source per row. Columns: source, "
+                                         "nuclide, date (YYYY-MM-DD), activity, and "
+                                         "optionally unit (default: Bq). For release "
+                                         "dates, the source column is replaced by a "
+                                         "container column, with one row per nuclide "
+                                         "of each container.")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("-d", "--date", action="append",
+                      help="Reference date (YYYY-MM-DD). Can be repeated.")
+    mode.add_argument("-t", "--threshold", help="Release threshold of the total activity "
+                                                "of each container, in the unit of -u "
+                                                "(default: Bq)")
+    parser.add_argument("-u", "--unit", help="Activity unit of the results "
+                                             "(default: unit of each source)")
+    parser.add_argument("-y", "--max-years", type=float, default=1000,
+                        help="Longest storage time of a container in years (default: 1000)")
+    parser.add_argument("-o", "--output", help="CSV file to write the results to "
+                                               "(default: standard output)")
+    args = parser.parse_args()
+    args.register = os.path.abspath(args.register)
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+# Keeps matplotlib off the Tk backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Set working directory
+if getattr(sys, "frozen", False):
+    base_dir = Path(getattr(sys, "_MEIPASS", "."))
+else:
+    base_dir = Path(__file__).parent
+os.chdir(base_dir)
+
+##### IMPORTS #####
+from Core.Decay.Calculator.register_calc import decay_register, result_columns
+from Core.Decay.Calculator.storage_calc import release_containers, release_columns
+
+#####################################################################################
+# REGISTER SECTION
+#####################################################################################
+
+"""
+This function decays every source of a register to the reference dates
+and writes the results as CSV, one row at a time, to the output file or
+standard output. The results are grouped by nuclide.
+"""
+def run_register(register_path, reference_dates, output_unit=None, output_path=None):
+    with open(register_path, 'r', encoding="utf-8-sig") as register:
+        sources = list(csv.DictReader(register))
+
+    write_rows(decay_register(sources, reference_dates, output_unit),
+               result_columns, output_path)
+
+"""
+This function finds the earliest date at which every container of a
+register falls below the release threshold, and writes the results as
+CSV, one row at a time, to the output file or standard output.
+"""
+def run_release(register_path, threshold, unit=None, max_years=1000, output_path=None):
+    with open(register_path, 'r', encoding="utf-8-sig") as register:
+        containers = list(csv.DictReader(register))
+
+    write_rows(release_containers(containers, threshold, unit or "Bq", max_years),
+               release_columns, output_path)
+
+"""
+This function writes rows of results as CSV to the output file or
+standard output. The rows are written as they are produced.
+"""
+def write_rows(rows, columns, output_path=None):
+    file = open(output_path, 'w', newline='', encoding="utf-8-sig") if output_path \
+           else sys.stdout
+    try:
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+    finally:
+        if output_path:
+            file.close()
+
+if __name__ == "__main__":
+    try:
+        if args.threshold is not None:
+            run_release(args.register, args.threshold, args.unit, args.max_years, args.output)
+        else:
+            run_register(args.register, args.date, args.unit, args.output)
+    except ValueError as e:
+        sys.exit(str(e))
\ No newline at end of file